@@ -1,8 +1,111 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
 from config.config_processor import ConfigProcessor
 from database.db_connector import DBConnector
+from importModule.fileProcess.jobs import JobRegistry
+
+logger = logging.getLogger(__name__)
+
+# Config path is relative to where the app runs (project root)
+CONFIG_PATH = 'config.ini'
+
+_lock = threading.Lock()
+_config: Optional[ConfigProcessor] = None
+_connector: Optional[DBConnector] = None
+# Requests and background jobs currently holding each connector. A connector replaced
+# by a config reload is closed once its count drops to zero, not while it is in use.
+_users: Dict[DBConnector, int] = {}
+# Import jobs started through the API; lives for the whole app process
+_job_registry = JobRegistry()
+
+
+def init_dependencies(config_path: str = CONFIG_PATH):
+    """Build the shared config and connector once; called from the app lifespan"""
+    global _config, _connector
+    with _lock:
+        _config = ConfigProcessor(config_path)
+        _connector = DBConnector(_config)
+
+
+def close_dependencies():
+    """Close pooled connections on shutdown"""
+    global _config, _connector
+    with _lock:
+        if _connector is not None and _connector not in _users:
+            _connector.close()
+        # Connectors still held are closed by their last release
+        _config = None
+        _connector = None
+
+
+def _refresh():
+    """Reload config when the file changed and rebuild the connector around it. Caller holds the lock.
+
+    The new config is built and validated as a separate object and then swapped in, so
+    callers still holding the previous one never see it change underneath them.
+    """
+    global _config, _connector
+    if _config is None:
+        _config = ConfigProcessor(CONFIG_PATH)
+        _connector = DBConnector(_config)
+        return
+    if not _config.is_modified():
+        return
+    try:
+        reloaded = ConfigProcessor(_config.config_path)
+    except Exception as e:
+        # The previous config keeps its old mtime, so the next call checks the file again
+        logger.error(f"Config reload failed, keeping previous configuration: {e}")
+        return
+    logger.info(f"Reloaded {reloaded.config_path}")
+    old_connector = _connector
+    _config, _connector = reloaded, DBConnector(reloaded)
+    if old_connector is not None and old_connector not in _users:
+        old_connector.close()
+
+
+def get_config() -> ConfigProcessor:
+    with _lock:
+        _refresh()
+        return _config
+
+
+def acquire_db_connector() -> DBConnector:
+    """Current connector, held open across config reloads until release_db_connector()"""
+    with _lock:
+        _refresh()
+        _users[_connector] = _users.get(_connector, 0) + 1
+        return _connector
+
+
+def release_db_connector(connector: DBConnector):
+    with _lock:
+        remaining = _users.pop(connector) - 1
+        if remaining:
+            _users[connector] = remaining
+            return
+        retired = connector is not _connector
+    if retired:
+        connector.close()
+
+
+@contextmanager
+def use_db_connector() -> Iterator[DBConnector]:
+    connector = acquire_db_connector()
+    try:
+        yield connector
+    finally:
+        release_db_connector(connector)
+
+
+def get_db_connector() -> Iterator[DBConnector]:
+    """FastAPI dependency: the connector, held until the request is done"""
+    with use_db_connector() as connector:
+        yield connector
+
 
-def get_db_connector():
-    # Assuming config.ini is in the root directory relative to where the app runs
-    # If main.py sets cwd correctly, this works.
-    config = ConfigProcessor('config.ini')
-    return DBConnector(config)
+def get_job_registry() -> JobRegistry:
+    return _job_registry
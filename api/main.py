@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
@@ -7,14 +8,20 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api.routes import users, products, orders, etl
-from config.config_processor import ConfigProcessor
+from api.dependencies import init_dependencies, close_dependencies
+from api.pagination import NEXT_AFTER_ID_HEADER
+from importModule.fileProcess.log_setup import start_logging, stop_logging
 
-app = FastAPI(title="OrderSystem API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build config and the pooled connector once; requests share them
+    start_logging()
+    init_dependencies()
+    yield
+    close_dependencies()
+    stop_logging()
 
-@app.on_event("startup")
-async def startup_event():
-    # Ensure config exists on startup
-    ConfigProcessor('config.ini')
+app = FastAPI(title="OrderSystem API", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -23,6 +30,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the browser read the keyset cursor of paginated list endpoints
+    expose_headers=[NEXT_AFTER_ID_HEADER],
 )
 
 # Include Routers
@@ -0,0 +1,11 @@
+from typing import List
+
+from fastapi import Response
+
+NEXT_AFTER_ID_HEADER = "X-Next-After-Id"
+
+
+def set_next_page(response: Response, page: List, limit: int):
+    """A full page may have more rows after it; point the client at the next one"""
+    if len(page) == limit:
+        response.headers[NEXT_AFTER_ID_HEADER] = str(page[-1].id)
@@ -1,35 +1,127 @@
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
 import logging
 import os
+from api.dependencies import acquire_db_connector, get_config, get_job_registry, release_db_connector
+from common.exceptions import ConflictError, ResourceNotFoundError
 from importModule.fileProcess.CSVETLProcessor import CSVETLProcessor
+from importModule.fileProcess.log_reader import LOG_FILE, read_from, tail_lines
+from importModule.fileProcess.metrics import read_run_summaries
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-def get_processor():
-    # Helper to create config processor
-    # Ensure config.ini is accessible
-    return CSVETLProcessor("config.ini")
+LOG_STREAM_POLL_SECONDS = 1.0
+LOG_STREAM_MAX_BYTES = 256 * 1024
+LOG_STREAM_KEEPALIVE_POLLS = 15
+
+def get_processor(connector):
+    # Reuse the app-wide config and connector instead of re-reading config.ini
+    return CSVETLProcessor(config_processor=get_config(), db_connector=connector)
+
+def run_holding_connector(connector, task, *args):
+    """Background task body; the connector is not closed by a config reload until the task ends"""
+    try:
+        task(*args)
+    finally:
+        release_db_connector(connector)
 
 @router.post("/import")
 def run_import(background_tasks: BackgroundTasks):
-    processor = get_processor()
-    background_tasks.add_task(processor.import_csv_files)
-    return {"message": "Import process started in background"}
+    connector = acquire_db_connector()
+    processor = get_processor(connector)
+    registry = get_job_registry()
+    try:
+        job = processor.start_import_job(registry)
+    except ConflictError as e:
+        release_db_connector(connector)
+        # A second import of the same folder would compete for the same files and DB
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception:
+        release_db_connector(connector)
+        raise
+    background_tasks.add_task(run_holding_connector, connector, processor.run_import_job, registry, job.id)
+    return {"message": "Import process started in background", "job_id": job.id}
+
+@router.get("/jobs")
+def list_jobs():
+    registry = get_job_registry()
+    checkpoint_folder = get_config().get_import_config().get('checkpoint_folder')
+    return {"jobs": [registry.status(job.id, checkpoint_folder) for job in registry.list()]}
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    try:
+        return get_job_registry().status(job_id, get_config().get_import_config().get('checkpoint_folder'))
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Job not found")
 
 @router.post("/export")
 def run_export(background_tasks: BackgroundTasks):
-    processor = get_processor()
+    connector = acquire_db_connector()
+    processor = get_processor(connector)
     # Export all tables for now
-    background_tasks.add_task(processor.export_tables)
+    background_tasks.add_task(run_holding_connector, connector, processor.export_tables)
     return {"message": "Export process started in background"}
 
 @router.get("/logs")
-def get_logs():
-    log_file = "etl_process.log"
-    if os.path.exists(log_file):
-        with open(log_file, "r") as f:
-            # Read last 100 lines maybe? Or full content.
-            # Reading full content for now, assuming not huge.
-            return {"logs": f.read()}
-    return {"logs": "Log file not found"}
+def get_logs(lines: int = Query(200, ge=0, le=5000), cursor: Optional[int] = Query(None, ge=0),
+             file_id: Optional[str] = None, max_bytes: int = Query(256 * 1024, ge=1, le=4 * 1024 * 1024)):
+    """Last `lines` lines of the ETL log, or the lines written after `cursor`.
+
+    Pass back the returned cursor and file_id to poll for new lines; rotation is
+    detected from the file_id and reported as rotated=true.
+    """
+    if not os.path.exists(LOG_FILE):
+        return {"logs": "Log file not found", "cursor": 0, "file_id": None, "rotated": False}
+    if cursor is None:
+        return tail_lines(LOG_FILE, lines)
+    return read_from(LOG_FILE, cursor, max_bytes, file_id)
+
+@router.get("/logs/stream")
+async def stream_logs(request: Request, lines: int = Query(50, ge=0, le=5000)):
+    """Server-sent events: the last `lines` lines, then each new line as it is written.
+
+    Event ids carry the read position, so a reconnecting EventSource resumes from
+    Last-Event-ID without gaps or repeats.
+    """
+    last_event_id = request.headers.get('last-event-id')
+
+    async def events():
+        position = None
+        idle_polls = 0
+        if last_event_id and ':' in last_event_id:
+            fid, _, offset = last_event_id.rpartition(':')
+            if offset.isdigit():
+                position = (fid, int(offset))
+        while not await request.is_disconnected():
+            if os.path.exists(LOG_FILE):
+                if position is None:
+                    chunk = tail_lines(LOG_FILE, lines)
+                else:
+                    chunk = read_from(LOG_FILE, position[1], LOG_STREAM_MAX_BYTES, position[0])
+                position = (chunk['file_id'], chunk['cursor'])
+                if chunk['logs']:
+                    data = ''.join(f"data: {line}\n" for line in chunk['logs'].splitlines())
+                    yield f"id: {position[0]}:{position[1]}\n{data}\n"
+                    continue
+            idle_polls += 1
+            if idle_polls % LOG_STREAM_KEEPALIVE_POLLS == 0:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+            await asyncio.sleep(LOG_STREAM_POLL_SECONDS)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.get("/metrics")
+def get_metrics(limit: int = Query(1, ge=1, le=50), include_chunks: bool = False):
+    """Most recent import run summaries: per-stage timings, counters and insert latency"""
+    runs = read_run_summaries(get_config().get_import_config().get('metrics_folder'), limit)
+    if not include_chunks:
+        for run in runs:
+            for file_metrics in run.get('per_file', []):
+                file_metrics.pop('chunks', None)
+    return {"runs": runs}
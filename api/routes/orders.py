@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 from api.dependencies import get_db_connector
+from api.pagination import set_next_page
+from dao.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from database.db_connector import DBConnector
 from dao.order_dao import OrderDAO
 from models.order import OrderDTO
+from service.order_service import OrderService
 
 router = APIRouter()
 
@@ -17,10 +20,54 @@ class OrderResponse(BaseModel):
     status: str
     paid: bool
 
+class OrderDetailsUser(BaseModel):
+    id: Optional[int]
+    name: str
+    email: str
+
+class OrderDetailsItem(BaseModel):
+    product_id: int
+    product_name: str
+    quantity: int
+    price: float
+    subtotal: float
+
+class OrderDetailsResponse(BaseModel):
+    order_id: int
+    order_date: Optional[datetime]
+    status: str
+    paid: bool
+    user: OrderDetailsUser
+    items: List[OrderDetailsItem]
+
 @router.get("/", response_model=List[OrderResponse])
-def get_orders(db: DBConnector = Depends(get_db_connector)):
+def get_orders(response: Response,
+               limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+               after_id: Optional[int] = None,
+               status: Optional[str] = None,
+               paid: Optional[bool] = None,
+               date_from: Optional[datetime] = None,
+               date_to: Optional[datetime] = None,
+               db: DBConnector = Depends(get_db_connector)):
     dao = OrderDAO(db)
-    return dao.get_all()
+    orders = dao.get_page(limit, after_id, status=status, paid=paid, date_from=date_from, date_to=date_to)
+    set_next_page(response, orders, limit)
+    return orders
+
+# Declared before /{order_id} so "details" is not parsed as an order id
+@router.get("/details", response_model=List[OrderDetailsResponse])
+def get_orders_details(ids: List[int] = Query(..., max_length=MAX_PAGE_SIZE),
+                       db: DBConnector = Depends(get_db_connector)):
+    """Details for many orders in one query, in the order requested; unknown ids are skipped"""
+    details = OrderService(db).get_orders_details(ids)
+    return [details[order_id] for order_id in dict.fromkeys(ids) if order_id in details]
+
+@router.get("/{order_id}/details", response_model=OrderDetailsResponse)
+def get_order_details(order_id: int, db: DBConnector = Depends(get_db_connector)):
+    details = OrderService(db).get_order_details(order_id)
+    if not details:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return details
 
 @router.get("/{order_id}", response_model=OrderResponse)
 def get_order(order_id: int, db: DBConnector = Depends(get_db_connector)):
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 
 from api.dependencies import get_db_connector
+from api.pagination import set_next_page
+from dao.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from database.db_connector import DBConnector
 from dao.product_dao import ProductDAO
 from dao.category_dao import CategoryDAO
@@ -44,9 +46,16 @@ def create_product(product: ProductCreate, db: DBConnector = Depends(get_db_conn
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/", response_model=List[ProductResponse])
-def get_products(db: DBConnector = Depends(get_db_connector)):
+def get_products(response: Response,
+                 limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                 after_id: Optional[int] = None,
+                 category_id: Optional[int] = None,
+                 active: Optional[bool] = None,
+                 db: DBConnector = Depends(get_db_connector)):
     dao = ProductDAO(db)
-    return dao.get_all()
+    products = dao.get_page(limit, after_id, category_id=category_id, active=active)
+    set_next_page(response, products, limit)
+    return products
 
 @router.get("/{product_id}", response_model=ProductResponse)
 def get_product(product_id: int, db: DBConnector = Depends(get_db_connector)):
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 from api.dependencies import get_db_connector
+from api.pagination import set_next_page
+from dao.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from database.db_connector import DBConnector
 from dao.user_dao import UserDAO
 from models.user import UserDTO
@@ -21,9 +23,14 @@ class UserResponse(BaseModel):
     registered_at: Optional[datetime]
 
 @router.get("/", response_model=List[UserResponse])
-def get_users(db: DBConnector = Depends(get_db_connector)):
+def get_users(response: Response,
+              limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+              after_id: Optional[int] = None,
+              db: DBConnector = Depends(get_db_connector)):
     dao = UserDAO(db)
-    return dao.get_all()
+    users = dao.get_page(limit, after_id)
+    set_next_page(response, users, limit)
+    return users
 
 @router.post("/", response_model=int)
 def create_user(user: UserCreate, db: DBConnector = Depends(get_db_connector)):
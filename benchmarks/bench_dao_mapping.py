@@ -0,0 +1,92 @@
+"""Benchmark list-endpoint DTO mapping: DataFrame + iterrows against RowMapper on cursor tuples.
+
+Loads a products table into SQLite and times ProductDAO.get_all both ways, plus the
+mapping step alone on rows that were already fetched:
+
+    python benchmarks/bench_dao_mapping.py --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from dao.product_dao import PRODUCT_MAPPER, ProductDAO
+from tests.sqlite_connector import SQLiteConnector
+from models.product import ProductDTO
+
+QUERY = "SELECT id, name, price, category_id, active FROM products"
+
+
+def legacy_map(result: pd.DataFrame):
+    """ProductDAO.get_all as it was before RowMapper"""
+    products = []
+    if not result.empty:
+        for _, row in result.iterrows():
+            products.append(ProductDTO(
+                id=int(row['id']),
+                name=row['name'],
+                price=float(row['price']),
+                category_id=int(row['category_id']),
+                active=bool(row['active'])
+            ))
+    return products
+
+
+def best(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DAO row-to-DTO mapping')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant; the fastest is reported')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        connector = SQLiteConnector(os.path.join(tmp, 'bench.db'))
+        connector.execute_query("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, "
+                                "category_id INTEGER, active INTEGER)")
+        conn = connector.get_connection()
+        conn.cursor().executemany(
+            "INSERT INTO products VALUES (?, ?, ?, ?, ?)",
+            [(i, f"product_{i}", round(rng.uniform(1, 500), 2), rng.randint(1, 20), rng.randint(0, 1))
+             for i in range(1, args.rows + 1)])
+        conn.commit()
+        conn.close()
+
+        dao = ProductDAO(connector)
+        assert legacy_map(connector.execute_query(QUERY)) == dao.get_all()
+
+        columns, rows = connector.fetch_rows(QUERY)
+        frame = pd.DataFrame.from_records(rows, columns=columns)
+        results = [
+            ('get_all, DataFrame + iterrows', best(lambda: legacy_map(connector.execute_query(QUERY)), args.repeat)),
+            ('get_all, RowMapper', best(dao.get_all, args.repeat)),
+            ('mapping only, iterrows', best(lambda: legacy_map(frame), args.repeat)),
+            ('mapping only, RowMapper', best(lambda: PRODUCT_MAPPER.map(columns, rows), args.repeat)),
+        ]
+        connector.close()
+
+    print(f"{args.rows} rows, best of {args.repeat}")
+    for name, seconds in results:
+        print(f"{name:<32} {seconds * 1000:>10.1f} ms {args.rows / seconds:>14,.0f} rows/s")
+    print(f"get_all speedup: {results[0][1] / results[1][1]:.1f}x, "
+          f"mapping speedup: {results[2][1] / results[3][1]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark schema inference against the previous per-format implementation on wide files.
+
+    python benchmarks/bench_infer_types.py --columns 300 --rows 100
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from importModule.fileProcess.file_processor import FileProcessor
+
+
+def legacy_infer_data_types(file_path: str, delimiter: str, scan_rows: int, varchar_length: int):
+    """FileProcessor.infer_data_types as it was before single-pass inference"""
+    df_sample = pd.read_csv(file_path, delimiter=delimiter, nrows=scan_rows, encoding='utf-8',
+                            quoting=csv.QUOTE_MINIMAL, dtype=str)
+    schema = {}
+    for column in df_sample.columns:
+        col_data = df_sample[column].dropna()
+        if col_data.empty:
+            schema[column] = f'VARCHAR({varchar_length})'
+            continue
+        col_data = col_data.astype(str).str.strip()
+        col_data = col_data[col_data != '']
+        if col_data.empty:
+            schema[column] = f'VARCHAR({varchar_length})'
+            continue
+        numeric_series = pd.to_numeric(col_data, errors='coerce')
+        if not numeric_series.isna().any():
+            schema[column] = 'INT' if all(numeric_series.apply(lambda x: float(x).is_integer())) else 'FLOAT'
+            continue
+        date_success = False
+        for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']:
+            try:
+                pd.to_datetime(col_data, format=date_format, errors='raise')
+                schema[column] = 'DATETIME'
+                date_success = True
+                break
+            except (ValueError, TypeError):
+                continue
+        if date_success:
+            continue
+        schema[column] = f'VARCHAR({min(int(col_data.str.len().max()) + 10, varchar_length)})'
+    return schema
+
+
+GENERATORS = [
+    lambda r: str(r.randint(-10000, 10000)),
+    lambda r: f"{r.uniform(-1000, 1000):.2f}",
+    lambda r: f"2024-{r.randint(1, 12):02d}-{r.randint(1, 28):02d}",
+    lambda r: f"2024-01-{r.randint(1, 28):02d} {r.randint(0, 23):02d}:{r.randint(0, 59):02d}:00",
+    lambda r: r.choice(['alpha', 'beta', 'gamma', 'delta']) + str(r.randint(0, 99)),
+]
+
+
+def write_wide_csv(path: str, rows: int, columns: int, seed: int = 42):
+    rnd = random.Random(seed)
+    kinds = [GENERATORS[c % len(GENERATORS)] for c in range(columns)]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([f"col{c}" for c in range(columns)])
+        for _ in range(rows):
+            writer.writerow([kind(rnd) for kind in kinds])
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark schema inference')
+    parser.add_argument('--rows', type=int, default=100, help='Sampled rows (scan_rows)')
+    parser.add_argument('--columns', type=int, nargs='+', default=[100, 300, 600])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    processor = FileProcessor(None, {'scan_rows': args.rows, 'varchar_length': 255})
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'columns':>8} {'legacy':>10} {'current':>10} {'chunk only':>11} {'speedup':>8}")
+        for columns in args.columns:
+            path = os.path.join(tmp, f"wide_{columns}.csv")
+            write_wide_csv(path, args.rows, columns)
+            sample = pd.read_csv(path, dtype=str)
+
+            legacy = best_of(args.repeat, lambda: legacy_infer_data_types(path, ',', args.rows, 255))
+            current = best_of(args.repeat, lambda: processor.infer_data_types(path, ','))
+            # process_csv_file infers from the first chunk it already read
+            chunk_only = best_of(args.repeat, lambda: processor.infer_schema(sample))
+            print(f"{columns:>8} {legacy:>9.3f}s {current:>9.3f}s {chunk_only:>10.3f}s {legacy / chunk_only:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
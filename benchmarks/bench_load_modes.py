@@ -0,0 +1,70 @@
+"""Compare import throughput of the executemany and bulk (staging table) load modes.
+
+Runs against a temporary SQLite database by default; pass --config to measure
+against the SQL Server configured in config.ini instead.
+
+    python benchmarks/bench_load_modes.py --rows 200000 --batch-size 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from importModule.fileProcess.loaders import create_loader
+
+
+def make_rows(rows: int, columns: int):
+    return [[i] + [f"value_{i}_{c}" for c in range(1, columns)] for i in range(rows)]
+
+
+def run_mode(connector, load_mode: str, rows, columns, batch_size: int) -> float:
+    table_name = f"BENCH_{load_mode}"
+    schema = {'id': 'INT', **{f"col{c}": 'VARCHAR(50)' for c in range(1, len(columns))}}
+    if connector.table_exists(table_name):
+        connector.drop_table(table_name)
+    connector.create_table_from_schema(table_name, schema)
+
+    start = time.perf_counter()
+    with create_loader(load_mode, connector, table_name, columns, commit_every=1) as loader:
+        for offset in range(0, len(rows), batch_size):
+            loader.load(rows[offset:offset + batch_size])
+    elapsed = time.perf_counter() - start
+
+    connector.drop_table(table_name)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark import load modes')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--config', help='Benchmark against SQL Server using this config.ini')
+    args = parser.parse_args()
+
+    if args.config:
+        from config.config_processor import ConfigProcessor
+        from database.db_connector import DBConnector
+        connector = DBConnector(ConfigProcessor(args.config))
+        target = 'SQL Server'
+    else:
+        from tests.sqlite_connector import SQLiteConnector
+        tmp = tempfile.TemporaryDirectory()
+        connector = SQLiteConnector(os.path.join(tmp.name, 'bench.db'))
+        target = 'SQLite stand-in'
+
+    rows = make_rows(args.rows, args.columns)
+    columns = ['id'] + [f"col{c}" for c in range(1, args.columns)]
+
+    print(f"{args.rows} rows x {args.columns} columns, batch size {args.batch_size}, target: {target}")
+    for load_mode in ('executemany', 'bulk'):
+        elapsed = run_mode(connector, load_mode, rows, columns, args.batch_size)
+        print(f"  {load_mode:<12} {elapsed:8.2f}s  {args.rows / elapsed:12.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Load test for OrderService.create_order_process on the SQLite stand-in.
+
+Compares the previous flow (autocommitted query per step, one INSERT per order line)
+with the transactional one (one connection, one commit, multi-row item INSERTs).
+Each statement is delayed by --rtt-ms to stand in for the network round trip to
+SQL Server, and --clients threads create orders concurrently:
+
+    python benchmarks/bench_order_create.py --orders 200 --lines 50 --clients 8 --rtt-ms 1
+"""
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.sqlite_connector import SQLiteConnector, _SQLiteConnection
+from models.order import OrderDTO
+from models.product import ProductDTO
+from models.user import UserDTO
+from service.order_service import OrderService
+
+RETURNING_USERS = 50
+
+
+class LatencyConnector(SQLiteConnector):
+    """SQLite connector that sleeps one round trip per statement and counts statements"""
+
+    def __init__(self, database: str, rtt: float):
+        super().__init__(database)
+        self.rtt = rtt
+        self.round_trips = 0
+        self._count_lock = threading.Lock()
+
+    def _connect(self) -> _SQLiteConnection:
+        # Writers queue on SQLite's database lock instead of failing
+        return sqlite3.connect(self.database, factory=_SQLiteConnection, check_same_thread=False, timeout=120)
+
+    def _read_result(self, cursor, query, params=None):
+        with self._count_lock:
+            self.round_trips += 1
+        time.sleep(self.rtt)
+        return super()._read_result(cursor, query, params)
+
+
+def legacy_create_order(service: OrderService, user: UserDTO, status: str, items, quantities) -> int:
+    """create_order_process as it was before transactions and batched item inserts"""
+    existing_user = service.user_dao.get_by_email(user.email)
+    user_id = existing_user.id if existing_user else service.user_dao.create(user)
+    order_id = service.order_dao.create(OrderDTO(id=0, user_id=user_id, order_date=datetime.now(),
+                                                 status=status, paid=False))
+    for item, qty in zip(items, quantities):
+        service.item_dao.create(item, order_id, qty)
+    return order_id
+
+
+def setup_database(path: str):
+    connector = SQLiteConnector(path)
+    connector.execute_query("PRAGMA journal_mode=WAL")
+    for ddl in [
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE, registered_at TEXT)",
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INT, order_date TEXT, status TEXT, paid INT)",
+        "CREATE TABLE order_items (order_id INT, product_id INT, quantity INT, price_at_order REAL, "
+        "PRIMARY KEY (order_id, product_id))",
+    ]:
+        connector.execute_query(ddl)
+    for i in range(RETURNING_USERS):
+        connector.execute_query("INSERT INTO users (name, email, registered_at) VALUES (?, ?, ?)",
+                                (f"user_{i}", f"user_{i}@example.com", datetime.now().isoformat()))
+    connector.close()
+
+
+def run(name: str, create, args, tmp: str):
+    path = os.path.join(tmp, f"{name}.db")
+    setup_database(path)
+    connector = LatencyConnector(path, args.rtt_ms / 1000)
+    service = OrderService(connector)
+    products = [ProductDTO(i, f"product_{i}", 1.0 + i, 1, True) for i in range(1, args.lines + 1)]
+    quantities = [1 + i % 5 for i in range(args.lines)]
+
+    def one(i: int) -> float:
+        # Alternate returning customers and new ones
+        email = f"user_{i % RETURNING_USERS}@example.com" if i % 2 else f"new_{i}@example.com"
+        user = UserDTO(0, f"user_{i}", email, datetime.now())
+        start = time.perf_counter()
+        create(service, user, "new", products, quantities)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        latencies = list(pool.map(one, range(args.orders)))
+    elapsed = time.perf_counter() - start
+    lines = connector.fetch_rows("SELECT COUNT(*) FROM order_items")[1][0][0]
+    assert lines == args.orders * args.lines, (name, lines)
+    latencies.sort()
+    return {
+        'orders_per_sec': args.orders / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'round_trips': (connector.round_trips - 1) / args.orders,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test order creation')
+    parser.add_argument('--orders', type=int, default=200)
+    parser.add_argument('--lines', type=int, default=50, help='Order lines per order')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent threads creating orders')
+    parser.add_argument('--rtt-ms', type=float, default=1.0, help='Simulated round trip per statement')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            ('per-line autocommit', run('legacy', legacy_create_order, args, tmp)),
+            ('transaction + batch', run('batched', lambda service, *a: service.create_order_process(*a), args, tmp)),
+        ]
+
+    print(f"{args.orders} orders x {args.lines} lines, {args.clients} clients, {args.rtt_ms} ms per round trip")
+    print(f"{'variant':<22} {'orders/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'trips/order':>12}")
+    for name, r in results:
+        print(f"{name:<22} {r['orders_per_sec']:>10.1f} {r['p50_ms']:>10.1f} {r['p95_ms']:>10.1f} {r['round_trips']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
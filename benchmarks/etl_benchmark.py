@@ -0,0 +1,224 @@
+"""Repeatable import throughput benchmark for the CSV ETL pipeline.
+
+Generates a synthetic CSV, then times each stage on a SQLite stand-in for the
+connector: schema inference, chunked read, validation, _insert_batch and the full
+process_csv_file path. Results (rows/sec per stage, peak RSS, git commit) are saved
+as JSON so runs from different commits can be compared:
+
+    python benchmarks/etl_benchmark.py --rows 200000 --columns 12 --dirty-ratio 0.02
+    python benchmarks/etl_benchmark.py --compare benchmarks/results/etl_<old>.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import pandas as pd
+
+from tests.sqlite_connector import SQLiteConnector
+from importModule.fileProcess.file_processor import FileProcessor
+
+# Column kinds the generator can produce, with a clean and a dirty value factory each
+COLUMN_KINDS = {
+    'int': (lambda r, i: str(r.randint(-100000, 100000)), lambda r, i: f"{i}x"),
+    'float': (lambda r, i: f"{r.uniform(-1e6, 1e6):.6g}", lambda r, i: "1.2.3"),
+    'decimal': (lambda r, i: f"{r.uniform(0, 10000):.2f}", lambda r, i: "12,50"),
+    'bit': (lambda r, i: r.choice(['0', '1', 'true', 'false']), lambda r, i: "maybe"),
+    'date': (lambda r, i: (datetime(2020, 1, 1) + timedelta(days=r.randint(0, 2000))).strftime('%Y-%m-%d'),
+             lambda r, i: "2024-13-45"),
+    'text': (lambda r, i: f"item_{r.randint(0, 10 ** 6)}", None),
+}
+
+
+def parse_type_mix(spec: str):
+    """'int:3,text:2,date' -> weighted list of kinds"""
+    kinds = []
+    for part in spec.split(','):
+        name, _, weight = part.strip().partition(':')
+        if name not in COLUMN_KINDS:
+            raise SystemExit(f"Unknown column kind {name!r}; choose from {', '.join(COLUMN_KINDS)}")
+        kinds.extend([name] * int(weight or 1))
+    return kinds
+
+
+def write_csv(path: Path, rows: int, columns: int, dirty_ratio: float, type_mix, seed: int):
+    """Write the synthetic file; returns the column kinds and the number of dirty rows"""
+    rng = random.Random(seed)
+    kinds = [type_mix[c % len(type_mix)] for c in range(columns)]
+    dirtyable = [c for c, kind in enumerate(kinds) if COLUMN_KINDS[kind][1] is not None]
+    dirty_rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([f"{kind}_{c}" for c, kind in enumerate(kinds)])
+        # Keep the first rows clean so inference sees the intended types
+        for i in range(rows):
+            row = [COLUMN_KINDS[kind][0](rng, i) for kind in kinds]
+            if i >= 1000 and dirtyable and rng.random() < dirty_ratio:
+                c = rng.choice(dirtyable)
+                row[c] = COLUMN_KINDS[kinds[c]][1](rng, i)
+                dirty_rows += 1
+            writer.writerow(row)
+    return kinds, dirty_rows
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}+dirty" if dirty else commit
+
+
+def stage(seconds: float, rows: int):
+    return {'seconds': round(seconds, 4), 'rows': rows, 'rows_per_sec': round(rows / seconds) if seconds > 0 else None}
+
+
+def run_once(csv_path: Path, db_path: str, rows: int, batch_size: int, scan_rows: int):
+    connector = SQLiteConnector(db_path)
+    config = {
+        'rejects_folder': str(Path(csv_path).parent / 'rejects'), 'scan_rows': scan_rows, 'batch_size': batch_size,
+        'varchar_length': 255, 'fast_executemany': True, 'commit_every': 1, 'load_mode': 'executemany',
+    }
+    processor = FileProcessor(connector, config)
+    stages = {}
+
+    start = time.perf_counter()
+    schema = processor.infer_data_types(csv_path)
+    stages['infer'] = stage(time.perf_counter() - start, min(scan_rows, rows))
+
+    read_seconds = validate_seconds = 0.0
+    batches = []
+    reader = pd.read_csv(csv_path, chunksize=batch_size, dtype=str, encoding='utf-8')
+    while True:
+        start = time.perf_counter()
+        chunk = next(reader, None)
+        read_seconds += time.perf_counter() - start
+        if chunk is None:
+            break
+        start = time.perf_counter()
+        valid, _ = processor.split_valid_rows(chunk, schema)
+        batches.append(valid.to_numpy(dtype=object).tolist())
+        validate_seconds += time.perf_counter() - start
+    stages['read'] = stage(read_seconds, rows)
+    stages['validate'] = stage(validate_seconds, rows)
+
+    table_name = 'BENCH_insert'
+    connector.drop_table(table_name)
+    connector.create_table_from_schema(table_name, schema)
+    start = time.perf_counter()
+    inserted = sum(processor._insert_batch(table_name, list(schema), batch, True) for batch in batches)
+    stages['insert'] = stage(time.perf_counter() - start, inserted)
+    connector.drop_table(table_name)
+    del batches
+
+    connector.drop_table(f"EXPORT_{Path(csv_path).stem}")
+    start = time.perf_counter()
+    success, errors = processor.process_csv_file(Path(csv_path))
+    stages['end_to_end'] = stage(time.perf_counter() - start, rows)
+    connector.close()
+    return stages, success, errors
+
+
+def best_of(runs):
+    """Per stage, keep the fastest run"""
+    return {name: min((run[name] for run in runs), key=lambda s: s['seconds']) for name in runs[0]}
+
+
+def print_report(result, baseline=None):
+    print(f"{'stage':<12} {'seconds':>9} {'rows/sec':>12}" + (f" {'vs baseline':>12}" if baseline else ''))
+    for name, timing in result['stages'].items():
+        line = f"{name:<12} {timing['seconds']:>9.3f} {timing['rows_per_sec'] or 0:>12,}"
+        if baseline and name in baseline['stages']:
+            ratio = baseline['stages'][name]['seconds'] / timing['seconds'] if timing['seconds'] else float('inf')
+            line += f" {ratio:>11.2f}x"
+        print(line)
+    print(f"peak RSS: {result['peak_rss_mb']:.1f} MB" if result['peak_rss_mb'] is not None else "peak RSS: n/a")
+    if baseline:
+        print(f"baseline: {baseline.get('commit')} ({baseline.get('timestamp')})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CSV import pipeline stage by stage')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--dirty-ratio', type=float, default=0.01, help='Fraction of rows with one bad value')
+    parser.add_argument('--types', default='int:2,float,decimal,bit,date,text:3',
+                        help=f"Weighted column kinds ({', '.join(COLUMN_KINDS)})")
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--scan-rows', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per stage; the fastest is reported')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--memory', action='store_true', help='Use an in-memory SQLite database')
+    parser.add_argument('--output', help='Result JSON path (default: benchmarks/results/etl_<commit>_<time>.json)')
+    parser.add_argument('--compare', help='Previous result JSON to compare against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'bench.csv'
+        kinds, dirty_rows = write_csv(csv_path, args.rows, args.columns, args.dirty_ratio,
+                                      parse_type_mix(args.types), args.seed)
+        print(f"Generated {args.rows} rows x {args.columns} columns ({dirty_rows} dirty), "
+              f"{csv_path.stat().st_size / 1024 / 1024:.1f} MB")
+
+        runs = []
+        for i in range(args.repeat):
+            db_path = ':memory:' if args.memory else str(Path(tmp) / f'bench_{i}.db')
+            stages, success, errors = run_once(csv_path, db_path, args.rows, args.batch_size, args.scan_rows)
+            runs.append(stages)
+
+    commit = git_commit()
+    result = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'params': {
+            'rows': args.rows, 'columns': args.columns, 'dirty_ratio': args.dirty_ratio, 'types': kinds,
+            'batch_size': args.batch_size, 'scan_rows': args.scan_rows, 'repeat': args.repeat, 'seed': args.seed,
+            'database': 'sqlite-memory' if args.memory else 'sqlite-file',
+        },
+        'imported_rows': success,
+        'rejected_rows': errors,
+        'stages': best_of(runs),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+    output = Path(args.output) if args.output else Path(PROJECT_ROOT) / 'benchmarks' / 'results' / \
+        f"etl_{(commit or 'nogit')[:12]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding='utf-8')
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+    print_report(result, baseline)
+    print(f"Saved {output}")
+
+
+if __name__ == '__main__':
+    main()
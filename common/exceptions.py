@@ -17,3 +17,7 @@ class ValidationError(AppException):
 class ResourceNotFoundError(AppException):
     """Raised when a requested resource is not found"""
     pass
+
+class ConflictError(AppException):
+    """Raised when an operation conflicts with one already in progress"""
+    pass
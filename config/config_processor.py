@@ -9,6 +9,7 @@ class ConfigProcessor:
     def __init__(self, config_path: str = "config.ini"):
         self.config = configparser.ConfigParser()
         self.config_path = config_path
+        self.mtime = None
         self.load_config()
         self.validate_config()
 
@@ -16,6 +17,28 @@ class ConfigProcessor:
         if not os.path.exists(self.config_path):
             self.create_default_config()
         self.config.read(self.config_path)
+        self.mtime = self._current_mtime()
+
+    def _current_mtime(self):
+        try:
+            return os.path.getmtime(self.config_path)
+        except OSError:
+            return None
+
+    def is_modified(self) -> bool:
+        return self._current_mtime() != self.mtime
+
+    def reload_if_modified(self) -> bool:
+        """Re-read and re-validate the file if its mtime changed; returns True when reloaded.
+
+        The file is loaded into a separate instance and swapped in only once it validates,
+        so a failed reload leaves this one (and its mtime) untouched.
+        """
+        if not self.is_modified():
+            return False
+        reloaded = ConfigProcessor(self.config_path)
+        self.config, self.mtime = reloaded.config, reloaded.mtime
+        return True
 
     def validate_config(self):
         """Validates that critical configuration is present"""
@@ -39,7 +62,13 @@ class ConfigProcessor:
             'password': '',
             'driver': 'ODBC Driver 17 for SQL Server',
             'trusted_connection': 'no',
-            'encrypt':'no'
+            'encrypt':'no',
+            'pool_min_size': '1',
+            'pool_max_size': '10',
+            'pool_timeout': '30',
+            'pool_idle_timeout': '300',
+            'pool_pre_ping': 'true',
+            'bcp_path': 'bcp'
         }
 
         self.config['IMPORT'] = {
@@ -49,11 +78,34 @@ class ConfigProcessor:
             'scan_rows': '100',
             'batch_size': '1000',
             'varchar_length': '255',
-            'fast_executemany': 'true'
+            'fast_executemany': 'true',
+            'commit_every': '1',
+            'load_mode': 'executemany',
+            'max_workers': '0',
+            'db_concurrency': '4',
+            'partition_size_mb': '256',
+            'partition_workers': '4',
+            'schema_cache': 'schema_cache.json',
+            'checkpoint_folder': 'checkpoints',
+            'move_processed': 'false',
+            'reject_details': 'false',
+            'encoding': 'utf-8',
+            'delimiter': '',
+            'txt_files': 'false',
+            'metrics_folder': 'metrics',
+            'watch_interval': '5',
+            'watch_stable_polls': '2',
+            'watch_max_pending': '0'
         }
 
         self.config['EXPORT'] = {
-            'export_folder': 'export'
+            'export_folder': 'export',
+            'batch_size': '5000',
+            'compression': 'none',
+            'format': 'csv',
+            'columnar_compression': 'zstd',
+            'workers': '4',
+            'executor': 'thread'
         }
 
         with open(self.config_path, 'w') as configfile:
@@ -78,6 +130,20 @@ class ConfigProcessor:
     def get_database_config(self) -> Dict[str, Any]:
         return dict(self.config['DATABASE'])
 
+    def get_pool_config(self) -> Dict[str, Any]:
+        """Connection pool sizing from the DATABASE section, with defaults for older config files"""
+        db_config = self.config['DATABASE']
+        try:
+            return {
+                'min_size': int(db_config.get('pool_min_size', '1')),
+                'max_size': int(db_config.get('pool_max_size', '10')),
+                'timeout': float(db_config.get('pool_timeout', '30')),
+                'idle_timeout': float(db_config.get('pool_idle_timeout', '300')),
+                'pre_ping': db_config.get('pool_pre_ping', 'true').lower() == 'true'
+            }
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid numeric value in DATABASE pool config: {e}")
+
     def get_import_config(self) -> Dict[str, Any]:
         config_dict = dict(self.config['IMPORT'])
         # Convert numeric values
@@ -86,9 +152,41 @@ class ConfigProcessor:
             config_dict['batch_size'] = int(config_dict['batch_size'])
             config_dict['varchar_length'] = int(config_dict['varchar_length'])
             config_dict['fast_executemany'] = config_dict['fast_executemany'].lower() == 'true'
+            config_dict['commit_every'] = int(config_dict.get('commit_every', '1'))
+            config_dict['load_mode'] = config_dict.get('load_mode', 'executemany').lower()
+            config_dict['max_workers'] = int(config_dict.get('max_workers', '0'))
+            config_dict['db_concurrency'] = int(config_dict.get('db_concurrency', '4'))
+            config_dict['partition_size_mb'] = float(config_dict.get('partition_size_mb', '256'))
+            config_dict['partition_workers'] = int(config_dict.get('partition_workers', '4'))
+            # Relative cache paths live next to the config file; blank disables the cache
+            schema_cache = config_dict.get('schema_cache', '').strip()
+            if schema_cache and not os.path.isabs(schema_cache):
+                schema_cache = os.path.join(os.path.dirname(os.path.abspath(self.config_path)), schema_cache)
+            config_dict['schema_cache'] = schema_cache
+            config_dict['checkpoint_folder'] = config_dict.get('checkpoint_folder', '').strip()
+            config_dict['move_processed'] = config_dict.get('move_processed', 'false').lower() == 'true'
+            config_dict['reject_details'] = config_dict.get('reject_details', 'false').lower() == 'true'
+            # Blank delimiter: sniffed from the first rows, falling back to the extension's
+            delimiter = config_dict.get('delimiter', '')
+            config_dict['delimiter'] = '\t' if delimiter.strip().lower() in ('tab', '\\t') else delimiter
+            config_dict['txt_files'] = config_dict.get('txt_files', 'false').lower() == 'true'
+            config_dict['metrics_folder'] = config_dict.get('metrics_folder', '').strip()
+            config_dict['watch_interval'] = float(config_dict.get('watch_interval', '5'))
+            config_dict['watch_stable_polls'] = int(config_dict.get('watch_stable_polls', '2'))
+            config_dict['watch_max_pending'] = int(config_dict.get('watch_max_pending', '0'))
             return config_dict
         except ValueError as e:
              raise ConfigurationError(f"Invalid numeric value in IMPORT config: {e}")
 
-    def get_export_config(self) -> Dict[str, str]:
-        return dict(self.config['EXPORT'])
+    def get_export_config(self) -> Dict[str, Any]:
+        config_dict = dict(self.config['EXPORT'])
+        try:
+            config_dict['batch_size'] = int(config_dict.get('batch_size', '5000'))
+            config_dict['workers'] = int(config_dict.get('workers', '4'))
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid numeric value in EXPORT config: {e}")
+        config_dict['compression'] = config_dict.get('compression', 'none').lower()
+        config_dict['format'] = config_dict.get('format', 'csv').lower()
+        config_dict['columnar_compression'] = config_dict.get('columnar_compression', 'zstd').lower()
+        config_dict['executor'] = config_dict.get('executor', 'thread').lower()
+        return config_dict
@@ -1,19 +1,14 @@
 from typing import List
 from database.db_connector import DBConnector
+from dao.row_mapper import RowMapper
 from models.category import CategoryDTO
 
+CATEGORY_MAPPER = RowMapper(CategoryDTO, id=int)
+
 class CategoryDAO:
     def __init__(self, connector: DBConnector):
         self.connector = connector
 
     def get_all(self) -> List[CategoryDTO]:
         query = "SELECT id, name FROM categories"
-        result = self.connector.execute_query(query)
-        categories = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                categories.append(CategoryDTO(
-                    id=int(row['id']),
-                    name=row['name']
-                ))
-        return categories
+        return CATEGORY_MAPPER.map(*self.connector.fetch_rows(query))
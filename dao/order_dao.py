@@ -1,7 +1,16 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from database.db_connector import DBConnector
-from models.order import OrderDTO
+from dao.pagination import DEFAULT_PAGE_SIZE, keyset_query
+from dao.row_mapper import RowMapper
+from models.order import OrderDetailRowDTO, OrderDTO
+
+ORDER_MAPPER = RowMapper(OrderDTO, id=int, user_id=int, paid=bool)
+ORDER_DETAIL_MAPPER = RowMapper(OrderDetailRowDTO, order_id=int, paid=bool, user_id=int, product_id=int,
+                                quantity=int, price_at_order=float)
+
+# Order ids bound per details query, under SQL Server's 2100-parameter limit
+DETAILS_BATCH = 2000
 
 class OrderDAO:
     def __init__(self, connector: DBConnector):
@@ -36,15 +45,44 @@ class OrderDAO:
 
     def get_all(self) -> list[OrderDTO]:
         query = "SELECT id, user_id, order_date, status, paid FROM orders"
-        result = self.connector.execute_query(query)
-        orders = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                orders.append(OrderDTO(
-                    id=int(row['id']),
-                    user_id=int(row['user_id']),
-                    order_date=row['order_date'],
-                    status=row['status'],
-                    paid=bool(row['paid'])
-                ))
-        return orders
+        return ORDER_MAPPER.map(*self.connector.fetch_rows(query))
+
+    def get_page(self, limit: int = DEFAULT_PAGE_SIZE, after_id: Optional[int] = None,
+                 status: Optional[str] = None, paid: Optional[bool] = None,
+                 date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> list[OrderDTO]:
+        """Up to limit orders with id > after_id, in id order, optionally filtered.
+
+        date_from is inclusive and date_to exclusive.
+        """
+        query, params = keyset_query("id, user_id, order_date, status, paid", "orders", limit, after_id, [
+            ("status = ?", status),
+            ("paid = ?", paid),
+            ("order_date >= ?", date_from),
+            ("order_date < ?", date_to),
+        ])
+        return ORDER_MAPPER.map(*self.connector.fetch_rows(query, params))
+
+    def get_detail_rows(self, order_ids: List[int]) -> List[OrderDetailRowDTO]:
+        """Orders joined with their user, items and product names, one row per order line.
+
+        One query per DETAILS_BATCH ids instead of separate order, user, item and
+        product lookups.
+        """
+        rows = []
+        ids = list(dict.fromkeys(order_ids))
+        for start in range(0, len(ids), DETAILS_BATCH):
+            batch = ids[start:start + DETAILS_BATCH]
+            placeholders = ','.join(['?'] * len(batch))
+            query = f"""
+                SELECT o.id AS order_id, o.order_date, o.status, o.paid,
+                       u.id AS user_id, u.name AS user_name, u.email AS user_email,
+                       oi.product_id, p.name AS product_name, oi.quantity, oi.price_at_order
+                FROM orders o
+                LEFT JOIN users u ON u.id = o.user_id
+                LEFT JOIN order_items oi ON oi.order_id = o.id
+                LEFT JOIN products p ON p.id = oi.product_id
+                WHERE o.id IN ({placeholders})
+                ORDER BY o.id, oi.product_id
+            """
+            rows.extend(ORDER_DETAIL_MAPPER.map(*self.connector.fetch_rows(query, tuple(batch))))
+        return rows
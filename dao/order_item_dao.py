@@ -2,6 +2,14 @@ from typing import List
 from database.db_connector import DBConnector
 from models.product import ProductDTO
 from models.order_item import OrderItemDTO
+from dao.row_mapper import RowMapper
+
+# SQL Server accepts at most 2100 parameters per statement and 1000 rows per VALUES list
+MAX_QUERY_PARAMS = 2100
+ITEM_INSERT_COLUMNS = 4
+ITEM_INSERT_BATCH = min(1000, (MAX_QUERY_PARAMS - 1) // ITEM_INSERT_COLUMNS)
+
+ORDER_ITEM_MAPPER = RowMapper(OrderItemDTO, order_id=int, product_id=int, quantity=int, price_at_order=float)
 
 class OrderItemDAO:
     def __init__(self, connector: DBConnector):
@@ -11,20 +19,18 @@ class OrderItemDAO:
         query = "INSERT INTO order_items (order_id, product_id, quantity, price_at_order) VALUES (?, ?, ?, ?)"
         self.connector.execute_query(query, (order_id, item.id, quantity, item.price))
 
+    def create_many(self, order_id: int, items: List[ProductDTO], quantities: List[int]):
+        """Insert all lines of an order with multi-row INSERTs, ITEM_INSERT_BATCH rows per statement"""
+        rows = [(order_id, item.id, quantity, item.price) for item, quantity in zip(items, quantities)]
+        for start in range(0, len(rows), ITEM_INSERT_BATCH):
+            batch = rows[start:start + ITEM_INSERT_BATCH]
+            values = ', '.join(['(?, ?, ?, ?)'] * len(batch))
+            query = f"INSERT INTO order_items (order_id, product_id, quantity, price_at_order) VALUES {values}"
+            self.connector.execute_query(query, tuple(value for row in batch for value in row))
+
     def get_by_order_id(self, order_id: int) -> List[OrderItemDTO]:
         query = "SELECT order_id, product_id, quantity, price_at_order FROM order_items WHERE order_id = ?"
-        result = self.connector.execute_query(query, (order_id,))
-        
-        items = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                items.append(OrderItemDTO(
-                    order_id=int(row['order_id']),
-                    product_id=int(row['product_id']),
-                    quantity=int(row['quantity']),
-                    price_at_order=float(row['price_at_order'])
-                ))
-        return items
+        return ORDER_ITEM_MAPPER.map(*self.connector.fetch_rows(query, (order_id,)))
 
     def delete_by_order_id(self, order_id: int):
         self.connector.execute_query("DELETE FROM order_items WHERE order_id = ?", (order_id,))
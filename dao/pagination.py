@@ -0,0 +1,23 @@
+from typing import Any, Iterable, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def keyset_query(columns: str, table: str, limit: int, after_id: Optional[int] = None,
+                 filters: Iterable[Tuple[str, Any]] = ()) -> Tuple[str, tuple]:
+    """SELECT for one page in id order, starting after after_id.
+
+    filters are (condition, value) pairs such as ("status = ?", "new"); pairs whose
+    value is None are left out, so callers can pass every optional filter as is.
+    """
+    conditions, params = [], [limit]
+    if after_id is not None:
+        conditions.append("id > ?")
+        params.append(after_id)
+    for condition, value in filters:
+        if value is not None:
+            conditions.append(condition)
+            params.append(value)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"SELECT TOP (?) {columns} FROM {table}{where} ORDER BY id", tuple(params)
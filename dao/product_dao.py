@@ -1,7 +1,11 @@
 from typing import Optional, List
 from database.db_connector import DBConnector
+from dao.pagination import DEFAULT_PAGE_SIZE, keyset_query
+from dao.row_mapper import RowMapper
 from models.product import ProductDTO
 
+PRODUCT_MAPPER = RowMapper(ProductDTO, id=int, price=float, category_id=int, active=bool)
+
 class ProductDAO:
     def __init__(self, connector: DBConnector):
         self.connector = connector
@@ -35,31 +39,17 @@ class ProductDAO:
             
         placeholders = ','.join(['?'] * len(product_ids))
         query = f"SELECT id, name, price, category_id, active FROM products WHERE id IN ({placeholders})"
-        result = self.connector.execute_query(query, tuple(product_ids))
-        
-        products = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                products.append(ProductDTO(
-                    id=int(row['id']),
-                    name=row['name'],
-                    price=float(row['price']),
-                    category_id=int(row['category_id']),
-                    active=bool(row['active'])
-                ))
-        return products
+        return PRODUCT_MAPPER.map(*self.connector.fetch_rows(query, tuple(product_ids)))
 
     def get_all(self) -> List[ProductDTO]:
         query = "SELECT id, name, price, category_id, active FROM products"
-        result = self.connector.execute_query(query)
-        products = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                products.append(ProductDTO(
-                    id=int(row['id']),
-                    name=row['name'],
-                    price=float(row['price']),
-                    category_id=int(row['category_id']),
-                    active=bool(row['active'])
-                ))
-        return products
+        return PRODUCT_MAPPER.map(*self.connector.fetch_rows(query))
+
+    def get_page(self, limit: int = DEFAULT_PAGE_SIZE, after_id: Optional[int] = None,
+                 category_id: Optional[int] = None, active: Optional[bool] = None) -> List[ProductDTO]:
+        """Up to limit products with id > after_id, in id order, optionally filtered"""
+        query, params = keyset_query("id, name, price, category_id, active", "products", limit, after_id, [
+            ("category_id = ?", category_id),
+            ("active = ?", active),
+        ])
+        return PRODUCT_MAPPER.map(*self.connector.fetch_rows(query, params))
@@ -0,0 +1,48 @@
+from dataclasses import fields
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from common.exceptions import DatabaseError
+
+T = TypeVar('T')
+
+
+def _null_safe(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else convert(value)
+
+
+class RowMapper(Generic[T]):
+    """Builds dataclass DTOs straight from cursor row tuples.
+
+    Fields are matched to result columns by name (case-insensitive). The column
+    positions and converters are resolved once per column list and reused, so each
+    row costs one DTO constructor call plus its converters. NULLs pass through
+    unconverted.
+    """
+
+    def __init__(self, dto_cls: Type[T], **converters: Callable[[Any], Any]):
+        self.dto_cls = dto_cls
+        self.fields = [f.name for f in fields(dto_cls)]
+        self.converters = {name: _null_safe(convert) for name, convert in converters.items()}
+        self._plans: Dict[Tuple[str, ...], List[Tuple[int, Optional[Callable]]]] = {}
+
+    def _plan(self, columns: Sequence[str]) -> List[Tuple[int, Optional[Callable]]]:
+        key = tuple(columns)
+        plan = self._plans.get(key)
+        if plan is None:
+            positions = {column.lower(): i for i, column in enumerate(columns)}
+            missing = [name for name in self.fields if name.lower() not in positions]
+            if missing:
+                raise DatabaseError(f"Result has no column for {self.dto_cls.__name__} field(s): {', '.join(missing)}")
+            plan = [(positions[name.lower()], self.converters.get(name)) for name in self.fields]
+            self._plans[key] = plan
+        return plan
+
+    def map(self, columns: Optional[Sequence[str]], rows: Sequence[Sequence[Any]]) -> List[T]:
+        if not rows:
+            return []
+        plan = self._plan(columns)
+        cls = self.dto_cls
+        if all(convert is None for _, convert in plan):
+            positions = [i for i, _ in plan]
+            return [cls(*[row[i] for i in positions]) for row in rows]
+        return [cls(*[row[i] if convert is None else convert(row[i]) for i, convert in plan]) for row in rows]
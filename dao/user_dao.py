@@ -1,7 +1,11 @@
 from typing import Optional
 from database.db_connector import DBConnector
+from dao.pagination import DEFAULT_PAGE_SIZE, keyset_query
+from dao.row_mapper import RowMapper
 from models.user import UserDTO
 
+USER_MAPPER = RowMapper(UserDTO, id=int)
+
 class UserDAO:
     def __init__(self, connector: DBConnector):
         self.connector = connector
@@ -35,20 +39,17 @@ class UserDAO:
             
         row = result.iloc[0]
         return UserDTO(
+            id=int(row['id']),
+            name=row['name'],
             email=row['email'],
             registered_at=row['registered_at']
         )
 
     def get_all(self) -> list[UserDTO]:
         query = "SELECT id, name, email, registered_at FROM users"
-        result = self.connector.execute_query(query)
-        users = []
-        if not result.empty:
-            for _, row in result.iterrows():
-                users.append(UserDTO(
-                    id=int(row['id']),
-                    name=row['name'],
-                    email=row['email'],
-                    registered_at=row['registered_at']
-                ))
-        return users
+        return USER_MAPPER.map(*self.connector.fetch_rows(query))
+
+    def get_page(self, limit: int = DEFAULT_PAGE_SIZE, after_id: Optional[int] = None) -> list[UserDTO]:
+        """Up to limit users with id > after_id, in id order"""
+        query, params = keyset_query("id, name, email, registered_at", "users", limit, after_id)
+        return USER_MAPPER.map(*self.connector.fetch_rows(query, params))
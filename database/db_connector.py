@@ -1,17 +1,312 @@
 import pyodbc
 import pandas as pd
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Any, List, Iterator, NamedTuple, Union
 import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from config.config_processor import ConfigProcessor as ConfigProcessor
 from common.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FETCH_SIZE = 5000
+
+# Control characters that never appear in normal CSV data
+BCP_FIELD_TERMINATOR = '\x1f'
+BCP_ROW_TERMINATOR = '\x1e'
+
+
+def format_bcp_row(row: List, column_count: int) -> Optional[str]:
+    """One row in bcp character format (NULL/NaN as empty), or None if a value holds a terminator"""
+    line = BCP_FIELD_TERMINATOR.join(['' if value is None or value != value else str(value) for value in row])
+    if BCP_ROW_TERMINATOR in line or line.count(BCP_FIELD_TERMINATOR) != column_count - 1:
+        return None
+    return line + BCP_ROW_TERMINATOR
+
+
+class QueryBatch(NamedTuple):
+    """One fetchmany() batch from stream_query"""
+    columns: List[str]
+    types: List[type]
+    rows: List[tuple]
+    # (precision, scale) per column from cursor.description; None where the driver reports none
+    precisions: Optional[List[Tuple[Optional[int], Optional[int]]]] = None
+
+
+class PooledConnection:
+    """Proxy around a pooled pyodbc connection; close() hands it back to the pool"""
+
+    def __init__(self, pool: 'ConnectionPool', raw_conn):
+        self._pool = pool
+        self._raw_conn = raw_conn
+
+    def __getattr__(self, name):
+        if self._raw_conn is None:
+            raise DatabaseError("Connection has already been returned to the pool")
+        return getattr(self._raw_conn, name)
+
+    def close(self):
+        """Return the connection to the pool instead of closing it"""
+        if self._raw_conn is not None:
+            raw_conn, self._raw_conn = self._raw_conn, None
+            self._pool.release(raw_conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of pyodbc connections"""
+
+    def __init__(self, connection_string: str, min_size: int = 1, max_size: int = 10,
+                 timeout: float = 30.0, idle_timeout: float = 300.0, pre_ping: bool = True):
+        if max_size < 1:
+            raise DatabaseError("Connection pool max_size must be at least 1")
+        self.connection_string = connection_string
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+
+        self._idle = deque()  # (raw_conn, last_used) pairs, most recently used on the right
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+        # Counters
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+        self._discarded = 0
+
+    def _connect(self):
+        try:
+            return pyodbc.connect(self.connection_string)
+        except pyodbc.Error as e:
+            logger.error(f"Database connection failed: {e}")
+            raise DatabaseError(f"Could not connect to database: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error connecting to database: {e}")
+            raise DatabaseError(f"Unexpected connection error: {e}")
+
+    def _is_alive(self, raw_conn) -> bool:
+        """Cheap liveness check run on connections taken from the idle list"""
+        if getattr(raw_conn, 'closed', False) is True:
+            return False
+        if not self.pre_ping:
+            return True
+        try:
+            cursor = raw_conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, raw_conn):
+        try:
+            raw_conn.close()
+        except Exception:
+            pass
+
+    def _evict_idle(self) -> list:
+        """Pop connections idle longer than idle_timeout, keeping min_size open. Caller holds the lock."""
+        expired = []
+        if self.idle_timeout <= 0:
+            return expired
+        now = time.monotonic()
+        # Oldest connections sit on the left
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            raw_conn, _ = self._idle.popleft()
+            self._size -= 1
+            self._discarded += 1
+            expired.append(raw_conn)
+        return expired
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check a connection out of the pool, waiting up to timeout seconds for one to free up"""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+
+        while True:
+            raw_conn = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise DatabaseError("Connection pool is closed")
+                expired = self._evict_idle()
+                if self._idle:
+                    raw_conn, _ = self._idle.pop()
+                    self._in_use += 1
+                elif self._size < self.max_size:
+                    self._size += 1
+                    self._in_use += 1
+                    create = True
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise DatabaseError(
+                            f"Timed out after {timeout:.1f}s waiting for a database connection "
+                            f"({self._in_use}/{self.max_size} in use)")
+                    waited = True
+                    self._cond.wait(remaining)
+                    continue
+
+            for conn in expired:
+                self._discard(conn)
+
+            if create:
+                try:
+                    raw_conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_alive(raw_conn):
+                logger.warning("Discarding dead pooled database connection")
+                self._discard(raw_conn)
+                with self._cond:
+                    self._size -= 1
+                    self._in_use -= 1
+                    self._discarded += 1
+                    self._cond.notify()
+                continue
+
+            with self._cond:
+                self._checkouts += 1
+                if waited:
+                    wait_time = time.monotonic() - start
+                    self._waits += 1
+                    self._wait_time += wait_time
+                    self._max_wait_time = max(self._max_wait_time, wait_time)
+            return PooledConnection(self, raw_conn)
+
+    def release(self, raw_conn):
+        """Return a checked-out connection; it is rolled back and discarded if unusable"""
+        healthy = True
+        try:
+            raw_conn.rollback()
+        except Exception:
+            healthy = False
+
+        with self._cond:
+            self._in_use -= 1
+            if healthy and not self._closed:
+                self._idle.append((raw_conn, time.monotonic()))
+                raw_conn = None
+            else:
+                self._size -= 1
+                self._discarded += 1
+            self._cond.notify()
+
+        if raw_conn is not None:
+            self._discard(raw_conn)
+
+    def warm(self):
+        """Open connections until min_size are available"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                raw_conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._idle.append((raw_conn, time.monotonic()))
+                self._cond.notify()
+
+    def close(self):
+        """Close idle connections and refuse new checkouts; in-use connections close on release"""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool counters"""
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'max_size': self.max_size,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'total_wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+                'timeouts': self._timeouts,
+                'discarded': self._discarded,
+            }
+
 
 class DBConnector:
     def __init__(self, config: ConfigProcessor):
         self.config = config
         self.connection_string = self._build_connection_string()
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+        # Per-thread connection of an open transaction()
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # Locks and live connections cannot cross process boundaries; each process builds its own pool
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_pid'] = None
+        state['_pool_lock'] = None
+        state['_local'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Connection pool for the current process, created on first use"""
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            with self._pool_lock:
+                if self._pool is None or self._pool_pid != pid:
+                    self._pool = ConnectionPool(self.connection_string, **self.config.get_pool_config())
+                    self._pool_pid = pid
+        return self._pool
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.pool.stats()
+
+    def close(self):
+        """Close all pooled connections"""
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.close()
+        self._pool = None
 
     def _build_connection_string(self) -> str:
         try:
@@ -29,44 +324,39 @@ class DBConnector:
             raise DatabaseError(f"Failed to build connection string: {e}")
 
     def get_connection(self):
-        """Get a new database connection"""
-        try:
-            conn = pyodbc.connect(self.connection_string)
-            return conn
-        except pyodbc.Error as e:
-            logger.error(f"Database connection failed: {e}")
-            raise DatabaseError(f"Could not connect to database: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error connecting to database: {e}")
-            raise DatabaseError(f"Unexpected connection error: {e}")
+        """Check a connection out of the pool; close() returns it"""
+        return self.pool.acquire()
 
     def execute_query(self, query: str, params: Tuple = None) -> Optional[pd.DataFrame]:
         """Execute a query and return results as DataFrame if applicable"""
+        columns, data = self.fetch_rows(query, params)
+        if columns is None:
+            return None
+        if columns and data:
+            return pd.DataFrame.from_records(data, columns=columns)
+        return pd.DataFrame(columns=columns)
+
+    def fetch_rows(self, query: str, params: Tuple = None) -> Tuple[Optional[List[str]], List[tuple]]:
+        """Execute a query and return the column names and raw row tuples of its first result set.
+
+        Columns are None when the statement returns no result set. OLTP reads map these rows
+        straight to DTOs (see dao.row_mapper) without building a DataFrame.
+        """
+        tx_conn = getattr(self._local, 'conn', None)
+        if tx_conn is not None:
+            # Inside transaction(): share its connection and leave commit/rollback to it
+            try:
+                return self._read_result(tx_conn.cursor(), query, params)
+            except pyodbc.Error as e:
+                logger.error(f"Query execution failed: {e}")
+                raise DatabaseError(f"Error executing query: {e}")
+
         conn = None
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-
-            # Iterate to find the first result set that has data
-            while True:
-                if cursor.description:
-                    columns = [column[0] for column in cursor.description]
-                    data = cursor.fetchall()
-                    conn.commit()
-                    if columns and data:
-                        return pd.DataFrame.from_records(data, columns=columns)
-                    else:
-                        return pd.DataFrame(columns=columns)
-                
-                if not cursor.nextset():
-                    break
-            
+            result = self._read_result(conn.cursor(), query, params)
             conn.commit()
-            return None
+            return result
         except pyodbc.Error as e:
             if conn:
                 try:
@@ -90,6 +380,161 @@ class DBConnector:
                 except:
                     pass
 
+    def _read_result(self, cursor, query: str, params: Tuple = None) -> Tuple[Optional[List[str]], List[tuple]]:
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+
+        # Iterate to find the first result set that has data
+        while True:
+            if cursor.description:
+                columns = [column[0] for column in cursor.description]
+                return columns, cursor.fetchall()
+
+            if not cursor.nextset():
+                break
+        return None, []
+
+    @contextmanager
+    def transaction(self):
+        """Run the execute_query/fetch_rows calls made by this thread inside the block on one
+        connection, committing once at the end or rolling all of them back on error.
+
+        A nested block joins the outer transaction.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield
+            return
+        conn = self.get_connection()
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+        except Exception as e:
+            try:
+                conn.rollback()
+            except:
+                pass
+            if isinstance(e, pyodbc.Error):
+                logger.error(f"Transaction failed: {e}")
+                raise DatabaseError(f"Transaction failed: {e}")
+            raise
+        finally:
+            self._local.conn = None
+            try:
+                conn.close()
+            except:
+                pass
+
+    def stream_query(self, query: str, params: Tuple = None, batch_size: int = DEFAULT_FETCH_SIZE,
+                     as_dataframe: bool = False) -> Iterator[Union[QueryBatch, pd.DataFrame]]:
+        """Yield the first result set in fixed-size batches via cursor.fetchmany.
+
+        Only one batch is held in memory at a time. Batches are QueryBatch tuples of plain
+        row tuples, or DataFrame chunks when as_dataframe is set. The connection stays
+        checked out until the generator is exhausted or closed.
+        """
+        conn = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.arraysize = batch_size
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            while not cursor.description:
+                if not cursor.nextset():
+                    return
+
+            columns = [column[0] for column in cursor.description]
+            types = [column[1] for column in cursor.description]
+            precisions = [(column[4], column[5]) for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                rows = [tuple(row) for row in rows]
+                if as_dataframe:
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+                else:
+                    yield QueryBatch(columns, types, rows, precisions)
+        except pyodbc.Error as e:
+            logger.error(f"Streaming query failed: {e}")
+            raise DatabaseError(f"Error streaming query: {e}")
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+
+    def savepoint(self, cursor, name: str):
+        """Mark a savepoint inside the open transaction"""
+        cursor.execute(f"SAVE TRANSACTION {name}")
+
+    def rollback_to_savepoint(self, cursor, name: str):
+        """Undo work done since the savepoint while keeping the transaction open"""
+        cursor.execute(f"ROLLBACK TRANSACTION {name}")
+
+    def create_staging_table(self, table_name: str, staging_table: str):
+        """(Re)create an empty heap table with the same columns as table_name"""
+        self.execute_query(
+            f"DROP TABLE IF EXISTS [{staging_table}]; SELECT TOP 0 * INTO [{staging_table}] FROM [{table_name}];")
+
+    def bulk_copy(self, table_name: str, data_path: str):
+        """Load a bcp character-format data file (see format_bcp_row) into table_name with one bcp call.
+
+        The file goes in as one bcp batch and any rejected row fails the call; bcp's
+        reasons are read back from its -e error file. A SQL login's password is passed
+        through SQLCMDPASSWORD, never on the command line.
+        """
+        db_config = self.config.get_database_config()
+        error_path = f"{data_path}.err"
+        command = [
+            db_config.get('bcp_path', 'bcp'), f"[{db_config['database']}].dbo.[{table_name}]", 'in', data_path,
+            '-S', db_config['server'], '-c', '-C', '65001', '-t', '0x1f', '-r', '0x1e',
+            '-e', error_path, '-m', '1',
+        ]
+        env = None
+        if db_config.get('trusted_connection', 'no').lower() == 'yes':
+            command.append('-T')
+        else:
+            command += ['-U', db_config['username']]
+            env = dict(os.environ, SQLCMDPASSWORD=db_config['password'])
+
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, env=env, stdin=subprocess.DEVNULL)
+            row_errors = self._read_bcp_errors(error_path)
+        except OSError as e:
+            raise DatabaseError(f"Could not run bcp: {e}")
+        finally:
+            if os.path.exists(error_path):
+                os.remove(error_path)
+        if result.returncode != 0 or row_errors:
+            details = row_errors or result.stderr.strip() or result.stdout.strip()
+            raise DatabaseError(f"bcp into {table_name} failed (exit code {result.returncode}): {details}")
+
+    @staticmethod
+    def _read_bcp_errors(error_path: str) -> str:
+        """Contents of a bcp -e error file; empty when no row was rejected"""
+        if not os.path.exists(error_path):
+            return ''
+        with open(error_path, encoding='utf-8', errors='replace') as f:
+            return f.read().strip()
+
+    def merge_staging(self, staging_table: str, table_name: str, columns: List[str]):
+        """Move staged rows into table_name and drop the staging table in one transaction"""
+        columns_str = ', '.join([f'[{col}]' for col in columns])
+        self.execute_query(
+            f"INSERT INTO [{table_name}] WITH (TABLOCK) ({columns_str}) SELECT {columns_str} FROM [{staging_table}]; "
+            f"DROP TABLE [{staging_table}];")
+
+    def drop_table(self, table_name: str):
+        self.execute_query(f"DROP TABLE IF EXISTS [{table_name}]")
+
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the database"""
         query = """
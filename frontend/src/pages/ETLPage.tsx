@@ -1,38 +1,36 @@
 import { useState, useEffect } from 'react';
 import styles from '../common.module.css';
 
+const MAX_LOG_LINES = 2000;
+
 export function ETLPage() {
     const [logs, setLogs] = useState('');
     const [loading, setLoading] = useState(false);
 
-    const fetchLogs = async () => {
-        try {
-            const res = await fetch('http://localhost:8000/api/etl/logs');
-            const data = await res.json();
-            setLogs(data.logs);
-        } catch (e) {
-            console.error("Failed to fetch logs", e);
-        }
-    };
-
     useEffect(() => {
-        fetchLogs();
-        const interval = setInterval(fetchLogs, 5000); // Poll logs
-        return () => clearInterval(interval);
+        // Server-sent events: the last lines of the log, then new lines as they are written
+        const source = new EventSource('http://localhost:8000/api/etl/logs/stream?lines=200');
+        source.onmessage = (event) => {
+            setLogs(prev => {
+                const lines = (prev ? prev + '\n' : '') + event.data;
+                const kept = lines.split('\n');
+                return kept.length > MAX_LOG_LINES ? kept.slice(-MAX_LOG_LINES).join('\n') : lines;
+            });
+        };
+        source.onerror = (e) => console.error("Log stream interrupted", e);
+        return () => source.close();
     }, []);
 
     const runImport = async () => {
         setLoading(true);
         await fetch('http://localhost:8000/api/etl/import', { method: 'POST' });
         setLoading(false);
-        fetchLogs();
     };
 
     const runExport = async () => {
         setLoading(true);
         await fetch('http://localhost:8000/api/etl/export', { method: 'POST' });
         setLoading(false);
-        fetchLogs();
     };
 
     return (
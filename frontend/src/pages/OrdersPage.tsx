@@ -1,23 +1,9 @@
-import { useEffect, useState } from 'react';
 import type { Order } from '../types';
 import styles from '../common.module.css';
+import { usePagedList } from '../usePagedList';
 
 export function OrdersPage() {
-    const [orders, setOrders] = useState<Order[]>([]);
-    const [loading, setLoading] = useState(true);
-
-    useEffect(() => {
-        fetch('http://localhost:8000/api/orders/')
-            .then(res => res.json())
-            .then(data => {
-                setOrders(data);
-                setLoading(false);
-            })
-            .catch(err => {
-                console.error(err);
-                setLoading(false);
-            });
-    }, []);
+    const { items: orders, loading, hasMore, loadMore } = usePagedList<Order>('http://localhost:8000/api/orders/');
 
     return (
         <div className={styles.pageContainer}>
@@ -35,7 +21,7 @@ export function OrdersPage() {
                         </tr>
                     </thead>
                     <tbody>
-                        {loading ? (
+                        {loading && orders.length === 0 ? (
                             <tr><td colSpan={3}>Loading...</td></tr>
                         ) : orders.map(order => (
                             <tr key={order.id}>
@@ -58,6 +44,11 @@ export function OrdersPage() {
                     </tbody>
                 </table>
             </div>
+            {hasMore && (
+                <button className={styles.button} onClick={loadMore} disabled={loading} style={{ marginTop: '1rem' }}>
+                    {loading ? 'Loading...' : 'Load more'}
+                </button>
+            )}
         </div>
     );
 }
@@ -2,35 +2,25 @@ import { useEffect, useState } from 'react';
 import type { Product, Category } from '../types';
 import styles from '../common.module.css';
 import { Modal } from '../components/Modal';
+import { usePagedList } from '../usePagedList';
 
 export function ProductsPage() {
-    const [products, setProducts] = useState<Product[]>([]);
+    const { items: products, loading, hasMore, loadMore, add } = usePagedList<Product>('http://localhost:8000/api/products/');
     const [categories, setCategories] = useState<Category[]>([]);
-    const [loading, setLoading] = useState(true);
     const [isModalOpen, setIsModalOpen] = useState(false);
     const [newProduct, setNewProduct] = useState({ name: '', price: 0, category_id: 1, active: true });
 
-    const fetchData = () => {
-        setLoading(true);
-        Promise.all([
-            fetch('http://localhost:8000/api/products/').then(res => res.json()),
-            fetch('http://localhost:8000/api/products/categories').then(res => res.json())
-        ]).then(([productsData, categoriesData]) => {
-            setProducts(productsData);
-            setCategories(categoriesData);
-            setLoading(false);
-            // Default category ID to first one if available
-            if (categoriesData.length > 0) {
-                setNewProduct(prev => ({ ...prev, category_id: categoriesData[0].id }));
-            }
-        }).catch(err => {
-            console.error(err);
-            setLoading(false);
-        });
-    };
-
     useEffect(() => {
-        fetchData();
+        fetch('http://localhost:8000/api/products/categories')
+            .then(res => res.json())
+            .then(categoriesData => {
+                setCategories(categoriesData);
+                // Default category ID to first one if available
+                if (categoriesData.length > 0) {
+                    setNewProduct(prev => ({ ...prev, category_id: categoriesData[0].id }));
+                }
+            })
+            .catch(err => console.error(err));
     }, []);
 
     const handleCreateProduct = async (e: React.FormEvent) => {
@@ -45,10 +35,8 @@ export function ProductsPage() {
                 setIsModalOpen(false);
                 // Reset form but keep last selected category or default
                 setNewProduct(prev => ({ name: '', price: 0, category_id: prev.category_id, active: true }));
-                // Re-fetch only products
-                fetch('http://localhost:8000/api/products/')
-                    .then(r => r.json())
-                    .then(d => setProducts(d));
+                const id: number = await res.json();
+                add(await fetch(`http://localhost:8000/api/products/${id}`).then(r => r.json()));
             } else {
                 alert('Failed to create product');
             }
@@ -81,7 +69,7 @@ export function ProductsPage() {
                         </tr>
                     </thead>
                     <tbody>
-                        {loading ? (
+                        {loading && products.length === 0 ? (
                             <tr><td colSpan={4}>Loading...</td></tr>
                         ) : products.map(product => (
                             <tr key={product.id}>
@@ -94,6 +82,11 @@ export function ProductsPage() {
                     </tbody>
                 </table>
             </div>
+            {hasMore && (
+                <button className={styles.button} onClick={loadMore} disabled={loading} style={{ marginTop: '1rem' }}>
+                    {loading ? 'Loading...' : 'Load more'}
+                </button>
+            )}
 
             <Modal isOpen={isModalOpen} onClose={() => setIsModalOpen(false)} title="Add Product">
                 <form onSubmit={handleCreateProduct} style={{ display: 'flex', flexDirection: 'column', gap: '1rem' }}>
@@ -1,31 +1,14 @@
-import { useEffect, useState } from 'react';
+import { useState } from 'react';
 import type { User } from '../types';
 import styles from '../common.module.css';
 import { Modal } from '../components/Modal';
+import { usePagedList } from '../usePagedList';
 
 export function UsersPage() {
-    const [users, setUsers] = useState<User[]>([]);
-    const [loading, setLoading] = useState(true);
+    const { items: users, loading, hasMore, loadMore, add } = usePagedList<User>('http://localhost:8000/api/users/');
     const [isModalOpen, setIsModalOpen] = useState(false);
     const [newUser, setNewUser] = useState({ name: '', email: '' });
 
-    const fetchUsers = () => {
-        fetch('http://localhost:8000/api/users/')
-            .then(res => res.json())
-            .then(data => {
-                setUsers(data);
-                setLoading(false);
-            })
-            .catch(err => {
-                console.error(err);
-                setLoading(false);
-            });
-    };
-
-    useEffect(() => {
-        fetchUsers();
-    }, []);
-
     const handleCreateUser = async (e: React.FormEvent) => {
         e.preventDefault();
         try {
@@ -37,7 +20,8 @@ export function UsersPage() {
             if (res.ok) {
                 setIsModalOpen(false);
                 setNewUser({ name: '', email: '' });
-                fetchUsers();
+                const id: number = await res.json();
+                add(await fetch(`http://localhost:8000/api/users/${id}`).then(r => r.json()));
             } else {
                 alert('Failed to create user');
             }
@@ -64,7 +48,7 @@ export function UsersPage() {
                         </tr>
                     </thead>
                     <tbody>
-                        {loading ? (
+                        {loading && users.length === 0 ? (
                             <tr><td colSpan={3}>Loading...</td></tr>
                         ) : users.map(user => (
                             <tr key={user.id}>
@@ -76,6 +60,11 @@ export function UsersPage() {
                     </tbody>
                 </table>
             </div>
+            {hasMore && (
+                <button className={styles.button} onClick={loadMore} disabled={loading} style={{ marginTop: '1rem' }}>
+                    {loading ? 'Loading...' : 'Load more'}
+                </button>
+            )}
 
             <Modal isOpen={isModalOpen} onClose={() => setIsModalOpen(false)} title="Add User">
                 <form onSubmit={handleCreateUser} style={{ display: 'flex', flexDirection: 'column', gap: '1rem' }}>
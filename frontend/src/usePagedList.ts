@@ -0,0 +1,46 @@
+import { useCallback, useEffect, useState } from 'react';
+
+// Set by the API on a full page; the id to pass as after_id for the next one
+const NEXT_AFTER_ID_HEADER = 'X-Next-After-Id';
+const PAGE_SIZE = 100;
+
+function mergeById<T extends { id: number }>(current: T[], incoming: T[]): T[] {
+    const seen = new Set(current.map(item => item.id));
+    return [...current, ...incoming.filter(item => !seen.has(item.id))];
+}
+
+// Keyset-paginated list endpoint: first page on mount, then loadMore() follows X-Next-After-Id
+export function usePagedList<T extends { id: number }>(url: string) {
+    const [items, setItems] = useState<T[]>([]);
+    const [nextAfterId, setNextAfterId] = useState<string | null>(null);
+    const [loading, setLoading] = useState(true);
+
+    const fetchPage = useCallback(async (afterId: string | null, replace: boolean) => {
+        setLoading(true);
+        try {
+            const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+            if (afterId) params.set('after_id', afterId);
+            const res = await fetch(`${url}?${params}`);
+            const page: T[] = await res.json();
+            setItems(prev => mergeById(replace ? [] : prev, page));
+            setNextAfterId(res.headers.get(NEXT_AFTER_ID_HEADER));
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setLoading(false);
+        }
+    }, [url]);
+
+    useEffect(() => {
+        fetchPage(null, true);
+    }, [fetchPage]);
+
+    return {
+        items,
+        loading,
+        hasMore: nextAfterId !== null,
+        loadMore: () => fetchPage(nextAfterId, false),
+        // Show a newly created row right away, even when it sits beyond the loaded pages
+        add: (item: T) => setItems(prev => mergeById(prev, [item])),
+    };
+}
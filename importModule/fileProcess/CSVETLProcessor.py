@@ -1,44 +1,110 @@
 import logging
-import sys
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from config.config_processor import ConfigProcessor
 from database.db_connector import DBConnector
 from importModule.fileProcess.file_processor import FileProcessor
-from typing import List
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('etl_process.log')
-    ]
-)
+from importModule.fileProcess.log_setup import init_worker_logging, log_queue, worker_pool_kwargs
+from importModule.fileProcess.jobs import ImportJob, JobRegistry
+from importModule.fileProcess.metrics import summarize_run, write_run_summary
+from importModule.fileProcess.readers import is_input_file
+from common.exceptions import ConfigurationError
+from typing import Callable, List, Dict, Any, Optional
+
+# Handlers are configured by the entry point (log_setup.start_logging), not at import
 logger = logging.getLogger(__name__)
 
 
+# Watch-mode worker state, set once per worker process by _init_watch_worker
+_watch_processor = None
+
+# Most recent results kept (and returned) by watch(); older ones are only in the metrics folder
+WATCH_RESULTS_KEPT = 1000
+
+
+def _init_watch_worker(processor: 'CSVETLProcessor', queue=None):
+    """Pool initializer: keep one processor per worker and open its DB connections up front"""
+    global _watch_processor
+    if queue is not None:
+        init_worker_logging(queue)
+    _watch_processor = processor
+    pool = getattr(processor.db_connector, 'pool', None)
+    if pool is not None:
+        try:
+            pool.warm()
+        except Exception as e:
+            logger.warning(f"Could not warm DB connections in worker {os.getpid()}: {e}")
+
+
+def _watch_process_file(file_path: Path, import_config: Dict[str, Any], submitted_at: float) -> 'FileImportResult':
+    return _watch_processor._process_file(file_path, import_config, submitted_at)
+
+
+@dataclass
+class FileImportResult:
+    filename: str
+    success: int
+    errors: int
+    error: Optional[str]
+    queue_wait: float
+    run_time: float
+    metrics: Optional[Dict[str, Any]] = None
+
+
 class CSVETLProcessor:
-    def __init__(self, config_path: str = "config.ini"):
-        self.config_processor = ConfigProcessor(config_path)
-        self.db_connector = DBConnector(self.config_processor)
+    def __init__(self, config_path: str = "config.ini", config_processor: ConfigProcessor = None,
+                 db_connector: DBConnector = None):
+        self.config_processor = config_processor or ConfigProcessor(config_path)
+        self.db_connector = db_connector or DBConnector(self.config_processor)
 
     def _get_csv_files(self) -> List[Path]:
-        """Return a list of CSV files in the input folder"""
-        input_folder = Path(self.config_processor.get_import_config()['input_folder'])
-        return list(input_folder.glob("*.csv"))
+        """Return the importable files in the input folder: delimited text (optionally compressed) and Parquet"""
+        import_config = self.config_processor.get_import_config()
+        input_folder = Path(import_config['input_folder'])
+        if not input_folder.is_dir():
+            return []
+        return [path for path in input_folder.iterdir() if is_input_file(path, import_config.get('txt_files', False))]
 
-    def _process_file(self, file_path: Path) -> tuple:
-        """Process a single CSV file, returning stats or error"""
+    def _process_file(self, file_path: Path, import_config: Dict[str, Any], submitted_at: float) -> FileImportResult:
+        """Process a single CSV file, returning stats or error along with queue wait and run time"""
+        started_at = time.time()
+        file_processor = FileProcessor(self.db_connector, import_config)
         try:
-            file_processor = FileProcessor(self.db_connector, self.config_processor.get_import_config())
             success, errors = file_processor.process_csv_file(file_path)
-            return file_path.name, success, errors, None
+            error = None
         except Exception as e:
             logger.error(f"Error processing {file_path.name}: {e}")
-            return file_path.name, 0, 0, str(e)
+            success, errors, error = 0, 0, str(e)
+        metrics = file_processor.metrics.to_dict()
+        metrics['queue_wait'] = round(started_at - submitted_at, 4)
+        return FileImportResult(file_path.name, success, errors, error,
+                                queue_wait=started_at - submitted_at, run_time=time.time() - started_at,
+                                metrics=metrics)
+
+    def _save_run_metrics(self, kind: str, started_at: float, import_config: Dict[str, Any],
+                          results: List[FileImportResult]):
+        """Write the run's per-file and total stage metrics as one JSON summary"""
+        summary = summarize_run(kind, started_at, [r.metrics for r in results if r.metrics])
+        path = write_run_summary(import_config.get('metrics_folder'), summary)
+        if path is not None:
+            stages = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in summary['totals']['stages'].items())
+            logger.info(f"Run metrics written to {path} ({stages})")
+
+    def _import_worker_count(self, import_config: Dict[str, Any], file_count: int) -> int:
+        """Cap workers by file count, CPU count, max_workers and the DB concurrency limit"""
+        limits = [file_count, os.cpu_count() or 1]
+        if import_config.get('max_workers', 0) > 0:
+            limits.append(import_config['max_workers'])
+        if import_config.get('db_concurrency', 0) > 0:
+            limits.append(import_config['db_concurrency'])
+        return max(1, min(limits))
 
     def _get_export_tables(self, table_names: List[str] = None) -> List[str]:
         """Fetch export table names from DB if not provided"""
@@ -53,41 +119,241 @@ class CSVETLProcessor:
 
 
 
-    def import_csv_files(self):
+    def start_import_job(self, registry: JobRegistry) -> ImportJob:
+        """Register an import of the input folder; raises ConflictError if one is already running"""
+        input_folder = self.config_processor.get_import_config()['input_folder']
+        return registry.create(input_folder, self._get_csv_files())
+
+    def run_import_job(self, registry: JobRegistry, job_id: str, load_mode: str = None):
+        """Run a registered import, reporting each file's result to the registry"""
+        registry.start(job_id)
+        try:
+            self.import_csv_files(load_mode=load_mode, on_result=lambda result: registry.file_done(
+                job_id, result.filename, result.success, result.errors, result.error))
+        except Exception as e:
+            logger.error(f"Import job {job_id} failed: {e}")
+            registry.finish(job_id, error=str(e))
+            return
+        registry.finish(job_id)
+
+    def import_csv_files(self, load_mode: str = None,
+                         on_result: Callable[[FileImportResult], None] = None) -> List[FileImportResult]:
         """Import all CSV files from input folder using parallel processing"""
+        import_config = self.config_processor.get_import_config()
+        if load_mode:
+            import_config['load_mode'] = load_mode
         csv_files = self._get_csv_files()
         if not csv_files:
             logger.info("No CSV files found in input folder")
-            return
+            return []
 
-        logger.info(f"Found {len(csv_files)} CSV files to process")
-        max_processes = len(csv_files)
+        # Largest files first so the longest job does not start last
+        csv_files.sort(key=lambda f: f.stat().st_size, reverse=True)
+        max_processes = self._import_worker_count(import_config, len(csv_files))
+        # Partition pools inside each file worker share the DB budget with the other files
+        import_config['file_workers'] = max_processes
+        logger.info(f"Found {len(csv_files)} CSV files to process with {max_processes} workers")
 
+        results = []
         total_success = total_errors = 0
-        with ProcessPoolExecutor(max_workers=max_processes) as executor:
-            futures = {executor.submit(self._process_file, f): f for f in csv_files}
+        started_at = time.time()
+        with ProcessPoolExecutor(max_workers=max_processes, **worker_pool_kwargs()) as executor:
+            futures = {executor.submit(self._process_file, f, import_config, time.time()): f for f in csv_files}
             for future in as_completed(futures):
-                filename, success, errors, error_msg = future.result()
-                if error_msg:
-                    logger.error(f"Failed to process {filename}: {error_msg}")
-                else:
-                    logger.info(f"Completed {filename}: {success} successful, {errors} rejected")
-                    total_success += success
-                    total_errors += errors
+                result = future.result()
+                results.append(result)
+                self._log_import_result(result)
+                if on_result is not None:
+                    on_result(result)
+                if not result.error:
+                    total_success += result.success
+                    total_errors += result.errors
 
         logger.info(f"Import completed: {total_success} total successful rows, {total_errors} total rejected rows")
+        self._save_run_metrics('import', started_at, import_config, results)
+        return results
+
+    def _log_import_result(self, result: FileImportResult):
+        if result.error:
+            logger.error(f"Failed to process {result.filename}: {result.error}")
+        else:
+            logger.info(
+                f"Completed {result.filename}: {result.success} successful, {result.errors} rejected "
+                f"(queued {result.queue_wait:.2f}s, ran {result.run_time:.2f}s)")
+
+    def _watch_file_done(self, result: FileImportResult, import_config: Dict[str, Any], results: deque):
+        """Log a watched file, write its own metrics summary and keep its result without per-chunk records"""
+        self._log_import_result(result)
+        if result.metrics:
+            self._save_run_metrics('watch', time.time() - result.run_time, import_config, [result])
+            result = replace(result, metrics={k: v for k, v in result.metrics.items() if k != 'chunks'})
+        results.append(result)
 
-    def export_tables(self, table_names: List[str] = None):
-        """Export specified tables to CSV files"""
+    def _start_watch_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_watch_worker, initargs=(self, log_queue()))
+
+    def _collect_watch_future(self, future, file_path: Path, import_config: Dict[str, Any], results: deque,
+                              handled: Dict[Path, Any]) -> bool:
+        """Record a finished watch future; a worker that died forgets the file so a later poll retries it"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Worker failed on {file_path.name}, it will be retried: {e}")
+            handled.pop(file_path, None)
+            return False
+        self._watch_file_done(result, import_config, results)
+        return True
+
+    def watch(self, load_mode: str = None, stop_event: threading.Event = None) -> List[FileImportResult]:
+        """Import files as they land in the input folder until stop_event is set (or Ctrl+C).
+
+        The folder is polled every watch_interval seconds and a file is submitted once
+        its size and mtime have not changed for watch_stable_polls polls. Workers stay
+        up between files with warm DB connections. At most watch_max_pending files are
+        in flight; further ready files wait in the folder until a worker frees up.
+        Each file gets its own metrics summary, and only the last WATCH_RESULTS_KEPT
+        results are returned, so a long-running watch does not grow without bound.
+        """
+        import_config = self.config_processor.get_import_config()
+        if load_mode:
+            import_config['load_mode'] = load_mode
+        stop_event = stop_event or threading.Event()
+        interval = import_config.get('watch_interval', 5.0)
+        stable_polls = import_config.get('watch_stable_polls', 2)
+        workers = self._import_worker_count(import_config, os.cpu_count() or 1)
+        import_config['file_workers'] = workers
+        max_pending = import_config.get('watch_max_pending', 0) or 2 * workers
+
+        observed = {}  # path -> (size, mtime, unchanged polls)
+        handled = {}  # path -> (size, mtime) when it was submitted
+        in_flight = {}
+        results = deque(maxlen=WATCH_RESULTS_KEPT)
+        files_done = 0
+        logger.info(f"Watching {import_config['input_folder']} with {workers} workers "
+                    f"(poll {interval}s, up to {max_pending} files in flight)")
+
+        executor = self._start_watch_pool(workers)
+        pool_broken = False
+        try:
+            try:
+                while not stop_event.is_set():
+                    for future in [f for f in in_flight if f.done()]:
+                        file_path = in_flight.pop(future)
+                        if self._collect_watch_future(future, file_path, import_config, results, handled):
+                            files_done += 1
+                        elif isinstance(future.exception(), BrokenProcessPool):
+                            pool_broken = True
+                    if pool_broken:
+                        # Every file still in flight died with the pool; they are picked up again once stable
+                        for file_path in in_flight.values():
+                            handled.pop(file_path, None)
+                        in_flight.clear()
+                        logger.warning("Watch worker pool is broken, starting a new one")
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = self._start_watch_pool(workers)
+                        pool_broken = False
+
+                    ready = []
+                    current = set()
+                    for file_path in self._get_csv_files():
+                        try:
+                            stat = file_path.stat()
+                        except FileNotFoundError:
+                            continue
+                        current.add(file_path)
+                        signature = (stat.st_size, stat.st_mtime_ns)
+                        if handled.get(file_path) == signature:
+                            continue
+                        previous = observed.get(file_path)
+                        polls = previous[2] + 1 if previous and previous[:2] == signature else 0
+                        observed[file_path] = (*signature, polls)
+                        if polls >= stable_polls:
+                            ready.append(file_path)
+                    # Forget files that were moved away so a new file with the same name is picked up
+                    for file_path in set(observed) - current:
+                        observed.pop(file_path)
+                    for file_path in set(handled) - current:
+                        handled.pop(file_path)
+
+                    ready.sort(key=lambda f: observed[f][0], reverse=True)
+                    free = max_pending - len(in_flight)
+                    if len(ready) > free:
+                        logger.info(f"{len(in_flight)} files in flight, deferring {len(ready) - free} ready files")
+                    for file_path in ready[:max(0, free)]:
+                        try:
+                            future = executor.submit(_watch_process_file, file_path, import_config, time.time())
+                        except BrokenProcessPool:
+                            # Left in observed and submitted to the replacement pool on the next poll
+                            pool_broken = True
+                            break
+                        in_flight[future] = file_path
+                        handled[file_path] = observed.pop(file_path)[:2]
+
+                    stop_event.wait(interval)
+            except KeyboardInterrupt:
+                logger.info("Interrupted, waiting for in-flight files")
+
+            for future in as_completed(in_flight):
+                if self._collect_watch_future(future, in_flight[future], import_config, results, handled):
+                    files_done += 1
+        finally:
+            executor.shutdown()
+
+        logger.info(f"Stopped watching after {files_done} files")
+        return list(results)
+
+    def _export_table(self, table_name: str, export_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Export a single table, returning timing and row count or the error"""
+        start = time.perf_counter()
+        try:
+            file_processor = FileProcessor(self.db_connector, self.config_processor.get_import_config())
+            rows = file_processor.export_table(table_name, export_config)
+            error = None
+        except Exception as e:
+            rows, error = 0, str(e)
+        return {'table': table_name, 'rows': rows, 'seconds': time.perf_counter() - start, 'error': error}
+
+    def export_tables(self, table_names: List[str] = None, workers: int = None,
+                      executor: str = None, export_format: str = None) -> List[Dict[str, Any]]:
+        """Export specified tables to CSV, Parquet or Arrow files concurrently, returning per-table results"""
         export_config = self.config_processor.get_export_config()
+        if export_format:
+            export_config['format'] = export_format
         tables_to_export = self._get_export_tables(table_names)
         if not tables_to_export:
             logger.info("No export tables found")
-            return
+            return []
+
+        workers = workers or export_config.get('workers', 4)
+        executor = executor or export_config.get('executor', 'thread')
+        if executor == 'thread':
+            executor_cls = ThreadPoolExecutor
+        elif executor == 'process':
+            executor_cls = ProcessPoolExecutor
+        else:
+            raise ConfigurationError(f"Unknown export executor: {executor}")
+        workers = max(1, min(workers, len(tables_to_export)))
+
+        logger.info(f"Exporting {len(tables_to_export)} tables with {workers} {executor} workers")
+        start = time.perf_counter()
+        results = []
+        pool_kwargs = worker_pool_kwargs() if executor_cls is ProcessPoolExecutor else {}
+        with executor_cls(max_workers=workers, **pool_kwargs) as pool:
+            futures = [pool.submit(self._export_table, table, export_config) for table in tables_to_export]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result['error']:
+                    logger.error(f"Failed to export {result['table']}: {result['error']}")
+                else:
+                    logger.info(f"Completed export of {result['table']}: {result['rows']} rows in {result['seconds']:.2f}s")
 
-        file_processor = FileProcessor(self.db_connector, self.config_processor.get_import_config())
-        for table in tables_to_export:
-            file_processor.export_table(table, export_config)
+        failed = [r['table'] for r in results if r['error']]
+        total_rows = sum(r['rows'] for r in results)
+        logger.info(
+            f"Export completed in {time.perf_counter() - start:.2f}s: {len(results) - len(failed)} tables, "
+            f"{total_rows} rows, {len(failed)} failed{': ' + ', '.join(sorted(failed)) if failed else ''}")
+        return sorted(results, key=lambda r: r['table'])
 
     def list_export_tables(self):
         """Print all available export tables"""
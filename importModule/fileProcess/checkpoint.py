@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from importModule.fileProcess.schema_cache import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Read size while hashing a file's content
+FINGERPRINT_CHUNK_BYTES = 1024 * 1024
+
+
+def content_fingerprint(file_path: Path) -> str:
+    """SHA-256 of the whole file, streamed in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stat_key(file_path: Path) -> List[int]:
+    """Size and modification time; while both are unchanged the stored hash is trusted"""
+    stat = file_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ImportCheckpoint:
+    """Manifest entry for one source file, or one partition of it, in the checkpoint folder.
+
+    The state is rewritten after every commit with the number of source rows read up
+    to that commit, the byte offset and physical line count just past them (delimited
+    files) and the size of the reject file at that point, so a resumed load starts right
+    after the committed rows and truncates rejects written after them.
+    """
+
+    def __init__(self, folder: str, file_path: Path, partition: int = None):
+        self.file_path = Path(file_path)
+        name = self.file_path.name if partition is None else f"{self.file_path.name}.part{partition}"
+        self.path = Path(folder) / f"{name}.json"
+        self.state: Dict[str, Any] = {}
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except FileNotFoundError:
+            self.state = {}
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            self.state = {}
+            return None
+        return self.state
+
+    def save(self, **state):
+        self.state.update(state)
+        write_json_atomic(self.path, self.state)
+
+    def clear(self):
+        """Drop this entry along with any partition entries of the same file"""
+        self.state = {}
+        self.path.unlink(missing_ok=True)
+        for part in self.path.parent.glob(f"{self.path.stem}.part*.json"):
+            part.unlink(missing_ok=True)
+
+    @property
+    def in_progress(self) -> bool:
+        return self.state.get('status') == 'in_progress'
+
+    @property
+    def completed(self) -> bool:
+        return self.state.get('status') == 'completed'
+
+    @property
+    def rows_read(self) -> int:
+        return self.state.get('rows_read', 0)
+
+    def total_rows_read(self) -> int:
+        """rows_read, summed over the partition entries when the file is loaded in partitions"""
+        partitions = self.state.get('partitions') or []
+        if len(partitions) <= 1:
+            return self.rows_read
+        total = 0
+        for index in range(len(partitions)):
+            part = ImportCheckpoint(self.path.parent, self.file_path, index)
+            if part.load() is not None:
+                total += part.rows_read
+        return total
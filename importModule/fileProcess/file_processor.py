@@ -1,96 +1,205 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import logging
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime
+import contextlib
 import csv
-import pyodbc
+import gzip
+import io
+import itertools
+import math
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common.exceptions import ConfigurationError, DatabaseError
+from database.db_connector import DEFAULT_FETCH_SIZE
+from importModule.fileProcess.checkpoint import ImportCheckpoint, content_fingerprint, file_stat_key
+from importModule.fileProcess.loaders import ExecuteManyLoader, create_loader
+from importModule.fileProcess.log_setup import worker_pool_kwargs
+from importModule.fileProcess.metrics import ImportMetrics
+from importModule.fileProcess.readers import (
+    csv_read_options, input_stem, is_parquet, iter_parquet_rows, open_decompressed, parquet_schema, split_input_name
+)
+from importModule.fileProcess.reject_writer import DETAIL_COLUMNS, RejectWriter
+from importModule.fileProcess.schema_cache import SchemaCache, header_fingerprint
+from importModule.fileProcess.writers import EXPORT_FORMAT_SUFFIXES, ColumnarExportWriter
 
 logger = logging.getLogger(__name__)
 
+EXPORT_COMPRESSION_SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Every full match is accepted by int()/float(); anything else falls back to the scalar check.
+# Up to 18 digits converts exactly through int64, so longer integers are range-checked as scalars
+INT_PATTERN = r'\s*[+-]?\d{1,18}\s*'
+FLOAT_PATTERN = r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*'
+
+# Schema inference
+NUMBER_PATTERN = r'^[+-]?(?=\.?\d)(?P<int_digits>\d*)(?:\.(?P<frac_digits>\d*))?(?:[eE](?P<exponent>[+-]?\d+))?$'
+INT_MAX = 2147483647
+DECIMAL_DEFAULT_PRECISION = 18
+DECIMAL_MAX_PRECISION = 38
+DECIMAL_TYPE_PATTERN = r'(?:DECIMAL|NUMERIC)\s*\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\)'
+# Value ranges of the SQL Server integer types; validation rejects cells outside them
+INT_RANGES = {
+    'TINYINT': (0, 255),
+    'SMALLINT': (-2 ** 15, 2 ** 15 - 1),
+    'INT': (-2 ** 31, 2 ** 31 - 1),
+    'BIGINT': (-2 ** 63, 2 ** 63 - 1),
+}
+BIT_WORDS = {'true', 'false'}
+BIT_VALUES = BIT_WORDS | {'0', '1'}
+DATE_SHAPE_PATTERN = r'\d{1,4}[-/]\d{1,2}[-/]\d{1,4}(?:[ T]\d{1,2}:\d{2}:\d{2}(?:\.\d+)?)?'
+DATE_FORMATS = [
+    ('DATE', ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']),
+    ('DATETIME', ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']),
+]
+
+
+def _int_range(col_type: str) -> Tuple[int, int]:
+    return INT_RANGES.get(col_type.split('(')[0].strip().upper(), INT_RANGES['BIGINT'])
+
+
+def _decimal_shape(col_type: str) -> Tuple[int, int]:
+    """(precision, scale) of a DECIMAL/NUMERIC type; SQL Server's (18, 0) when not given"""
+    match = re.search(DECIMAL_TYPE_PATTERN, col_type, re.IGNORECASE)
+    if match is None:
+        return DECIMAL_DEFAULT_PRECISION, 0
+    return int(match.group(1)), int(match.group(2) or 0)
+
+
+def _decimal_fits(value, precision: int, scale: int) -> bool:
+    """Plain number (no exponent, nan or inf) whose digits fit DECIMAL(precision, scale) without rounding"""
+    match = re.fullmatch(NUMBER_PATTERN, str(value).strip())
+    if match is None or match['exponent'] is not None:
+        return False
+    int_digits = match['int_digits'].lstrip('0')
+    frac_digits = (match['frac_digits'] or '').rstrip('0')
+    return len(int_digits) <= precision - scale and len(frac_digits) <= scale
+
 
 class FileProcessor:
     def __init__(self, db_connector, config: Dict[str, Any]):
         self.db_connector = db_connector
         self.config = config
+        # Replaced per file by process_csv_file; read back by the caller after an import
+        self.metrics = ImportMetrics('')
+
+    def _read_sample(self, file_path: Path, read_options: Dict[str, Any]) -> pd.DataFrame:
+        return pd.read_csv(file_path, nrows=self.config.get('scan_rows', 100), **read_options)
 
-    def infer_data_types(self, file_path: str, delimiter: str) -> Dict[str, str]:
+    def infer_data_types(self, file_path: str, delimiter: str = None) -> Dict[str, str]:
         """Infer SQL data types from CSV sample"""
-        scan_rows = self.config.get('scan_rows', 100)
+        read_options = csv_read_options(Path(file_path), self.config.get('encoding', 'utf-8'),
+                                        self.config.get('delimiter', ''))
+        if delimiter:
+            read_options['sep'] = delimiter
+        return self.infer_schema(self._read_sample(file_path, read_options))
+
+    def infer_schema(self, sample: pd.DataFrame) -> Dict[str, str]:
+        """Infer SQL data types from an already-loaded sample of string columns.
+
+        All cells are flattened into one series tagged with their column position, so each
+        candidate type is tested with a handful of vectorized calls no matter how wide the file is.
+        """
         varchar_length = self.config.get('varchar_length', 255)
-
-        df_sample = pd.read_csv(
-                file_path,
-                delimiter=delimiter,
-                nrows=scan_rows,
-                encoding='utf-8',
-                quoting=csv.QUOTE_MINIMAL,
-                dtype=str
-            )
+        columns = list(sample.columns)
+
+        cells = pd.Series(sample.to_numpy(dtype=object).ravel(order='F'))
+        codes = np.repeat(np.arange(len(columns)), len(sample))
+        present = cells.notna().to_numpy()
+        cells = cells[present].astype(str).str.strip()
+        codes = codes[present]
+        nonempty = (cells != '').to_numpy()
+        cells = cells[nonempty].reset_index(drop=True)
+        codes = codes[nonempty]
+
+        lowered = cells.str.lower()
+        parts = cells.str.extract(NUMBER_PATTERN)
+        is_number = parts['int_digits'].notna()
+        is_plain = is_number & parts['exponent'].isna()
+        is_integer = is_plain & parts['frac_digits'].isna()
+        int_len = parts['int_digits'].str.lstrip('0').str.len()
+        magnitude = pd.to_numeric(cells.where(is_integer & (int_len <= 18)), errors='coerce').abs()
+
+        stats = pd.DataFrame({
+            'is_bit': lowered.isin(BIT_VALUES),
+            'is_bit_word': lowered.isin(BIT_WORDS),
+            'is_number': is_number,
+            'is_plain': is_plain,
+            'is_integer': is_integer,
+            'int_len': int_len,
+            'frac_len': parts['frac_digits'].str.len().fillna(0),
+            'magnitude': magnitude,
+            'length': cells.str.len(),
+            'date_shaped': cells.str.fullmatch(DATE_SHAPE_PATTERN),
+        }).groupby(codes).agg({
+            'is_bit': 'all', 'is_bit_word': 'any', 'is_number': 'all', 'is_plain': 'all', 'is_integer': 'all',
+            'int_len': 'max', 'frac_len': 'max', 'magnitude': 'max', 'length': 'max', 'date_shaped': 'all',
+        })
+
+        types = {}
+        for code, row in stats.iterrows():
+            if row['is_bit'] and row['is_bit_word']:
+                types[code] = 'BIT'
+            elif row['is_integer']:
+                if row['int_len'] > 18:
+                    types[code] = 'DECIMAL(38, 0)' if row['int_len'] <= DECIMAL_MAX_PRECISION else 'FLOAT'
+                else:
+                    types[code] = 'BIGINT' if row['magnitude'] > INT_MAX else 'INT'
+            elif row['is_number']:
+                digits = int(row['int_len']) + int(row['frac_len'])
+                if row['is_plain'] and digits <= DECIMAL_MAX_PRECISION:
+                    precision = min(DECIMAL_MAX_PRECISION, max(DECIMAL_DEFAULT_PRECISION, digits))
+                    types[code] = f"DECIMAL({precision}, {int(row['frac_len'])})"
+                else:
+                    types[code] = 'FLOAT'
+
+        # Date formats are tried once each over the cells of the untyped, date-shaped columns
+        date_candidates = [code for code in stats.index[stats['date_shaped']] if code not in types]
+        for col_type, date_formats in DATE_FORMATS:
+            for date_format in date_formats:
+                pending = np.isin(codes, [code for code in date_candidates if code not in types])
+                if not pending.any():
+                    break
+                parsed = pd.to_datetime(cells[pending], format=date_format, errors='coerce').notna()
+                for code, all_parsed in parsed.groupby(codes[pending]).all().items():
+                    if all_parsed:
+                        types[code] = col_type
 
         schema = {}
-
-        for column in df_sample.columns:
-            col_data = df_sample[column].dropna()
-
-            if col_data.empty:
-                schema[column] = f'VARCHAR({varchar_length})'
-                continue
-
-            # Convert to string and clean data
-            col_data = col_data.astype(str).str.strip()
-
-            # Remove empty strings after stripping
-            col_data = col_data[col_data != '']
-
-            if col_data.empty:
+        for code, column in enumerate(columns):
+            if code in types:
+                schema[column] = types[code]
+            elif code in stats.index:
+                # Default to varchar - calculate actual max length
+                schema[column] = f"VARCHAR({min(int(stats.at[code, 'length']) + 10, varchar_length)})"
+            else:
                 schema[column] = f'VARCHAR({varchar_length})'
-                continue
-
-            # Try to convert to numeric types
-            numeric_success = True
-            try:
-                # Try converting the entire series to numeric
-                numeric_series = pd.to_numeric(col_data, errors='coerce')
-                if numeric_series.isna().any():
-                    numeric_success = False
-                else:
-                    # Check if it's integer or float
-                    if all(numeric_series.apply(lambda x: float(x).is_integer())):
-                        schema[column] = 'INT'
-                    else:
-                        schema[column] = 'FLOAT'
-                    continue
-            except (ValueError, TypeError):
-                numeric_success = False
-
-            # Try to convert to datetime with specific format
-            date_success = True
-            try:
-                # Try multiple date formats
-                date_formats = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']
-                for date_format in date_formats:
-                    try:
-                        pd.to_datetime(col_data, format=date_format, errors='raise')
-                        schema[column] = 'DATETIME'
-                        date_success = True
-                        break
-                    except (ValueError, TypeError):
-                        date_success = False
-                        continue
-
-                if date_success:
-                    continue
-            except (ValueError, TypeError):
-                date_success = False
-
-            # Default to varchar - calculate actual max length
-            max_length = col_data.str.len().max()
-            actual_length = min(int(max_length) + 10, varchar_length)  # Add some buffer
-            schema[column] = f'VARCHAR({actual_length})'
-
         return schema
 
+    def _is_valid_value(self, value, col_type: str) -> bool:
+        """Check one cell against its column type"""
+        try:
+            if col_type == 'BIT':
+                return pd.isna(value) or str(value).strip().lower() in BIT_VALUES
+            elif 'INT' in col_type:
+                low, high = _int_range(col_type)
+                return low <= int(value) <= high
+            elif 'DECIMAL' in col_type or 'NUMERIC' in col_type:
+                return pd.isna(value) or _decimal_fits(value, *_decimal_shape(col_type))
+            elif 'FLOAT' in col_type:
+                return pd.isna(value) or math.isfinite(float(value))
+            elif 'DATE' in col_type:
+                pd.to_datetime(value)
+        except (ValueError, TypeError):
+            return False
+        return True
+
     def validate_row(self, row: List, expected_columns: int, schema: Dict[str, str]) -> Tuple[bool, List]:
         """Validate a single row against schema and constraints"""
         # Check column count
@@ -98,122 +207,464 @@ class FileProcessor:
             return False, row
 
         # Check for data type mismatches and empty required values
-        for i, (value, (col_name, col_type)) in enumerate(zip(row, schema.items())):
-            try:
-                if 'INT' in col_type:
-                    int(value)
-                elif 'FLOAT' in col_type:
-                    float(value)
-                elif 'DATETIME' in col_type:
-                    pd.to_datetime(value)
-            except (ValueError, TypeError):
+        for value, col_type in zip(row, schema.values()):
+            if not self._is_valid_value(value, col_type):
                 return False, row
 
         return True, row
 
+    def _column_valid_mask(self, series: pd.Series, col_type: str) -> pd.Series:
+        """Vectorized equivalent of _is_valid_value over a whole column.
+
+        A fast pattern/parse pass accepts the common case; cells it cannot vouch for
+        are re-checked with the scalar rule so accept/reject semantics stay identical.
+        """
+        if col_type == 'BIT':
+            mask = series.isna() | series.str.strip().str.lower().isin(BIT_VALUES)
+        elif 'INT' in col_type:
+            low, high = _int_range(col_type)
+            matched = series.str.fullmatch(INT_PATTERN, na=False)
+            numbers = pd.to_numeric(series.where(matched), errors='coerce')
+            mask = matched & numbers.between(low, high)
+        elif 'DECIMAL' in col_type or 'NUMERIC' in col_type:
+            precision, scale = _decimal_shape(col_type)
+            parts = series.str.strip().str.extract(NUMBER_PATTERN)
+            int_len = parts['int_digits'].str.lstrip('0').str.len()
+            frac_len = parts['frac_digits'].fillna('').str.rstrip('0').str.len()
+            mask = series.isna() | (parts['int_digits'].notna() & parts['exponent'].isna()
+                                    & (int_len <= precision - scale) & (frac_len <= scale))
+        elif 'FLOAT' in col_type:
+            # Exponents can overflow to inf; those cells get the scalar finiteness check
+            mask = series.isna() | (series.str.fullmatch(FLOAT_PATTERN, na=False)
+                                    & ~series.str.contains('[eE]', na=False))
+        elif 'DATE' in col_type:
+            try:
+                parsed = pd.to_datetime(series, format='mixed', errors='coerce')
+                mask = series.isna() | parsed.notna()
+            except (ValueError, TypeError):
+                mask = pd.Series(False, index=series.index)
+        else:
+            return pd.Series(True, index=series.index)
+
+        mask = mask.astype(bool)
+        unsure = ~mask
+        if unsure.any():
+            mask[unsure] = [self._is_valid_value(value, col_type) for value in series[unsure]]
+        return mask
+
+    def split_valid_rows(self, chunk: pd.DataFrame, schema: Dict[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Split a chunk into (valid, rejected) frames, checking each column in one vectorized pass"""
+        valid_mask = pd.Series(True, index=chunk.index)
+        for position, col_type in enumerate(list(schema.values())[:len(chunk.columns)]):
+            valid_mask &= self._column_valid_mask(chunk.iloc[:, position], col_type)
+        return chunk[valid_mask], chunk[~valid_mask]
+
+    def rejection_reasons(self, rejected: pd.DataFrame, schema: Dict[str, str]) -> List[str]:
+        """Describe why each rejected row failed, naming every column that did not validate"""
+        failures = [[] for _ in range(len(rejected))]
+        for position, (col_name, col_type) in enumerate(list(schema.items())[:len(rejected.columns)]):
+            valid = self._column_valid_mask(rejected.iloc[:, position], col_type).to_numpy()
+            for row in np.flatnonzero(~valid):
+                failures[row].append(f"{col_name}: not {col_type}")
+        return ['; '.join(failure) for failure in failures]
+
     def process_csv_file(self, file_path: Path) -> Tuple[int, int]:
-        """Process a single CSV file and return (success_count, error_count)"""
+        """Process a single input file (delimited, optionally compressed, or Parquet) and return (success_count, error_count)"""
         import_config = self.config
 
+        self.metrics = ImportMetrics(file_path.name)
         try:
-            schema = self.infer_data_types(file_path, ',')
-
-            table_name = f"EXPORT_{file_path.stem}"
-
-            if not self.db_connector.table_exists(table_name):
-                self.db_connector.create_table_from_schema(table_name, schema)
-
-            batch_size = import_config.get('batch_size', 1000)
-            fast_executemany = import_config.get('fast_executemany', True)
-
-            chunk_reader = pd.read_csv(
-                file_path,
-                sep=",",
-                chunksize=batch_size,
-                encoding="utf-8",
-                quoting=csv.QUOTE_MINIMAL,
-                dtype=str,
-            )
-
-            total_success = 0
-            total_errors = 0
-
-            reject_file_path = Path(import_config['rejects_folder']) / f"{file_path.stem}_rejects.csv"
-            reject_file_created = False
+            stem = input_stem(file_path)
+            table_name = f"EXPORT_{stem}"
+            reject_file_path = Path(import_config['rejects_folder']) / f"{stem}_rejects.csv"
+            checkpoint = self._open_checkpoint(file_path)
+            if checkpoint is not None and checkpoint.completed:
+                logger.info(f"Skipping {file_path.name}: already imported")
+                return 0, 0
+            resume = checkpoint is not None and checkpoint.in_progress
+
+            self.metrics.count('bytes_read', file_path.stat().st_size)
+            if is_parquet(file_path):
+                total_success, total_errors = self._process_parquet_file(
+                    file_path, table_name, reject_file_path, checkpoint, resume)
+            else:
+                total_success, total_errors = self._process_delimited_file(
+                    file_path, table_name, reject_file_path, checkpoint, resume)
 
-            for chunk_idx, chunk in enumerate(chunk_reader):
-                valid_rows = []
-                invalid_rows = []
+            if checkpoint is not None:
+                checkpoint.save(status='completed', committed_rows=total_success, rejected_rows=total_errors)
+            if import_config.get('move_processed', False):
+                self._move_processed_file(file_path)
 
-                expected_columns = len(chunk.columns)
+            logger.info(f"Completed processing {file_path.name}: {total_success} successful, {total_errors} rejected")
+            return total_success, total_errors
 
-                for row_idx, row in chunk.iterrows():
-                    row_list = row.tolist()
-                    is_valid, validated_row = self.validate_row(row_list, expected_columns, schema)
+        except Exception as e:
+            logger.error(f"Error processing {file_path.name}: {e}")
+            raise
+        finally:
+            self.metrics.finish()
 
-                    if is_valid:
-                        valid_rows.append(validated_row)
-                    else:
-                        invalid_rows.append(validated_row)
+    def _process_delimited_file(self, file_path: Path, table_name: str, reject_file_path: Path,
+                                checkpoint: Optional[ImportCheckpoint], resume: bool) -> Tuple[int, int]:
+        import_config = self.config
+        read_options = csv_read_options(file_path, import_config.get('encoding', 'utf-8'),
+                                        import_config.get('delimiter', ''))
+
+        # A resumed file keeps the partition plan and schema it started with
+        if resume:
+            partitions = [tuple(p) for p in checkpoint.state['partitions']]
+        else:
+            partitions = self._plan_partitions(file_path)
+
+        if len(partitions) > 1:
+            if resume:
+                schema = checkpoint.state['schema']
+            else:
+                schema = self._resolve_schema(file_path, table_name, self._read_sample(file_path, read_options))
+                self._start_checkpoint(checkpoint, schema, partitions)
+            return self._process_partitions(file_path, table_name, schema, partitions, reject_file_path, read_options)
+
+        chunksize = import_config.get('batch_size', 1000)
+        offset = checkpoint.state.get('offset') if resume else None
+        with contextlib.ExitStack() as stack:
+            if offset is not None:
+                schema = checkpoint.state['schema']
+                lines_read = checkpoint.state['lines_read']
+                logger.info(f"Resuming {file_path.name} after {checkpoint.rows_read} rows")
+                # Continue from the byte after the last committed row; the header is behind it
+                source = stack.enter_context(open_decompressed(file_path, read_options['compression']))
+                source.seek(offset)
+                chunks = pd.read_csv(source, header=None, names=list(schema.keys()), chunksize=chunksize,
+                                     **dict(read_options, compression=None))
+                write_header = not self._truncate_rejects(reject_file_path, checkpoint.state.get('reject_bytes', 0))
+                cursor = stack.enter_context(_RecordCursor(file_path, read_options, offset, lines_read))
+                first_line = 1 + lines_read
+            else:
+                chunk_reader = pd.read_csv(file_path, chunksize=chunksize, **read_options)
+                # Infer from the leading chunks and then load them, instead of reading the sample twice
+                with self.metrics.timer('read'):
+                    head_chunks = self._read_head_chunks(chunk_reader, import_config.get('scan_rows', 100))
+                if resume:
+                    # Interrupted before its first commit: start over with the schema it began with
+                    schema = checkpoint.state['schema']
+                else:
+                    sample = pd.concat(head_chunks).head(import_config.get('scan_rows', 100))
+                    schema = self._resolve_schema(file_path, table_name, sample)
+                self._start_checkpoint(checkpoint, schema, partitions)
+                chunks = itertools.chain(head_chunks, chunk_reader)
+                write_header = True
+                cursor = None
+                if checkpoint is not None:
+                    cursor = stack.enter_context(_RecordCursor(file_path, read_options, skip_records=1))
+                first_line = 2
+            return self._load_chunks(
+                file_path.name, table_name, schema, chunks, reject_file_path, write_header=write_header,
+                checkpoint=checkpoint, first_line=first_line, cursor=cursor)
+
+    def _process_parquet_file(self, file_path: Path, table_name: str, reject_file_path: Path,
+                              checkpoint: Optional[ImportCheckpoint], resume: bool) -> Tuple[int, int]:
+        """Load Parquet record batches as rows; the file's own types define the table, so rows skip validation"""
+        skip_rows = 0
+        if resume:
+            schema = checkpoint.state['schema']
+            skip_rows = checkpoint.rows_read
+            logger.info(f"Resuming {file_path.name} after {skip_rows} rows")
+            write_header = not self._truncate_rejects(reject_file_path, checkpoint.state.get('reject_bytes', 0))
+        else:
+            schema = parquet_schema(file_path, self.config.get('varchar_length', 255))
+            self._ensure_table(table_name, schema)
+            self._start_checkpoint(checkpoint, schema, [(0, file_path.stat().st_size)])
+            write_header = True
+        batches = iter_parquet_rows(file_path, self.config.get('batch_size', 1000), skip_rows)
+        return self._load_chunks(
+            file_path.name, table_name, schema, batches, reject_file_path, write_header=write_header,
+            checkpoint=checkpoint, first_line=skip_rows + 1, validate=False)
+
+    def _open_checkpoint(self, file_path: Path) -> Optional[ImportCheckpoint]:
+        """Load the file's manifest entry, discarding it when the file content changed"""
+        checkpoint_folder = self.config.get('checkpoint_folder')
+        if not checkpoint_folder:
+            return None
+        checkpoint = ImportCheckpoint(checkpoint_folder, file_path)
+        stat_key = file_stat_key(file_path)
+        if checkpoint.load() is not None and checkpoint.state.get('stat') == stat_key:
+            # Untouched since the manifest was written; skip re-reading the whole file
+            return checkpoint
+        fingerprint = content_fingerprint(file_path)
+        if checkpoint.state.get('hash') != fingerprint:
+            if checkpoint.state:
+                logger.info(f"{file_path.name} changed since its last import, starting over")
+            checkpoint.clear()
+            checkpoint.state = {'file': file_path.name, 'hash': fingerprint, 'stat': stat_key}
+        elif checkpoint.state:
+            # Same content with a new mtime (e.g. copied again)
+            checkpoint.save(stat=stat_key)
+        return checkpoint
+
+    def _start_checkpoint(self, checkpoint: Optional[ImportCheckpoint], schema: Dict[str, str],
+                          partitions: List[Tuple[int, int]]):
+        if checkpoint is not None:
+            checkpoint.save(status='in_progress', schema=schema, partitions=partitions, rows_read=0,
+                            committed_rows=0, rejected_rows=0, reject_bytes=0)
+
+    def _truncate_rejects(self, reject_file_path: Path, size: int) -> bool:
+        """Cut the reject file back to its size at the last checkpoint; returns whether anything is kept"""
+        if size and reject_file_path.exists():
+            with open(reject_file_path, 'r+b') as f:
+                f.truncate(size)
+            return True
+        reject_file_path.unlink(missing_ok=True)
+        return False
+
+    def _read_head_chunks(self, chunk_reader, scan_rows: int) -> List[pd.DataFrame]:
+        """Pull chunks off the reader until they cover scan_rows rows"""
+        head_chunks, rows = [], 0
+        for chunk in chunk_reader:
+            head_chunks.append(chunk)
+            rows += len(chunk)
+            if rows >= scan_rows:
+                break
+        return head_chunks
+
+    def _ensure_table(self, table_name: str, schema: Dict[str, str]):
+        if not self.db_connector.table_exists(table_name):
+            self.db_connector.create_table_from_schema(table_name, schema)
+
+    def _resolve_schema(self, file_path: Path, table_name: str, sample: pd.DataFrame) -> Dict[str, str]:
+        """Reuse the cached schema for this header unless the sample contradicts it; otherwise infer and create the table"""
+        cache_path = self.config.get('schema_cache')
+        if not cache_path:
+            with self.metrics.timer('infer'):
+                schema = self.infer_schema(sample)
+            self._ensure_table(table_name, schema)
+            return schema
+
+        cache = SchemaCache(cache_path)
+        key = header_fingerprint(file_path, table_name)
+        cached = cache.get(key)
+        if cached is not None and list(cached) == list(sample.columns):
+            _, rejected = self.split_valid_rows(sample, cached)
+            if rejected.empty:
+                logger.info(f"Using cached schema for {file_path.name}")
+                self.metrics.count('schema_cache_hits')
+                return cached
+            with self.metrics.timer('infer'):
+                schema = self.infer_schema(sample)
+            if schema == cached:
+                # The sample only has bad rows; the cached types still hold
+                return cached
+            logger.warning(f"Sample of {file_path.name} contradicts the cached schema, invalidating it")
+            cache.invalidate(key)
+        else:
+            with self.metrics.timer('infer'):
+                schema = self.infer_schema(sample)
+
+        self._ensure_table(table_name, schema)
+        cache.put(key, table_name, schema)
+        return schema
 
-                if valid_rows:
-                    success_count = self._insert_batch(table_name, chunk.columns.tolist(), valid_rows, fast_executemany)
-                    total_success += success_count
+    def _load_chunks(self, label: str, table_name: str, schema: Dict[str, str], chunks,
+                     reject_file_path: Path, write_header: bool,
+                     checkpoint: ImportCheckpoint = None, first_line: int = 2,
+                     validate: bool = True, cursor: '_RecordCursor' = None) -> Tuple[int, int]:
+        """Validate and load a stream of chunks over one loader, returning (success_count, error_count).
+
+        With a checkpoint, counts continue from its state and it is saved after every
+        commit, so a rerun can skip exactly the rows read up to that commit. A cursor over
+        the same source adds the byte offset and physical line count of that point, for
+        delimited files. first_line is the source line of the first row in chunks, used
+        for reject details. With validate=False the chunks are already-typed row lists
+        that are loaded as they are.
+        """
+        import_config = self.config
+        columns = list(schema.keys())
+        loader = create_loader(import_config.get('load_mode', 'executemany'), self.db_connector, table_name,
+                               columns, fast_executemany=import_config.get('fast_executemany', True),
+                               commit_every=import_config.get('commit_every', 1))
+        details = import_config.get('reject_details', False)
+        reject_writer = RejectWriter(reject_file_path, columns, write_header=write_header, details=details)
+        state = checkpoint.state if checkpoint is not None else {}
+        rows_read = state.get('rows_read', 0)
+        base_success = state.get('committed_rows', 0)
+        base_errors = state.get('rejected_rows', 0)
+        chunk_line = first_line
+        cursor_behind = 0
+        commits = 0
+        total_errors = 0
+
+        metrics = self.metrics
+        chunk_iter = iter(chunks)
+        with loader, reject_writer:
+            for chunk_idx in itertools.count():
+                started = time.perf_counter()
+                chunk = next(chunk_iter, None)
+                read_done = time.perf_counter()
+                if chunk is None:
+                    break
+
+                reasons = lines = positions = None
+                if validate:
+                    valid_chunk, invalid_chunk = self.split_valid_rows(chunk, schema)
+                    valid_rows = valid_chunk.to_numpy(dtype=object).tolist()
+                    invalid_rows = invalid_chunk.to_numpy(dtype=object).tolist()
+                    if details:
+                        positions = chunk.index.get_indexer(valid_chunk.index).tolist()
+                        if invalid_rows:
+                            reasons = self.rejection_reasons(invalid_chunk, schema)
+                            lines = (chunk.index.get_indexer(invalid_chunk.index) + chunk_line).tolist()
+                else:
+                    valid_rows, invalid_rows = chunk, []
+                validate_done = time.perf_counter()
+
+                failed = loader.load(valid_rows, positions)
+                insert_done = time.perf_counter()
+                failed_rows = [row for _, row in failed]
+                if failed_rows:
+                    # Rows from a rolled-back batch go to the reject file rather than vanishing
+                    invalid_rows.extend(failed_rows)
+                    if details:
+                        error = loader.failed_batches[-1]['error']
+                        reasons = (reasons or []) + [f"insert failed: {error}"] * len(failed_rows)
+                        lines = (lines or []) + [position + chunk_line for position, _ in failed]
 
                 if invalid_rows:
-                    self._write_rejects(reject_file_path, chunk.columns.tolist(), invalid_rows, not reject_file_created)
-                    reject_file_created = True
+                    reject_writer.write(invalid_rows, reasons, lines)
                     total_errors += len(invalid_rows)
+                reject_done = time.perf_counter()
+
+                rows_read += len(chunk)
+                chunk_line += len(chunk)
+                cursor_behind += len(chunk)
+                if checkpoint is not None and loader.commits != commits:
+                    commits = loader.commits
+                    position = {}
+                    if cursor is not None:
+                        cursor.advance(cursor_behind)
+                        cursor_behind = 0
+                        position = {'offset': cursor.offset, 'lines_read': cursor.lines}
+                    checkpoint.save(
+                        rows_read=rows_read, committed_rows=base_success + loader.committed_rows,
+                        rejected_rows=base_errors + total_errors + loader.lost_rows,
+                        reject_bytes=reject_writer.size(), **position)
+                finished = time.perf_counter()
+
+                timings = {
+                    'read': read_done - started, 'validate': validate_done - read_done,
+                    'insert': insert_done - validate_done, 'reject': reject_done - insert_done,
+                    'checkpoint': finished - reject_done,
+                }
+                for stage, seconds in timings.items():
+                    metrics.add(stage, seconds)
+                if valid_rows:
+                    metrics.insert_latency.observe(timings['insert'] * 1000)
+                valid_count = len(valid_rows) - len(failed_rows)
+                metrics.count('chunks')
+                metrics.count('rows_read', len(chunk))
+                metrics.count('rows_valid', valid_count)
+                metrics.count('rows_rejected', len(invalid_rows))
+                metrics.add_chunk(chunk=chunk_idx + 1, rows=len(chunk), valid=valid_count, invalid=len(invalid_rows),
+                                  **{f"{stage}_s": round(seconds, 5) for stage, seconds in timings.items()})
 
                 logger.info(
-                    f"Processed chunk {chunk_idx + 1} for {file_path.name}: {len(valid_rows)} valid, {len(invalid_rows)} invalid")
-
-            # Move processed file
-            # self._move_processed_file(file_path)
-
-            logger.info(f"Completed processing {file_path.name}: {total_success} successful, {total_errors} rejected")
-            return total_success, total_errors
-
-        except Exception as e:
-            logger.error(f"Error processing {file_path.name}: {e}")
-            return 0, 0
+                    f"Processed chunk {chunk_idx + 1} for {label}: "
+                    f"{valid_count} valid, {len(invalid_rows)} invalid "
+                    f"(read {timings['read']:.3f}s, validate {timings['validate']:.3f}s, "
+                    f"insert {timings['insert']:.3f}s)")
+            closing = time.perf_counter()
+        metrics.add('commit', time.perf_counter() - closing)
+        metrics.count('rows_committed', loader.committed_rows)
+
+        if loader.failed_batches:
+            logger.error(f"{len(loader.failed_batches)} batches failed to insert for {label}")
+        return base_success + loader.committed_rows, base_errors + total_errors + loader.lost_rows
+
+    def _partition_worker_limit(self) -> int:
+        """partition_workers, capped by this file's share of db_concurrency.
+
+        Each partition process opens its own DB connection, so the file workers in
+        flight (file_workers, set by CSVETLProcessor) split the db_concurrency budget.
+        """
+        workers = self.config.get('partition_workers', 4) or os.cpu_count() or 1
+        db_concurrency = self.config.get('db_concurrency', 0)
+        if db_concurrency > 0:
+            workers = min(workers, max(1, db_concurrency // max(1, self.config.get('file_workers', 1))))
+        return workers
+
+    def _plan_partitions(self, file_path: Path) -> List[Tuple[int, int]]:
+        """Split a large file into byte ranges that start and end on row boundaries.
+
+        Returns [(start, end)] offsets of data rows (the header is excluded), or a single
+        range when the file is below partition_size_mb. Boundaries are newlines outside
+        double-quoted fields, so a quoted line break never splits a record.
+        """
+        partition_bytes = self.config.get('partition_size_mb', 0) * 1024 * 1024
+        file_size = file_path.stat().st_size
+        # Compressed streams cannot be entered at a byte offset
+        if partition_bytes <= 0 or file_size < 2 * partition_bytes or split_input_name(file_path)[2]:
+            return [(0, file_size)]
+
+        count = max(1, min(math.ceil(file_size / partition_bytes), self._partition_worker_limit()))
+        if count == 1:
+            return [(0, file_size)]
+
+        with open(file_path, 'rb') as f:
+            f.readline()
+            data_start = f.tell()
+            offsets = [data_start]
+            step = (file_size - data_start) // count
+            # Back up one byte so a target already on a row start is kept
+            targets = [data_start + i * step - 1 for i in range(1, count)]
+            for offset in _row_starts(f, data_start, targets):
+                if offsets[-1] < offset < file_size:
+                    offsets.append(offset)
+        offsets.append(file_size)
+        return list(zip(offsets[:-1], offsets[1:]))
+
+    def _process_partitions(self, file_path: Path, table_name: str, schema: Dict[str, str],
+                            partitions: List[Tuple[int, int]], reject_file_path: Path,
+                            read_options: Dict[str, Any]) -> Tuple[int, int]:
+        """Load byte-range partitions in parallel workers and merge their rejects in source order"""
+        logger.info(f"Splitting {file_path.name} into {len(partitions)} partitions")
+        total_success = total_errors = 0
+        with ProcessPoolExecutor(max_workers=len(partitions), **worker_pool_kwargs()) as executor:
+            futures = [
+                executor.submit(_process_partition, self.db_connector, self.config, file_path, table_name,
+                                schema, index, start, end, read_options)
+                for index, (start, end) in enumerate(partitions)
+            ]
+            part_files = []
+            for index, future in enumerate(futures):
+                success, errors, part_file, part_metrics = future.result()
+                total_success += success
+                total_errors += errors
+                part_files.append(part_file)
+                self.metrics.merge(part_metrics, partition=index)
+
+        # Concatenate partition rejects in partition (source offset) order
+        part_files = [part for part in part_files if part is not None]
+        if part_files:
+            with open(reject_file_path, 'w', newline='', encoding='utf-8') as out:
+                header = list(schema.keys())
+                csv.writer(out).writerow(header + DETAIL_COLUMNS if self.config.get('reject_details') else header)
+                for part in part_files:
+                    with open(part, 'r', newline='', encoding='utf-8') as f:
+                        shutil.copyfileobj(f, out)
+                    part.unlink()
+        if self.config.get('checkpoint_folder'):
+            for index in range(len(partitions)):
+                ImportCheckpoint(self.config['checkpoint_folder'], file_path, index).clear()
+        return total_success, total_errors
 
     def _insert_batch(self, table_name: str, columns: List[str], rows: List[List], fast_executemany: bool) -> int:
-        """Insert a batch of rows into the database"""
+        """Insert and commit a single batch on its own connection"""
         if not rows:
             return 0
 
-        placeholders = ', '.join(['?' for _ in columns])
-        columns_str = ', '.join([f'[{col}]' for col in columns])
-        insert_sql = f"INSERT INTO [{table_name}] ({columns_str}) VALUES ({placeholders})"
-
-        conn = self.db_connector.get_connection()
-        try:
-            cursor = conn.cursor()
-            if fast_executemany:
-                cursor.fast_executemany = True
-
-            cursor.executemany(insert_sql, rows)
-            conn.commit()
-            return len(rows)
-        except pyodbc.Error as e:
-            conn.rollback()
-            logger.error(f"Batch insert failed: {e}")
-            return 0
-        finally:
-            conn.close()
-
-    def _write_rejects(self, reject_file_path: Path, columns: List[str], invalid_rows: List[List], write_header: bool):
-        """Write invalid rows to reject file"""
-        # Ensure rejects directory exists
-        reject_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        mode = 'w' if write_header else 'a'
-        with open(reject_file_path, mode, newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            if write_header:
-                writer.writerow(columns)
-            writer.writerows(invalid_rows)
+        with ExecuteManyLoader(self.db_connector, table_name, columns, fast_executemany) as loader:
+            if loader.load(rows):
+                raise DatabaseError(f"Batch insert into {table_name} failed: {loader.failed_batches[-1]['error']}")
+        return loader.committed_rows
 
     def _move_processed_file(self, file_path: Path):
         """Move processed file to processed folder with timestamp"""
@@ -223,30 +674,266 @@ class FileProcessor:
         processed_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        new_filename = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+        stem = input_stem(file_path)
+        new_filename = f"{stem}_{timestamp}{file_path.name[len(stem):]}"
         new_path = processed_dir / new_filename
 
         file_path.rename(new_path)
         logger.info(f"Moved {file_path.name} to processed folder")
 
-    def export_table(self, table_name: str, export_config: Dict[str, str]):
-        """Export a table to CSV"""
+    def _open_export_file(self, export_path: Path, compression: str):
+        """Open a text handle for the export file, compressing on the fly if requested"""
+        if compression == 'gzip':
+            return gzip.open(export_path, 'wt', newline='', encoding='utf-8')
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ConfigurationError("zstd export compression requires the 'zstandard' package")
+            raw = open(export_path, 'wb')
+            writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+            return io.TextIOWrapper(writer, encoding='utf-8', newline='')
+        return open(export_path, 'w', newline='', encoding='utf-8')
+
+    def export_table(self, table_name: str, export_config: Dict[str, Any]) -> int:
+        """Stream a table to CSV, Parquet or Arrow in cursor batches, returning the number of rows written"""
         try:
-            # Query table data
-            query = f"SELECT * FROM [{table_name}]"
-            df = self.db_connector.execute_query(query)
-
-            if df is not None and not df.empty:
-                # Create export filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                export_filename = f"{table_name}_{timestamp}.csv"
-                export_path = Path(export_config['export_folder']) / export_filename
-
-                # Export to CSV
-                df.to_csv(export_path, index=False, encoding='utf-8')
-                logger.info(f"Exported {table_name} to {export_path}")
+            export_format = export_config.get('format', 'csv')
+            batch_size = export_config.get('batch_size', DEFAULT_FETCH_SIZE)
+            format_suffix = EXPORT_FORMAT_SUFFIXES.get(export_format)
+            if format_suffix is None:
+                raise ConfigurationError(f"Unsupported export format: {export_format}")
+            if export_format == 'csv':
+                compression = export_config.get('compression', 'none')
+                suffix = EXPORT_COMPRESSION_SUFFIXES.get(compression)
+                if suffix is None:
+                    raise ConfigurationError(f"Unsupported export compression: {compression}")
+            else:
+                # Columnar formats compress inside the file
+                suffix = ''
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            export_path = Path(export_config['export_folder']) / f"{table_name}_{timestamp}{format_suffix}{suffix}"
+
+            start = time.perf_counter()
+            total_rows = 0
+            writer = None
+            try:
+                query = f"SELECT * FROM [{table_name}]"
+                for batch in self.db_connector.stream_query(query, batch_size=batch_size):
+                    if writer is None:
+                        # Open lazily so empty tables don't leave empty files behind
+                        writer = self._open_export_writer(export_path, export_format, export_config)
+                    writer.write(batch)
+                    total_rows += len(batch.rows)
+            except Exception:
+                if writer is not None:
+                    writer.close()
+                    export_path.unlink(missing_ok=True)
+                raise
+            if writer is not None:
+                writer.close()
+
+            if total_rows:
+                elapsed = time.perf_counter() - start
+                rate = total_rows / elapsed if elapsed > 0 else float(total_rows)
+                logger.info(f"Exported {table_name} to {export_path}: {total_rows} rows in {elapsed:.2f}s ({rate:.0f} rows/sec)")
             else:
                 logger.warning(f"No data found in table {table_name}")
+            return total_rows
 
         except Exception as e:
-            logger.error(f"Error exporting table {table_name}: {e}")
\ No newline at end of file
+            logger.error(f"Error exporting table {table_name}: {e}")
+            raise
+
+    def _open_export_writer(self, export_path: Path, export_format: str, export_config: Dict[str, Any]):
+        if export_format == 'csv':
+            return _CSVExportWriter(self._open_export_file(export_path, export_config.get('compression', 'none')))
+        return ColumnarExportWriter(export_path, export_format, export_config.get('columnar_compression', 'zstd'))
+
+
+class _CSVExportWriter:
+    """CSV counterpart of ColumnarExportWriter: header from the first batch, then plain rows"""
+
+    def __init__(self, f):
+        self.f = f
+        self.writer = csv.writer(f)
+        self.header_written = False
+
+    def write(self, batch):
+        if not self.header_written:
+            self.writer.writerow(batch.columns)
+            self.header_written = True
+        self.writer.writerows(batch.rows)
+
+    def close(self):
+        self.f.close()
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file"""
+
+    def __init__(self, file_path: Path, start: int, end: int):
+        self._f = open(file_path, 'rb')
+        self._f.seek(start)
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:min(len(buffer), self._remaining)]
+        n = self._f.readinto(view)
+        self._remaining -= n
+        return n
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def _process_partition(db_connector, config: Dict[str, Any], file_path: Path, table_name: str,
+                       schema: Dict[str, str], index: int, start: int, end: int, read_options: Dict[str, Any]):
+    """Worker entry point: load one byte range, writing its rejects to a part file"""
+    processor = FileProcessor(db_connector, config)
+    processor.metrics = ImportMetrics(Path(file_path).name)
+    part_file = Path(config['rejects_folder']) / f"{input_stem(file_path)}_rejects.part{index}.csv"
+
+    checkpoint = None
+    offset, lines_read = start, 0
+    if config.get('checkpoint_folder'):
+        checkpoint = ImportCheckpoint(config['checkpoint_folder'], file_path, index)
+        checkpoint.load()
+        if checkpoint.completed:
+            return (checkpoint.state['committed_rows'], checkpoint.state['rejected_rows'],
+                    part_file if part_file.exists() else None, processor.metrics.to_dict())
+        offset = checkpoint.state.get('offset', start)
+        lines_read = checkpoint.state.get('lines_read', 0)
+    if offset > start:
+        processor._truncate_rejects(part_file, checkpoint.state.get('reject_bytes', 0))
+    else:
+        part_file.unlink(missing_ok=True)
+    first_line = _count_lines(file_path, start) + 1 + lines_read if config.get('reject_details') else 0
+
+    with contextlib.ExitStack() as stack:
+        raw = stack.enter_context(io.BufferedReader(_ByteRangeReader(file_path, offset, end)))
+        cursor = None
+        if checkpoint is not None:
+            cursor = stack.enter_context(_RecordCursor(file_path, read_options, offset, lines_read))
+        chunk_reader = pd.read_csv(
+            raw,
+            header=None,
+            names=list(schema.keys()),
+            chunksize=config.get('batch_size', 1000),
+            **read_options,
+        )
+        success, errors = processor._load_chunks(
+            f"{Path(file_path).name} [partition {index + 1}]", table_name, schema, chunk_reader, part_file,
+            write_header=False, checkpoint=checkpoint, first_line=first_line, cursor=cursor)
+    if checkpoint is not None:
+        checkpoint.save(status='completed', committed_rows=success, rejected_rows=errors)
+    return success, errors, part_file if part_file.exists() else None, processor.metrics.to_dict()
+
+
+class _RecordCursor:
+    """Byte offset and physical line count just past the records read so far.
+
+    Follows a second handle on the source with the csv module, record by record, so
+    quoted line breaks and the blank lines pandas skips are counted the way the chunks
+    were parsed. Offsets are in the decompressed stream for compressed input.
+    """
+
+    def __init__(self, file_path: Path, read_options: Dict[str, Any], offset: int = 0, lines: int = 0,
+                 skip_records: int = 0):
+        self._f = open_decompressed(file_path, read_options.get('compression'))
+        self._f.seek(offset)
+        self.offset = offset
+        self.lines = lines
+        self._reader = csv.reader(self._iter_lines(), delimiter=read_options['sep'])
+        self.advance(skip_records)
+
+    def _iter_lines(self, block_size: int = 1024 * 1024):
+        # Only the quote, delimiter and newline bytes matter, so latin-1 decodes any ASCII-compatible encoding
+        tail = b''
+        for block in iter(lambda: self._f.read(block_size), b''):
+            lines = (tail + block).split(b'\n')
+            tail = lines.pop()
+            for line in lines:
+                self.offset += len(line) + 1
+                self.lines += 1
+                yield line.decode('latin-1') + '\n'
+        if tail:
+            self.offset += len(tail)
+            self.lines += 1
+            yield tail.decode('latin-1')
+
+    def advance(self, records: int):
+        while records > 0:
+            row = next(self._reader, None)
+            if row is None:
+                return
+            # pandas skips empty and whitespace-only lines
+            if len(row) > 1 or (row and row[0].strip()):
+                records -= 1
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _row_starts(f, start: int, targets: List[int], block_size: int = 16 * 1024 * 1024) -> List[int]:
+    """Offset just past the first row-ending newline at or after each target.
+
+    Reads forward from start, tracking whether the position is inside a double-quoted
+    field (an escaped "" toggles twice), so newlines inside quotes are skipped.
+    """
+    result = []
+    pending = iter(sorted(targets))
+    target = next(pending, None)
+    seeking = False
+    in_quotes = False
+    pos = start
+    f.seek(start)
+    while target is not None:
+        block = f.read(block_size)
+        if not block:
+            break
+        i = 0
+        while i < len(block) and target is not None:
+            if not seeking:
+                if target >= pos + len(block):
+                    break
+                t = max(i, target - pos)
+                in_quotes ^= bool(block.count(b'"', i, t) & 1)
+                i, seeking = t, True
+            newline = block.find(b'\n', i)
+            if newline < 0:
+                break
+            in_quotes ^= bool(block.count(b'"', i, newline) & 1)
+            i = newline + 1
+            if not in_quotes:
+                result.append(pos + i)
+                seeking = False
+                target = next(pending, None)
+        in_quotes ^= bool(block.count(b'"', i) & 1)
+        pos += len(block)
+    return result
+
+
+def _count_lines(file_path: Path, end: int, block_size: int = 16 * 1024 * 1024) -> int:
+    """Count newlines before byte offset end"""
+    count = 0
+    with open(file_path, 'rb') as f:
+        while f.tell() < end:
+            block = f.read(min(block_size, end - f.tell()))
+            if not block:
+                break
+            count += block.count(b'\n')
+    return count
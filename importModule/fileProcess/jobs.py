@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from common.exceptions import ConflictError, ResourceNotFoundError
+from importModule.fileProcess.checkpoint import ImportCheckpoint
+from importModule.fileProcess.readers import is_parquet, split_input_name
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+# Listed when the job started but gone from the folder by the time the import ran
+SKIPPED = 'skipped'
+
+# Bytes read from the head of a file to estimate its average row size
+ESTIMATE_SAMPLE_BYTES = 64 * 1024
+
+
+def estimate_rows(file_path: Path) -> Optional[int]:
+    """Estimate data rows from file size and the average length of the first rows.
+
+    Parquet row counts come exactly from the footer. Compressed files return None,
+    since their on-disk size says little about the row count.
+    """
+    try:
+        if is_parquet(file_path):
+            import pyarrow.parquet as pq
+            return pq.ParquetFile(file_path).metadata.num_rows
+        if split_input_name(file_path)[2]:
+            return None
+        size = file_path.stat().st_size
+        with open(file_path, 'rb') as f:
+            header = f.readline()
+            sample = f.read(ESTIMATE_SAMPLE_BYTES)
+    except (OSError, ImportError):
+        return None
+    lines = sample.count(b'\n')
+    if lines == 0:
+        return 1 if sample.strip() else 0
+    if len(sample) < ESTIMATE_SAMPLE_BYTES:
+        # The whole file was read, so this is exact
+        return lines + (0 if sample.endswith(b'\n') else 1)
+    return round((size - len(header)) / (len(sample) / lines))
+
+
+@dataclass
+class FileProgress:
+    filename: str
+    estimated_rows: Optional[int]
+    state: str = PENDING
+    rows_done: int = 0
+    success: int = 0
+    errors: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportJob:
+    id: str
+    input_folder: str
+    state: str = PENDING
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    files: Dict[str, FileProgress] = field(default_factory=dict)
+
+
+class JobRegistry:
+    """In-process registry of import jobs for the API.
+
+    Only one job may run per input folder at a time. Running files report progress
+    from their checkpoint manifests (rows read up to the last commit), so progress is
+    only visible between commits when checkpoints are enabled.
+    """
+
+    def __init__(self, max_finished: int = 100):
+        self.max_finished = max_finished
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ImportJob] = OrderedDict()
+        self._active: Dict[str, str] = {}
+
+    def create(self, input_folder: str, files: List[Path]) -> ImportJob:
+        """Register a job for the folder, or raise ConflictError if one is still pending or running"""
+        folder = str(Path(input_folder).resolve())
+        with self._lock:
+            active_id = self._active.get(folder)
+            if active_id is not None:
+                raise ConflictError(f"Import of {input_folder} is already running as job {active_id}")
+            job = ImportJob(id=uuid.uuid4().hex, input_folder=folder)
+            job.files = {path.name: FileProgress(path.name, estimate_rows(path)) for path in files}
+            self._jobs[job.id] = job
+            self._active[folder] = job.id
+            self._prune()
+        return job
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in (COMPLETED, FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def start(self, job_id: str):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.state = RUNNING
+            job.started_at = time.time()
+            for progress in job.files.values():
+                progress.state = RUNNING
+
+    def file_done(self, job_id: str, filename: str, success: int, errors: int, error: Optional[str] = None):
+        with self._lock:
+            job = self._jobs[job_id]
+            progress = job.files.setdefault(filename, FileProgress(filename, None))
+            progress.state = FAILED if error else COMPLETED
+            progress.success, progress.errors, progress.error = success, errors, error
+            progress.rows_done = success + errors
+
+    def finish(self, job_id: str, error: Optional[str] = None):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.state = FAILED if error else COMPLETED
+            job.error = error
+            job.finished_at = time.time()
+            for progress in job.files.values():
+                if progress.state in (PENDING, RUNNING):
+                    progress.state = SKIPPED
+            self._active.pop(job.input_folder, None)
+            self._prune()
+
+    def get(self, job_id: str) -> ImportJob:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise ResourceNotFoundError(f"Job {job_id} not found")
+        return job
+
+    def list(self) -> List[ImportJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def status(self, job_id: str, checkpoint_folder: str = None) -> Dict[str, Any]:
+        """Job status with per-file progress and throughput"""
+        job = self.get(job_id)
+        with self._lock:
+            files = []
+            for progress in job.files.values():
+                rows_done = progress.rows_done
+                if progress.state == RUNNING and checkpoint_folder:
+                    checkpoint = ImportCheckpoint(checkpoint_folder, Path(job.input_folder) / progress.filename)
+                    if checkpoint.load() is not None:
+                        rows_done = checkpoint.total_rows_read()
+                estimated = progress.estimated_rows
+                files.append({
+                    'file': progress.filename,
+                    'state': progress.state,
+                    'rows_done': rows_done,
+                    'estimated_rows': estimated,
+                    'percent': round(min(100.0, 100.0 * rows_done / estimated), 1) if estimated else None,
+                    'success': progress.success,
+                    'errors': progress.errors,
+                    'error': progress.error,
+                })
+            end = job.finished_at or time.time()
+            elapsed = end - job.started_at if job.started_at else 0.0
+            rows_done = sum(f['rows_done'] for f in files)
+            return {
+                'id': job.id,
+                'state': job.state,
+                'input_folder': job.input_folder,
+                'created_at': job.created_at,
+                'started_at': job.started_at,
+                'finished_at': job.finished_at,
+                'error': job.error,
+                'rows_done': rows_done,
+                'rows_per_sec': round(rows_done / elapsed) if elapsed > 0 else None,
+                'files_done': sum(1 for f in files if f['state'] in (COMPLETED, FAILED, SKIPPED)),
+                'files': files,
+            }
@@ -0,0 +1,238 @@
+import logging
+import os
+import tempfile
+import uuid
+from typing import List, Sequence, Tuple
+
+from common.exceptions import ConfigurationError, DatabaseError
+from database.db_connector import format_bcp_row
+
+logger = logging.getLogger(__name__)
+
+
+class ExecuteManyLoader:
+    """Insert validated batches over one connection with a reusable prepared cursor.
+
+    Batches are committed every `commit_every` batches; 0 commits once in close(),
+    which makes the whole file load atomic. A failing batch is rolled back to a
+    savepoint so earlier uncommitted batches stay in the transaction.
+    """
+
+    SAVEPOINT = 'etl_batch'
+
+    def __init__(self, db_connector, table_name: str, columns: List[str],
+                 fast_executemany: bool = True, commit_every: int = 1):
+        self.db_connector = db_connector
+        self.table_name = table_name
+        self.columns = columns
+        self.fast_executemany = fast_executemany
+        self.commit_every = commit_every
+
+        placeholders = ', '.join(['?' for _ in columns])
+        columns_str = ', '.join([f'[{col}]' for col in columns])
+        self.insert_sql = f"INSERT INTO [{table_name}] ({columns_str}) VALUES ({placeholders})"
+
+        self.conn = None
+        self.cursor = None
+        self.batch_index = 0
+        self.commits = 0
+        self.committed_rows = 0
+        self.lost_rows = 0
+        self.failed_batches = []
+        self._pending_rows = 0
+        self._pending_batches = 0
+
+    def open(self):
+        self.conn = self.db_connector.get_connection()
+        self.cursor = self.conn.cursor()
+        if self.fast_executemany:
+            self.cursor.fast_executemany = True
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(commit=exc_type is None)
+
+    def load(self, rows: List[List], positions: Sequence[int] = None) -> List[Tuple[int, List]]:
+        """Insert one batch; returns (position, row) for each of its rows if it failed and was rolled back.
+
+        positions are the rows' source positions, by default their indexes in the batch.
+        """
+        if not rows:
+            return []
+        self.batch_index += 1
+        use_savepoint = self._pending_batches > 0
+        try:
+            if use_savepoint:
+                self.db_connector.savepoint(self.cursor, self.SAVEPOINT)
+            self.cursor.executemany(self.insert_sql, rows)
+        except Exception as e:
+            self._rollback_batch(use_savepoint)
+            logger.error(f"Batch {self.batch_index} insert into {self.table_name} failed, {len(rows)} rows rolled back: {e}")
+            self.failed_batches.append({'batch': self.batch_index, 'rows': len(rows), 'error': str(e)})
+            return list(zip(range(len(rows)) if positions is None else positions, rows))
+
+        self._pending_rows += len(rows)
+        self._pending_batches += 1
+        if self.commit_every and self._pending_batches >= self.commit_every:
+            self.commit()
+        return []
+
+    def _rollback_batch(self, use_savepoint: bool):
+        """Undo the failed batch only, falling back to a full rollback if the savepoint is gone"""
+        if use_savepoint:
+            try:
+                self.db_connector.rollback_to_savepoint(self.cursor, self.SAVEPOINT)
+                return
+            except Exception as e:
+                logger.error(f"Rollback to savepoint failed, rolling back the open transaction: {e}")
+        try:
+            self.conn.rollback()
+        except Exception as e:
+            raise DatabaseError(f"Rollback failed while loading {self.table_name}: {e}")
+        if self._pending_rows:
+            logger.error(f"{self._pending_rows} uncommitted rows in {self.table_name} were lost with the transaction")
+            self.lost_rows += self._pending_rows
+        self._pending_rows = 0
+        self._pending_batches = 0
+
+    def commit(self):
+        if not self._pending_batches:
+            return
+        try:
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"Commit of {self._pending_rows} rows into {self.table_name} failed: {e}")
+            self.lost_rows += self._pending_rows
+            self._pending_rows = 0
+            self._pending_batches = 0
+            raise DatabaseError(f"Commit failed while loading {self.table_name}: {e}")
+        self.commits += 1
+        self.committed_rows += self._pending_rows
+        self._pending_rows = 0
+        self._pending_batches = 0
+
+    def close(self, commit: bool = True):
+        """Commit outstanding batches (or roll them back) and return the connection"""
+        if self.conn is None:
+            return
+        try:
+            if commit:
+                self.commit()
+            elif self._pending_rows:
+                self.lost_rows += self._pending_rows
+                self.conn.rollback()
+        finally:
+            self.conn.close()
+            self.conn = None
+            self.cursor = None
+
+
+class StagingTableLoader:
+    """Bulk-load a file through a staging table, then merge it into the target in one step.
+
+    Batches are appended to one bcp data file, which close() loads into the staging
+    table with a single bulk_copy (bcp against SQL Server) before merging. Nothing
+    reaches the target table until then, so a file load is atomic.
+    """
+
+    def __init__(self, db_connector, table_name: str, columns: List[str], **kwargs):
+        self.db_connector = db_connector
+        self.table_name = table_name
+        self.columns = columns
+        # Unique per loader: concurrent loads of one table in a process must not share staging
+        self.staging_table = f"{table_name}_staging_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self.data_path = None
+
+        self.batch_index = 0
+        self.commits = 0
+        self.committed_rows = 0
+        self.lost_rows = 0
+        self.failed_batches = []
+        self._pending_rows = 0
+        self._data_file = None
+        self._open = False
+
+    def open(self):
+        self.db_connector.create_staging_table(self.table_name, self.staging_table)
+        fd, self.data_path = tempfile.mkstemp(prefix='bcp_', suffix='.dat')
+        self._data_file = os.fdopen(fd, 'w', encoding='utf-8', newline='')
+        self._open = True
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(commit=exc_type is None)
+
+    def load(self, rows: List[List], positions: Sequence[int] = None) -> List[Tuple[int, List]]:
+        """Append one batch to the data file; returns (position, row) for rows that cannot be written in bcp format"""
+        if not rows:
+            return []
+        self.batch_index += 1
+        failed = []
+        lines = []
+        for position, row in zip(range(len(rows)) if positions is None else positions, rows):
+            line = format_bcp_row(row, len(self.columns))
+            if line is None:
+                failed.append((position, row))
+            else:
+                lines.append(line)
+        self._data_file.write(''.join(lines))
+        self._pending_rows += len(lines)
+        if failed:
+            error = 'value contains a bcp terminator character'
+            logger.error(f"Batch {self.batch_index} for {self.staging_table}: {len(failed)} rows dropped, {error}")
+            self.failed_batches.append({'batch': self.batch_index, 'rows': len(failed), 'error': error})
+        return failed
+
+    def commit(self):
+        """Staged rows are only published by close()"""
+
+    def close(self, commit: bool = True):
+        """Bulk-copy the data file and merge it into the target table (or discard it), then drop the staging table"""
+        if not self._open:
+            return
+        self._open = False
+        self._data_file.close()
+        try:
+            if commit:
+                self._publish()
+            else:
+                self.lost_rows += self._pending_rows
+                self.db_connector.drop_table(self.staging_table)
+        finally:
+            os.remove(self.data_path)
+            self._pending_rows = 0
+
+    def _publish(self):
+        try:
+            if self._pending_rows:
+                self.db_connector.bulk_copy(self.staging_table, self.data_path)
+            self.db_connector.merge_staging(self.staging_table, self.table_name, self.columns)
+        except Exception as e:
+            self.lost_rows += self._pending_rows
+            self.failed_batches.append({'batch': self.batch_index, 'rows': self._pending_rows, 'error': str(e)})
+            self.db_connector.drop_table(self.staging_table)
+            raise DatabaseError(f"Loading staged rows into {self.table_name} failed: {e}")
+        self.commits += 1
+        self.committed_rows += self._pending_rows
+
+
+LOADERS = {
+    'executemany': ExecuteManyLoader,
+    'bulk': StagingTableLoader,
+}
+
+
+def create_loader(load_mode: str, db_connector, table_name: str, columns: List[str],
+                  fast_executemany: bool = True, commit_every: int = 1):
+    """Build the loader for an [IMPORT] load_mode"""
+    try:
+        loader_cls = LOADERS[load_mode]
+    except KeyError:
+        raise ConfigurationError(f"Unknown load_mode: {load_mode} (expected one of {', '.join(LOADERS)})")
+    return loader_cls(db_connector, table_name, columns, fast_executemany=fast_executemany, commit_every=commit_every)
@@ -0,0 +1,107 @@
+import os
+from typing import Any, Dict, Optional
+
+# The ETL log is rotated at LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old files (etl_process.log.1, ...)
+LOG_FILE = 'etl_process.log'
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Block size for scanning backwards from the end of the log
+TAIL_BLOCK_BYTES = 64 * 1024
+
+
+def file_id(path: str) -> Optional[str]:
+    """Identity of the file currently at path; changes when the log is rotated"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_dev}-{stat.st_ino}"
+
+
+def _decode(data: bytes) -> str:
+    return data.decode('utf-8', errors='replace')
+
+
+def tail_lines(path: str, lines: int) -> Dict[str, Any]:
+    """Last `lines` complete lines of the log, reading backwards in blocks from the end.
+
+    Returns the text plus a cursor (byte offset after the last complete line) and the
+    file id, which can be passed to read_from to continue from there.
+    """
+    with open(path, 'rb') as f:
+        fid = _fd_id(f)
+        end = f.seek(0, os.SEEK_END)
+        # Hold back a trailing partial line that is still being written
+        end = _last_line_end(f, end)
+        pos = end
+        data = b''
+        while pos > 0 and data.count(b'\n') <= lines:
+            step = min(TAIL_BLOCK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    kept = data.split(b'\n')[:-1] if data.endswith(b'\n') else data.split(b'\n')
+    if pos > 0 or len(kept) > lines:
+        kept = kept[-lines:] if lines else []
+    text = _decode(b'\n'.join(kept) + b'\n') if kept else ''
+    return {'logs': text, 'cursor': end, 'file_id': fid, 'rotated': False}
+
+
+def read_from(path: str, cursor: int, max_bytes: int, since_file_id: str = None) -> Dict[str, Any]:
+    """Complete lines written after `cursor`, at most max_bytes of them.
+
+    If the log was rotated since the cursor was handed out (since_file_id no longer
+    matches), the rest of the rotated file is returned first when it is still the
+    newest backup, then reading continues at the start of the new log.
+    """
+    current_id = file_id(path)
+    rotated = since_file_id is not None and since_file_id != current_id
+    if rotated:
+        backup = f"{path}.1"
+        if file_id(backup) == since_file_id:
+            chunk = _read_lines(backup, cursor, max_bytes)
+            if chunk['cursor'] < os.path.getsize(backup):
+                # More of the old file is left; keep the client on it
+                return {'logs': _decode(chunk['data']), 'cursor': chunk['cursor'],
+                        'file_id': since_file_id, 'rotated': False}
+            rest = _read_lines(path, 0, max_bytes - len(chunk['data']))
+            return {'logs': _decode(chunk['data'] + rest['data']), 'cursor': rest['cursor'],
+                    'file_id': current_id, 'rotated': True}
+        cursor = 0
+    elif cursor > os.path.getsize(path):
+        # Truncated in place
+        rotated, cursor = True, 0
+    chunk = _read_lines(path, cursor, max_bytes)
+    return {'logs': _decode(chunk['data']), 'cursor': chunk['cursor'], 'file_id': current_id, 'rotated': rotated}
+
+
+def _read_lines(path: str, cursor: int, max_bytes: int) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        f.seek(cursor)
+        data = f.read(max(0, max_bytes))
+    cut = data.rfind(b'\n') + 1
+    if cut == 0 and len(data) >= max_bytes > 0:
+        # A single line longer than max_bytes; return it split rather than stall
+        cut = len(data)
+    data = data[:cut]
+    return {'data': data, 'cursor': cursor + len(data)}
+
+
+def _fd_id(f) -> str:
+    stat = os.fstat(f.fileno())
+    return f"{stat.st_dev}-{stat.st_ino}"
+
+
+def _last_line_end(f, end: int) -> int:
+    """Offset just past the last newline at or before end"""
+    pos = end
+    while pos > 0:
+        step = min(TAIL_BLOCK_BYTES, pos)
+        f.seek(pos - step)
+        block = f.read(step)
+        idx = block.rfind(b'\n')
+        if idx >= 0:
+            return pos - step + idx + 1
+        pos -= step
+    return 0
@@ -0,0 +1,84 @@
+import logging
+import multiprocessing as mp
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+
+from importModule.fileProcess.log_reader import LOG_BACKUP_COUNT, LOG_FILE, LOG_MAX_BYTES
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Queue that this process's log records go to; set in the parent by start_logging
+# and in pool workers by init_worker_logging
+_log_queue = None
+_listener: Optional[QueueListener] = None
+
+
+def start_logging(level: int = logging.INFO) -> QueueListener:
+    """Route this process's logging, and that of its worker pools, through one listener.
+
+    The listener thread is the only writer of the rotating ETL log, so rollover never
+    races another process holding the file open. Call once from the entry point
+    (main.py or the API lifespan), not at import time.
+    """
+    global _log_queue, _listener
+    if _listener is not None:
+        return _listener
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    _log_queue = mp.Queue()
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _route_root_to_queue(_log_queue, level)
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and close the log file"""
+    global _log_queue, _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+    _listener = None
+    _log_queue = None
+
+
+def init_worker_logging(queue, level: int = logging.INFO):
+    """Pool initializer: send this worker's records to the parent's listener"""
+    global _log_queue
+    _log_queue = queue
+    _route_root_to_queue(queue, level)
+
+
+def worker_pool_kwargs() -> Dict[str, Any]:
+    """ProcessPoolExecutor arguments that forward worker logging to this process's listener.
+
+    Empty when logging was never started (tests, benchmarks), so workers keep the
+    default configuration.
+    """
+    if _log_queue is None:
+        return {}
+    return {'initializer': init_worker_logging, 'initargs': (_log_queue,)}
+
+
+def log_queue():
+    return _log_queue
+
+
+def _route_root_to_queue(queue, level: int):
+    root = logging.getLogger()
+    # Drop handlers inherited through fork; the listener owns the real outputs
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(queue))
+    root.setLevel(level)
@@ -0,0 +1,164 @@
+import bisect
+import json
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from importModule.fileProcess.schema_cache import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the insert latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+STAGES = ['read', 'infer', 'validate', 'insert', 'commit', 'reject', 'checkpoint']
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram that can be merged across workers"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, data: Dict[str, Any]):
+        for i, bucket in enumerate(data['buckets']):
+            self.counts[i] += bucket['count']
+        self.count += data['count']
+        self.total_ms += data['total_ms']
+        self.max_ms = max(self.max_ms, data['max_ms'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        bounds = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'buckets': [{'le_ms': bound, 'count': count} for bound, count in zip(bounds, self.counts)],
+        }
+
+
+class ImportMetrics:
+    """Stage timers, counters, per-chunk records and insert latency for one file import.
+
+    Built inside the worker process and shipped back as a plain dict, so partition
+    and file workers can be merged into a run summary by the parent.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.stages = {stage: 0.0 for stage in STAGES}
+        self.counters = {'bytes_read': 0, 'rows_read': 0, 'rows_valid': 0, 'rows_rejected': 0,
+                         'rows_committed': 0, 'chunks': 0, 'schema_cache_hits': 0}
+        self.insert_latency = LatencyHistogram()
+        self.chunks: List[Dict[str, Any]] = []
+        self.started_at = time.time()
+        self.finished_at = None
+
+    @contextmanager
+    def timer(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_chunk(self, **record):
+        self.chunks.append(record)
+
+    def finish(self):
+        self.finished_at = time.time()
+
+    def merge(self, data: Dict[str, Any], **chunk_tags):
+        """Fold a worker's to_dict() output (e.g. one partition) into these metrics"""
+        for stage, seconds in data['stages'].items():
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        for name, value in data['counters'].items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        self.insert_latency.merge(data['insert_latency_ms'])
+        self.chunks.extend(dict(chunk, **chunk_tags) for chunk in data['chunks'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            'file': self.filename,
+            'seconds': round(elapsed, 4),
+            'rows_per_sec': round(self.counters['rows_read'] / elapsed) if elapsed > 0 else None,
+            'stages': {stage: round(seconds, 4) for stage, seconds in self.stages.items()},
+            'counters': dict(self.counters),
+            'insert_latency_ms': self.insert_latency.to_dict(),
+            'chunks': self.chunks,
+        }
+
+
+def summarize_run(kind: str, started_at: float, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run-level summary: per-file metrics plus totals across files"""
+    stages = {stage: 0.0 for stage in STAGES}
+    counters: Dict[str, int] = {}
+    latency = LatencyHistogram()
+    for file_metrics in files:
+        for stage, seconds in file_metrics['stages'].items():
+            stages[stage] = stages.get(stage, 0.0) + seconds
+        for name, value in file_metrics['counters'].items():
+            counters[name] = counters.get(name, 0) + value
+        latency.merge(file_metrics['insert_latency_ms'])
+    elapsed = time.time() - started_at
+    return {
+        'run': f"{kind}_{datetime.fromtimestamp(started_at).strftime('%Y%m%d_%H%M%S_%f')}",
+        'kind': kind,
+        'started_at': datetime.fromtimestamp(started_at).isoformat(timespec='seconds'),
+        'seconds': round(elapsed, 4),
+        'files': len(files),
+        'totals': {
+            'stages': {stage: round(seconds, 4) for stage, seconds in stages.items()},
+            'counters': counters,
+            'rows_per_sec': round(counters.get('rows_read', 0) / elapsed) if elapsed > 0 else None,
+            'insert_latency_ms': latency.to_dict(),
+        },
+        'per_file': files,
+    }
+
+
+def write_run_summary(metrics_folder: str, summary: Dict[str, Any]) -> Optional[Path]:
+    """Save the summary as <run>.json in the metrics folder; failures are logged, never raised"""
+    if not metrics_folder:
+        return None
+    path = Path(metrics_folder) / f"{summary['run']}.json"
+    try:
+        write_json_atomic(path, summary)
+    except OSError as e:
+        logger.error(f"Could not write metrics summary {path}: {e}")
+        return None
+    return path
+
+
+def read_run_summaries(metrics_folder: str, limit: int = 1) -> List[Dict[str, Any]]:
+    """Most recent run summaries, newest first"""
+    folder = Path(metrics_folder)
+    if not metrics_folder or not folder.is_dir():
+        return []
+    paths = sorted(folder.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+    summaries = []
+    for path in paths[:limit]:
+        try:
+            summaries.append(json.loads(path.read_text(encoding='utf-8')))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics file {path}: {e}")
+    return summaries
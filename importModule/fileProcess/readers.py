@@ -0,0 +1,158 @@
+import bz2
+import csv
+import gzip
+import lzma
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from common.exceptions import ConfigurationError
+
+# Delimited formats and the delimiter assumed when sniffing fails
+DELIMITED_SUFFIXES = {'.csv': ',', '.tsv': '\t', '.psv': '|'}
+# Plain text says nothing about the delimiter; only imported with [IMPORT] txt_files = true
+TEXT_SUFFIX = '.txt'
+DEFAULT_DELIMITER = ','
+# Compression suffixes, named as pandas' read_csv compression argument
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+PARQUET_SUFFIXES = {'.parquet', '.pq'}
+SNIFF_DELIMITERS = ',\t|;'
+SNIFF_BYTES = 64 * 1024
+
+
+def split_input_name(file_path: Path) -> Tuple[str, str, Optional[str]]:
+    """Split 'orders.csv.gz' into ('orders', '.csv', 'gzip'); the format is '' for unknown files"""
+    name = Path(file_path).name
+    compression = None
+    suffix = Path(name).suffix.lower()
+    if suffix in COMPRESSION_SUFFIXES:
+        compression = COMPRESSION_SUFFIXES[suffix]
+        name = name[:-len(suffix)]
+        suffix = Path(name).suffix.lower()
+    if suffix in DELIMITED_SUFFIXES or suffix == TEXT_SUFFIX or (suffix in PARQUET_SUFFIXES and compression is None):
+        return name[:-len(suffix)], suffix, compression
+    return name, '', compression
+
+
+def is_input_file(file_path: Path, txt_files: bool = False) -> bool:
+    suffix = split_input_name(file_path)[1]
+    return Path(file_path).is_file() and suffix != '' and (txt_files or suffix != TEXT_SUFFIX)
+
+
+def input_stem(file_path: Path) -> str:
+    """File name without format and compression suffixes, used for table and reject names"""
+    return split_input_name(file_path)[0]
+
+
+def is_parquet(file_path: Path) -> bool:
+    return split_input_name(file_path)[1] in PARQUET_SUFFIXES
+
+
+def open_decompressed(file_path: Path, compression: Optional[str]):
+    """Open a binary stream that decompresses on the fly"""
+    if compression == 'gzip':
+        return gzip.open(file_path, 'rb')
+    if compression == 'bz2':
+        return bz2.open(file_path, 'rb')
+    if compression == 'xz':
+        return lzma.open(file_path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ConfigurationError("Reading .zst input requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'), closefd=True)
+    return open(file_path, 'rb')
+
+
+def sniff_delimiter(file_path: Path, encoding: str = 'utf-8') -> str:
+    """Detect the delimiter from the first rows, falling back to the one the extension implies.
+
+    The fallback is also used when the guess is ambiguous: a delimiter that does not
+    split the header while the extension's does.
+    """
+    _, suffix, compression = split_input_name(file_path)
+    default = DELIMITED_SUFFIXES.get(suffix, DEFAULT_DELIMITER)
+    with open_decompressed(file_path, compression) as f:
+        sample = f.read(SNIFF_BYTES).decode(encoding, errors='ignore')
+    # Only sniff complete lines so a cut-off row does not skew the guess
+    if len(sample) >= SNIFF_BYTES // 2 and '\n' in sample:
+        sample = sample[:sample.rindex('\n')]
+    try:
+        sniffed = csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return default
+    header = sample.split('\n', 1)[0]
+    if sniffed not in header and default in header:
+        return default
+    return sniffed
+
+
+def resolve_delimiter(file_path: Path, delimiter: str = '', encoding: str = 'utf-8') -> str:
+    """The configured delimiter, else the sniffed one"""
+    if delimiter:
+        return delimiter
+    return sniff_delimiter(file_path, encoding)
+
+
+def csv_read_options(file_path: Path, encoding: str = 'utf-8', delimiter: str = '') -> Dict:
+    """pandas read_csv arguments for a delimited input file"""
+    compression = split_input_name(file_path)[2]
+    return {
+        'sep': resolve_delimiter(file_path, delimiter, encoding),
+        'compression': compression,
+        'encoding': encoding,
+        'quoting': csv.QUOTE_MINIMAL,
+        'dtype': str,
+    }
+
+
+def _pyarrow_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ConfigurationError("Reading Parquet input requires the 'pyarrow' package")
+    return pq
+
+
+def arrow_type_to_sql(arrow_type, varchar_length: int = 255) -> str:
+    """Map an Arrow column type to the SQL Server type used for its target column"""
+    import pyarrow.types as pt
+
+    if pt.is_boolean(arrow_type):
+        return 'BIT'
+    if pt.is_int8(arrow_type) or pt.is_int16(arrow_type) or pt.is_int32(arrow_type) \
+            or pt.is_uint8(arrow_type) or pt.is_uint16(arrow_type):
+        return 'INT'
+    if pt.is_integer(arrow_type):
+        return 'BIGINT'
+    if pt.is_floating(arrow_type):
+        return 'FLOAT'
+    if pt.is_decimal(arrow_type):
+        return f'DECIMAL({min(arrow_type.precision, 38)}, {arrow_type.scale})'
+    if pt.is_date(arrow_type):
+        return 'DATE'
+    if pt.is_timestamp(arrow_type):
+        return 'DATETIME'
+    if pt.is_binary(arrow_type) or pt.is_large_binary(arrow_type) or pt.is_fixed_size_binary(arrow_type):
+        return 'VARBINARY(MAX)'
+    return f'VARCHAR({varchar_length})'
+
+
+def parquet_schema(file_path: Path, varchar_length: int = 255) -> Dict[str, str]:
+    """SQL schema from the Parquet file's own column types; no sampling needed"""
+    arrow_schema = _pyarrow_parquet().read_schema(file_path)
+    return {field.name: arrow_type_to_sql(field.type, varchar_length) for field in arrow_schema}
+
+
+def iter_parquet_rows(file_path: Path, batch_size: int, skip_rows: int = 0) -> Iterator[List[List]]:
+    """Yield row lists batch by batch, converting Arrow columns straight to Python values"""
+    parquet_file = _pyarrow_parquet().ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        if skip_rows >= batch.num_rows:
+            skip_rows -= batch.num_rows
+            continue
+        if skip_rows:
+            batch = batch.slice(skip_rows)
+            skip_rows = 0
+        columns = [column.to_pylist() for column in batch.columns]
+        yield [list(row) for row in zip(*columns)]
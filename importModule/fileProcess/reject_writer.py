@@ -0,0 +1,69 @@
+import csv
+from pathlib import Path
+from typing import List, Optional
+
+# Extra columns appended to each rejected row when details are enabled
+DETAIL_COLUMNS = ['_reject_reason', '_source_line']
+
+
+class RejectWriter:
+    """Buffered CSV writer that keeps one reject file open for a whole load.
+
+    The file is created on the first rejected row, so clean loads leave no file
+    behind. With write_header=False rows are appended to an existing file (a resumed
+    or partition load). With details=True every row gets the reject reason and its
+    source line number as two extra columns.
+    """
+
+    def __init__(self, path: Path, columns: List[str], write_header: bool = True, details: bool = False,
+                 buffer_size: int = 1024 * 1024):
+        self.path = Path(path)
+        self.columns = columns
+        self.write_header = write_header
+        self.details = details
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w' if self.write_header else 'a', newline='', encoding='utf-8',
+                          buffering=self.buffer_size)
+        self._writer = csv.writer(self._file)
+        if self.write_header:
+            self._writer.writerow(self.columns + DETAIL_COLUMNS if self.details else self.columns)
+
+    def write(self, rows: List[List], reasons: Optional[List[str]] = None, lines: Optional[List[int]] = None):
+        """Buffer rejected rows; reasons and lines are only used when details are enabled"""
+        if not rows:
+            return
+        if self._file is None:
+            self._open()
+        if self.details:
+            reasons = reasons or [''] * len(rows)
+            lines = lines or [''] * len(rows)
+            rows = [list(row) + [reason, line] for row, reason, line in zip(rows, reasons, lines)]
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+
+    def size(self) -> int:
+        """Flush and return the file size, i.e. the offset a resumed load truncates back to"""
+        if self._file is not None:
+            self._file.flush()
+            return self._file.tell()
+        if not self.write_header and self.path.exists():
+            return self.path.stat().st_size
+        return 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def header_fingerprint(file_path: Path, table_name: str) -> str:
+    """Hash the raw header line together with the target table"""
+    with open(file_path, 'rb') as f:
+        header = f.readline().rstrip(b'\r\n')
+    return hashlib.sha256(header + b'\0' + table_name.encode('utf-8')).hexdigest()
+
+
+def write_json_atomic(path: Path, data):
+    """Write JSON through a temp file in the same folder and os.replace it into place"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class SchemaCache:
+    """JSON file of inferred schemas keyed by header fingerprint.
+
+    A hit means the target table was created (or found) with that schema, so the
+    importer can skip both inference and the table lookup. Writers hold an exclusive
+    lock on a `.lock` file next to the cache while they re-read, change and replace
+    it, so concurrent import processes merge their entries. The replace is atomic,
+    so readers never see a partial file and do not need the lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    @contextmanager
+    def _locked(self):
+        """Hold the cache's lock file exclusively, across threads and processes"""
+        lock_path = self.path.with_name(f"{self.path.name}.lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable schema cache {self.path}: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        entry = self._read().get(key)
+        return dict(entry['schema']) if entry else None
+
+    def put(self, key: str, table_name: str, schema: Dict[str, str]):
+        with self._locked():
+            entries = self._read()
+            entries[key] = {'table': table_name, 'schema': schema}
+            write_json_atomic(self.path, entries)
+
+    def invalidate(self, key: str):
+        with self._locked():
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                write_json_atomic(self.path, entries)
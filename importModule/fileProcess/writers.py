@@ -0,0 +1,102 @@
+import datetime
+import decimal
+from pathlib import Path
+
+from common.exceptions import ConfigurationError
+
+EXPORT_FORMAT_SUFFIXES = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+# Arrow IPC files only support these buffer codecs
+ARROW_IPC_CODECS = {'none', 'lz4', 'zstd'}
+PARQUET_CODECS = {'none', 'snappy', 'gzip', 'brotli', 'lz4', 'zstd'}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ConfigurationError("Parquet and Arrow export require the 'pyarrow' package")
+    return pyarrow
+
+
+def arrow_type_for(python_type, values, precision=None, scale=None):
+    """Map a cursor column's Python type to an Arrow type.
+
+    Decimals take precision and scale from the cursor description; without them
+    (drivers that report none) the scale is the largest one in values.
+    """
+    pa = _pyarrow()
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    if python_type is decimal.Decimal:
+        if precision and scale is not None:
+            return pa.decimal128(precision, scale) if precision <= 38 else pa.decimal256(precision, scale)
+        scale = max([-v.as_tuple().exponent for v in values if v is not None and v.is_finite()] + [0])
+        return pa.decimal128(38, min(scale, 38))
+    if python_type is datetime.datetime:
+        return pa.timestamp('us')
+    if python_type is datetime.date:
+        return pa.date32()
+    if python_type is datetime.time:
+        return pa.time64('us')
+    if python_type in (bytes, bytearray):
+        return pa.binary()
+    return pa.string()
+
+
+class ColumnarExportWriter:
+    """Write QueryBatch results to Parquet or Arrow IPC, one row group / record batch per batch.
+
+    The Arrow schema is fixed once from the first batch's cursor description, so memory
+    use is bounded by one batch regardless of table size.
+    """
+
+    def __init__(self, path: Path, export_format: str, compression: str = 'zstd'):
+        if export_format not in ('parquet', 'arrow'):
+            raise ConfigurationError(f"Unsupported columnar export format: {export_format}")
+        codecs = PARQUET_CODECS if export_format == 'parquet' else ARROW_IPC_CODECS
+        if compression not in codecs:
+            raise ConfigurationError(
+                f"Unsupported {export_format} compression: {compression} (expected one of {', '.join(sorted(codecs))})")
+        self.path = Path(path)
+        self.export_format = export_format
+        self.compression = None if compression == 'none' else compression
+        self.schema = None
+        self._writer = None
+        self._sink = None
+
+    def _open(self, batch):
+        pa = _pyarrow()
+        columns = list(zip(*batch.rows))
+        precisions = batch.precisions or [(None, None)] * len(batch.columns)
+        self.schema = pa.schema([
+            pa.field(name, arrow_type_for(python_type, values, precision, scale))
+            for name, python_type, values, (precision, scale) in zip(batch.columns, batch.types, columns, precisions)
+        ])
+        if self.export_format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=self.compression or 'none')
+        else:
+            self._sink = pa.OSFile(str(self.path), 'wb')
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(self._sink, self.schema, options=options)
+
+    def write(self, batch):
+        if self._writer is None:
+            self._open(batch)
+        pa = _pyarrow()
+        columns = list(zip(*batch.rows))
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        record_batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self._writer.write_batch(record_batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
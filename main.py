@@ -1,16 +1,27 @@
 import multiprocessing as mp
 import argparse
+import signal
+import threading
 import time
 
 from importModule.fileProcess.CSVETLProcessor import CSVETLProcessor
+from importModule.fileProcess.log_setup import start_logging, stop_logging
 
 
 def main():
     parser = argparse.ArgumentParser(description='CSV to SQL Server ETL Processor')
     parser.add_argument('--import', dest='do_import', action='store_true', help='Import CSV files from input folder')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and import CSV files as they arrive in the input folder')
     parser.add_argument('--export', nargs='*', metavar='TABLE_NAME', help='Export tables to CSV')
     parser.add_argument('--list-tables', action='store_true', help='List available export tables')
     parser.add_argument('--config', default='config.ini', help='Path to configuration file')
+    parser.add_argument('--workers', type=int, help='Number of concurrent export workers (default: [EXPORT] workers)')
+    parser.add_argument('--load-mode', choices=['executemany', 'bulk'],
+                        help='Import load path (default: [IMPORT] load_mode)')
+    parser.add_argument('--format', dest='export_format', choices=['csv', 'parquet', 'arrow'],
+                        help='Export file format (default: [EXPORT] format)')
+    parser.add_argument('--executor', choices=['thread', 'process'], help='Export worker type (default: [EXPORT] executor)')
 
     args = parser.parse_args()
     processor = CSVETLProcessor(args.config)
@@ -20,9 +31,14 @@ def main():
     elif args.export is not None:
         # If no table names provided, export all
         table_names = args.export if args.export else None
-        processor.export_tables(table_names)
+        processor.export_tables(table_names, workers=args.workers, executor=args.executor,
+                                export_format=args.export_format)
+    elif args.watch:
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        processor.watch(load_mode=args.load_mode, stop_event=stop_event)
     elif args.do_import:
-        processor.import_csv_files()
+        processor.import_csv_files(load_mode=args.load_mode)
     else:
         parser.print_help()
 
@@ -31,6 +47,10 @@ if __name__ == "__main__":
     # Required for multiprocessing on Windows
     start = time.time()
     mp.freeze_support()
-    main()
+    start_logging()
+    try:
+        main()
+    finally:
+        stop_logging()
     end = time.time()
     print("trvalo {:.6f} sec.".format((end - start)))
\ No newline at end of file
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 @dataclass
 class OrderDTO:
@@ -8,3 +9,21 @@ class OrderDTO:
     order_date: datetime
     status: str
     paid: bool
+
+@dataclass
+class OrderDetailRowDTO:
+    """One row of the order details join: an order with its user and one of its lines.
+
+    Line fields are None for an order without items, user fields for a missing user.
+    """
+    order_id: int
+    order_date: datetime
+    status: str
+    paid: bool
+    user_id: Optional[int]
+    user_name: Optional[str]
+    user_email: Optional[str]
+    product_id: Optional[int]
+    product_name: Optional[str]
+    quantity: Optional[int]
+    price_at_order: Optional[float]
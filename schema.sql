@@ -46,6 +46,11 @@ CREATE TABLE orders (
         CHECK (status IN ('new', 'paid', 'shipped', 'cancelled'))
 );
 
+/* Filtered list pages seek on the filter column, then page by id */
+CREATE INDEX IX_orders_status_id ON orders (status, id);
+CREATE INDEX IX_orders_order_date ON orders (order_date);
+CREATE INDEX IX_products_category_id ON products (category_id, id);
+
 /* ORDER_ITEMS (M:N) */
 CREATE TABLE order_items (
     order_id INT NOT NULL,
@@ -33,76 +33,67 @@ class OrderService:
             if qty <= 0:
                 raise ValidationError("Quantity must be greater than zero")
 
-        # 1. Handle User
-        existing_user = self.user_dao.get_by_email(user.email)
-        if existing_user:
-            user_id = existing_user.id
-        else:
-            user_id = self.user_dao.create(user)
+        # One connection and one commit for the whole order; any failure rolls it all back
+        with self.connector.transaction():
+            # 1. Handle User
+            existing_user = self.user_dao.get_by_email(user.email)
+            if existing_user:
+                user_id = existing_user.id
+            else:
+                user_id = self.user_dao.create(user)
 
-        # 2. Create Order
-        new_order = OrderDTO(
-            id=0, # Placeholder
-            user_id=user_id,
-            order_date=datetime.now(),
-            status=status,
-            paid=False
-        )
-        order_id = self.order_dao.create(new_order)
+            # 2. Create Order
+            new_order = OrderDTO(
+                id=0, # Placeholder
+                user_id=user_id,
+                order_date=datetime.now(),
+                status=status,
+                paid=False
+            )
+            order_id = self.order_dao.create(new_order)
+
+            # 3. Create Items
+            self.item_dao.create_many(order_id, items, quantities)
 
-        # 3. Create Items
-        for item, qty in zip(items, quantities):
-            self.item_dao.create(item, order_id, qty)
-            
         return order_id
 
     def get_order_details(self, order_id: int) -> Optional[Dict[str, Any]]:
-        # 1. Get Order
-        order = self.order_dao.get_by_id(order_id)
-        if not order:
-            return None
-            
-        # 2. Get User
-        user = self.user_dao.get_by_id(order.user_id)
-        
-        # 3. Get Items
-        items_dtos = self.item_dao.get_by_order_id(order_id)
-        
-        # 4. Get Products
-        product_ids = [item.product_id for item in items_dtos]
-        products = self.product_dao.get_by_ids(product_ids)
-        product_map = {p.id: p for p in products}
+        return self.get_orders_details([order_id]).get(order_id)
 
-        # 5. Aggregate
-        items = []
-        for item in items_dtos:
-            product = product_map.get(item.product_id)
-            product_name = product.name if product else "Unknown"
-            
-            items.append({
-                "product_id": item.product_id,
-                "product_name": product_name,
-                "quantity": item.quantity,
-                "price": item.price_at_order,
-                "subtotal": item.quantity * item.price_at_order
+    def get_orders_details(self, order_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Details of many orders from one joined query, keyed by order id; missing ids are left out"""
+        details: Dict[int, Dict[str, Any]] = {}
+        for row in self.order_dao.get_detail_rows(order_ids):
+            order = details.get(row.order_id)
+            if order is None:
+                order = details[row.order_id] = {
+                    "order_id": row.order_id,
+                    "order_date": row.order_date,
+                    "status": row.status,
+                    "paid": row.paid,
+                    "user": {
+                        "id": row.user_id,
+                        "name": row.user_name if row.user_id is not None else "Unknown",
+                        "email": row.user_email if row.user_id is not None else "Unknown"
+                    },
+                    "items": []
+                }
+            if row.product_id is None:
+                # Order without lines
+                continue
+            order["items"].append({
+                "product_id": row.product_id,
+                "product_name": row.product_name if row.product_name is not None else "Unknown",
+                "quantity": row.quantity,
+                "price": row.price_at_order,
+                "subtotal": row.quantity * row.price_at_order
             })
-            
-        return {
-            "order_id": order.id,
-            "order_date": order.order_date,
-            "status": order.status,
-            "paid": order.paid,
-            "user": {
-                "id": user.id if user else None,
-                "name": user.name if user else "Unknown",
-                "email": user.email if user else "Unknown"
-            },
-            "items": items
-        }
+        return details
 
     def delete_order_process(self, order_id: int):
-        # 1. Delete Items
-        self.item_dao.delete_by_order_id(order_id)
-        
-        # 2. Delete Order
-        self.order_dao.delete(order_id)
+        with self.connector.transaction():
+            # 1. Delete Items
+            self.item_dao.delete_by_order_id(order_id)
+
+            # 2. Delete Order
+            self.order_dao.delete(order_id)
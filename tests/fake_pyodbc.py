@@ -0,0 +1,138 @@
+"""Minimal in-process stand-in for the pyodbc module.
+
+Enough of the DB-API surface for connector/pool tests to run without an ODBC
+driver manager. Call install() before importing modules that import pyodbc.
+"""
+import sys
+import threading
+
+
+class Error(Exception):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class Cursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.arraysize = 1
+        self.fast_executemany = False
+        self.executed = []
+        self._rows = []
+
+    def execute(self, query, *params):
+        if self.connection.closed:
+            raise OperationalError("Connection is closed")
+        if self.connection.broken:
+            raise OperationalError("Communication link failure")
+        self.executed.append((query, params))
+        self.connection.executed.append((query, params))
+        result = self.connection.results.get(query)
+        if result is not None:
+            columns, rows = result
+            self.description = [(name, str, None, None, None, None, True) for name in columns]
+            self._rows = list(rows)
+        elif query.strip().upper() == "SELECT 1":
+            self.description = [('', int, None, None, None, None, True)]
+            self._rows = [(1,)]
+        else:
+            self.description = None
+            self._rows = []
+        return self
+
+    def executemany(self, query, seq_of_params):
+        for params in seq_of_params:
+            self.execute(query, params)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def nextset(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class Connection:
+    def __init__(self, connection_string, results=None):
+        self.connection_string = connection_string
+        self.results = results if results is not None else {}
+        self.closed = False
+        self.broken = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed = []
+
+    def cursor(self):
+        if self.closed:
+            raise OperationalError("Connection is closed")
+        return Cursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.closed or self.broken:
+            raise OperationalError("Communication link failure")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+# Test controls
+results = {}
+connections = []
+connect_error = None
+_lock = threading.Lock()
+
+
+def connect(connection_string, **kwargs):
+    if connect_error is not None:
+        raise connect_error
+    conn = Connection(connection_string, results)
+    with _lock:
+        connections.append(conn)
+    return conn
+
+
+def reset():
+    """Forget created connections and canned results"""
+    global connect_error
+    results.clear()
+    connections.clear()
+    connect_error = None
+
+
+def install():
+    """Register this module as pyodbc when the real driver cannot be imported"""
+    try:
+        import pyodbc  # noqa: F401
+    except ImportError:
+        sys.modules['pyodbc'] = sys.modules[__name__]
@@ -0,0 +1,200 @@
+import sqlite3
+import pandas as pd
+from typing import Tuple, Optional, Dict, List, Iterator, Union
+import logging
+import threading
+from contextlib import contextmanager
+from common.exceptions import DatabaseError
+from database.db_connector import BCP_FIELD_TERMINATOR, BCP_ROW_TERMINATOR, DEFAULT_FETCH_SIZE, QueryBatch
+
+logger = logging.getLogger(__name__)
+
+
+class _SQLiteCursor(sqlite3.Cursor):
+    # pyodbc-only switch; accepted and ignored so loaders run unchanged
+    fast_executemany = False
+
+
+class _SQLiteConnection(sqlite3.Connection):
+    shared = False
+
+    def cursor(self, factory=_SQLiteCursor):
+        return super().cursor(factory)
+
+    def close(self):
+        # The shared in-memory database lives as long as its connector
+        if not self.shared:
+            super().close()
+
+
+class SQLiteConnector:
+    """Local stand-in for DBConnector backed by sqlite3, for tests and benchmarks only.
+
+    Implements the connector surface used by the DAOs, FileProcessor and the loaders
+    so tests and benchmarks can run without SQL Server. It lives outside the database
+    package so production code can never pick it up. ':memory:' databases share
+    a single connection; file databases open one connection per checkout.
+    """
+
+    def __init__(self, database: str = ':memory:'):
+        self.database = database
+        self._shared = None
+        self._local = threading.local()
+        if database == ':memory:':
+            self._shared = self._connect()
+            self._shared.shared = True
+
+    def _connect(self) -> _SQLiteConnection:
+        return sqlite3.connect(self.database, factory=_SQLiteConnection, check_same_thread=False)
+
+    def __getstate__(self):
+        if self._shared is not None:
+            raise TypeError("In-memory SQLiteConnector cannot be shared across processes")
+        state = self.__dict__.copy()
+        state['_local'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def get_connection(self):
+        return self._shared if self._shared is not None else self._connect()
+
+    def close(self):
+        if self._shared is not None:
+            sqlite3.Connection.close(self._shared)
+            self._shared = None
+
+    def execute_query(self, query: str, params: Tuple = None) -> Optional[pd.DataFrame]:
+        """Execute a query and return results as DataFrame if applicable"""
+        columns, data = self.fetch_rows(query, params)
+        if columns is None:
+            return None
+        return pd.DataFrame.from_records(data, columns=columns) if data else pd.DataFrame(columns=columns)
+
+    def fetch_rows(self, query: str, params: Tuple = None) -> Tuple[Optional[List[str]], List[tuple]]:
+        tx_conn = getattr(self._local, 'conn', None)
+        if tx_conn is not None:
+            try:
+                return self._read_result(tx_conn.cursor(), query, params)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Error executing query: {e}")
+        conn = self.get_connection()
+        try:
+            result = self._read_result(conn.cursor(), query, params)
+            conn.commit()
+            return result
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Error executing query: {e}")
+        finally:
+            conn.close()
+
+    def _read_result(self, cursor, query: str, params: Tuple = None) -> Tuple[Optional[List[str]], List[tuple]]:
+        params = tuple(params or ())
+        # The DAOs' SQL Server dialect: "INSERT ...; SELECT SCOPE_IDENTITY() AS id;" and "SELECT TOP (?) ..."
+        if query.rstrip('; ').endswith('SELECT SCOPE_IDENTITY() AS id'):
+            cursor.execute(query[:query.index(';')], params)
+            query, params = "SELECT last_insert_rowid() AS id", ()
+        elif query.startswith('SELECT TOP (?) '):
+            query, params = f"SELECT {query[len('SELECT TOP (?) '):]} LIMIT ?", params[1:] + params[:1]
+        cursor.execute(query, params)
+        if cursor.description:
+            return [column[0] for column in cursor.description], cursor.fetchall()
+        return None, []
+
+    @contextmanager
+    def transaction(self):
+        if getattr(self._local, 'conn', None) is not None:
+            yield
+            return
+        conn = self.get_connection()
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            if isinstance(e, sqlite3.Error):
+                raise DatabaseError(f"Transaction failed: {e}")
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    def stream_query(self, query: str, params: Tuple = None, batch_size: int = DEFAULT_FETCH_SIZE,
+                     as_dataframe: bool = False) -> Iterator[Union[QueryBatch, pd.DataFrame]]:
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = batch_size
+            cursor.execute(query, params or ())
+            if not cursor.description:
+                return
+            columns = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if as_dataframe:
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+                else:
+                    # sqlite3 reports no column types; infer them from the first batch
+                    types = [type(value) if value is not None else str for value in rows[0]]
+                    yield QueryBatch(columns, types, rows)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Error streaming query: {e}")
+        finally:
+            conn.close()
+
+    def savepoint(self, cursor, name: str):
+        cursor.execute(f"SAVEPOINT {name}")
+
+    def rollback_to_savepoint(self, cursor, name: str):
+        cursor.execute(f"ROLLBACK TO {name}")
+
+    def table_exists(self, table_name: str) -> bool:
+        result = self.execute_query("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+        return result.iloc[0, 0] > 0
+
+    def create_table_from_schema(self, table_name: str, schema: Dict[str, str]):
+        columns = [f"[{col_name}] {col_type}" for col_name, col_type in schema.items()]
+        self.execute_query(f"CREATE TABLE [{table_name}] (\n    " + ",\n    ".join(columns) + "\n)")
+
+    def create_staging_table(self, table_name: str, staging_table: str):
+        self.execute_query(f"DROP TABLE IF EXISTS [{staging_table}]")
+        self.execute_query(f"CREATE TABLE [{staging_table}] AS SELECT * FROM [{table_name}] WHERE 0")
+
+    def bulk_copy(self, table_name: str, data_path: str):
+        with open(data_path, encoding='utf-8', newline='') as f:
+            lines = f.read().split(BCP_ROW_TERMINATOR)[:-1]
+        rows = [[value if value != '' else None for value in line.split(BCP_FIELD_TERMINATOR)] for line in lines]
+        if not rows:
+            return
+        placeholders = ', '.join(['?' for _ in rows[0]])
+        conn = self.get_connection()
+        try:
+            conn.executemany(f"INSERT INTO [{table_name}] VALUES ({placeholders})", rows)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Bulk copy into {table_name} failed: {e}")
+        finally:
+            conn.close()
+
+    def merge_staging(self, staging_table: str, table_name: str, columns: List[str]):
+        columns_str = ', '.join([f'[{col}]' for col in columns])
+        conn = self.get_connection()
+        try:
+            conn.execute(f"INSERT INTO [{table_name}] ({columns_str}) SELECT {columns_str} FROM [{staging_table}]")
+            conn.execute(f"DROP TABLE [{staging_table}]")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Merging {staging_table} into {table_name} failed: {e}")
+        finally:
+            conn.close()
+
+    def drop_table(self, table_name: str):
+        self.execute_query(f"DROP TABLE IF EXISTS [{table_name}]")
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from config.config_processor import ConfigProcessor
@@ -67,5 +69,45 @@ class TestConfigProcessor(unittest.TestCase):
             ConfigProcessor()
         self.assertIn("Missing required database configuration: server", str(cm.exception))
 
+    def test_reload_if_modified(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.ini')
+            with open(path, 'w') as f:
+                f.write("[DATABASE]\nserver = first\ndatabase = db\ndriver = drv\n")
+            config = ConfigProcessor(path)
+            self.assertFalse(config.reload_if_modified())
+
+            with open(path, 'w') as f:
+                f.write("[DATABASE]\nserver = second\ndatabase = db\ndriver = drv\n")
+            os.utime(path, (config.mtime + 10, config.mtime + 10))
+
+            self.assertTrue(config.reload_if_modified())
+            self.assertEqual(config.get_database_config()['server'], 'second')
+
+    def test_reload_keeps_previous_config_when_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.ini')
+            with open(path, 'w') as f:
+                f.write("[DATABASE]\nserver = first\ndatabase = db\ndriver = drv\n")
+            config = ConfigProcessor(path)
+
+            with open(path, 'w') as f:
+                f.write("[DATABASE]\nserver =\ndatabase = db\ndriver = drv\n")
+            os.utime(path, (config.mtime + 10, config.mtime + 10))
+
+            with self.assertRaises(ConfigurationError):
+                config.reload_if_modified()
+            self.assertEqual(config.get_database_config()['server'], 'first')
+            # Still broken: checked again rather than treated as loaded
+            with self.assertRaises(ConfigurationError):
+                config.reload_if_modified()
+
+            # A fix written with the same mtime as the broken file is still picked up
+            with open(path, 'w') as f:
+                f.write("[DATABASE]\nserver = second\ndatabase = db\ndriver = drv\n")
+            os.utime(path, (config.mtime + 10, config.mtime + 10))
+            self.assertTrue(config.reload_if_modified())
+            self.assertEqual(config.get_database_config()['server'], 'second')
+
 if __name__ == '__main__':
     unittest.main()
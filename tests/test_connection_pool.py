@@ -0,0 +1,107 @@
+import pickle
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from database.db_connector import DBConnector, ConnectionPool
+from common.exceptions import DatabaseError
+
+
+class StubConfig:
+    """Picklable stand-in for ConfigProcessor"""
+
+    def get_database_config(self):
+        return {
+            'driver': 'SQL Driver', 'server': 'localhost', 'database': 'test_db',
+            'username': 'user', 'password': 'password', 'trusted_connection': 'yes', 'encrypt': 'no'
+        }
+
+    def get_pool_config(self):
+        return {'min_size': 1, 'max_size': 2, 'timeout': 1.0, 'idle_timeout': 300.0, 'pre_ping': True}
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        fake_pyodbc.reset()
+        patcher = patch('database.db_connector.pyodbc', fake_pyodbc)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_connection_is_reused(self):
+        pool = ConnectionPool("DSN=test", min_size=0, max_size=2)
+        conn = pool.acquire()
+        conn.close()
+        conn = pool.acquire()
+        conn.close()
+
+        self.assertEqual(len(fake_pyodbc.connections), 1)
+        self.assertEqual(pool.stats()['checkouts'], 2)
+        self.assertEqual(pool.stats()['in_use'], 0)
+
+    def test_checkout_timeout(self):
+        pool = ConnectionPool("DSN=test", max_size=1, timeout=0.05)
+        conn = pool.acquire()
+
+        with self.assertRaises(DatabaseError) as cm:
+            pool.acquire()
+        self.assertIn("Timed out", str(cm.exception))
+        self.assertEqual(pool.stats()['timeouts'], 1)
+        conn.close()
+
+    def test_waiter_gets_released_connection(self):
+        pool = ConnectionPool("DSN=test", max_size=1, timeout=2.0)
+        conn = pool.acquire()
+        threading.Timer(0.05, conn.close).start()
+
+        second = pool.acquire()
+        second.close()
+
+        stats = pool.stats()
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['total_wait_time'], 0)
+        self.assertEqual(len(fake_pyodbc.connections), 1)
+
+    def test_dead_connection_replaced_on_checkout(self):
+        pool = ConnectionPool("DSN=test", max_size=2)
+        conn = pool.acquire()
+        conn.close()
+        fake_pyodbc.connections[0].closed = True
+
+        conn = pool.acquire()
+        self.assertEqual(len(fake_pyodbc.connections), 2)
+        self.assertEqual(pool.stats()['size'], 1)
+        conn.close()
+
+    def test_idle_connections_evicted_down_to_min_size(self):
+        pool = ConnectionPool("DSN=test", min_size=1, max_size=3, idle_timeout=0.01)
+        conns = [pool.acquire() for _ in range(3)]
+        for conn in conns:
+            conn.close()
+        time.sleep(0.02)
+
+        pool.acquire().close()
+        stats = pool.stats()
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(sum(c.closed for c in fake_pyodbc.connections), 2)
+
+    def test_connector_uses_pool_and_pickles_without_it(self):
+        fake_pyodbc.results["SELECT name FROM t"] = (['name'], [('a',), ('b',)])
+
+        connector = DBConnector(StubConfig())
+        for _ in range(3):
+            df = connector.execute_query("SELECT name FROM t")
+        self.assertEqual(df['name'].tolist(), ['a', 'b'])
+        self.assertEqual(len(fake_pyodbc.connections), 1)
+        self.assertEqual(connector.pool_stats()['in_use'], 0)
+
+        clone = pickle.loads(pickle.dumps(connector))
+        self.assertIsNone(clone._pool)
+        self.assertEqual(clone.connection_string, connector.connection_string)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,17 @@
 import unittest
 from unittest.mock import MagicMock
+from datetime import datetime
+from decimal import Decimal
 import pandas as pd
+from common.exceptions import DatabaseError
+from dao.row_mapper import RowMapper
 from dao.product_dao import ProductDAO
 from dao.order_item_dao import OrderItemDAO
+from dao.order_dao import OrderDAO
+from dao.user_dao import UserDAO
 from models.product import ProductDTO
 from models.order_item import OrderItemDTO
+from models.category import CategoryDTO
 
 class TestDAOs(unittest.TestCase):
     def setUp(self):
@@ -23,6 +30,15 @@ class TestDAOs(unittest.TestCase):
         self.assertIsInstance(product, ProductDTO)
         self.assertEqual(product.name, 'Test Product')
 
+    def test_user_dao_get_by_id(self):
+        self.mock_connector.execute_query.return_value = pd.DataFrame([{
+            'id': 7, 'name': 'Ann', 'email': 'ann@example.com', 'registered_at': None
+        }])
+
+        user = UserDAO(self.mock_connector).get_by_id(7)
+
+        self.assertEqual((user.id, user.name, user.email), (7, 'Ann', 'ann@example.com'))
+
     def test_product_dao_get_by_id_none(self):
         self.mock_connector.execute_query.return_value = pd.DataFrame() # Empty
         
@@ -32,9 +48,9 @@ class TestDAOs(unittest.TestCase):
         self.assertIsNone(product)
 
     def test_order_item_dao_get_by_order_id(self):
-        self.mock_connector.execute_query.return_value = pd.DataFrame([{
-            'order_id': 100, 'product_id': 1, 'quantity': 2, 'price_at_order': 10.0
-        }])
+        self.mock_connector.fetch_rows.return_value = (
+            ['order_id', 'product_id', 'quantity', 'price_at_order'], [(100, 1, 2, Decimal('10.00'))]
+        )
         
         dao = OrderItemDAO(self.mock_connector)
         items = dao.get_by_order_id(100)
@@ -42,6 +58,57 @@ class TestDAOs(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertIsInstance(items[0], OrderItemDTO)
         self.assertEqual(items[0].quantity, 2)
+        self.assertEqual(items[0].price_at_order, 10.0)
+        self.assertIsInstance(items[0].price_at_order, float)
+
+    def test_product_dao_get_all_maps_cursor_rows(self):
+        self.mock_connector.fetch_rows.return_value = (
+            ['id', 'name', 'price', 'category_id', 'active'],
+            [(1, 'A', Decimal('1.50'), 2, 1), (2, 'B', Decimal('3.00'), 2, 0)]
+        )
+
+        products = ProductDAO(self.mock_connector).get_all()
+
+        self.assertEqual(products, [ProductDTO(1, 'A', 1.5, 2, True), ProductDTO(2, 'B', 3.0, 2, False)])
+
+    def test_product_dao_get_all_empty(self):
+        self.mock_connector.fetch_rows.return_value = (['id', 'name', 'price', 'category_id', 'active'], [])
+        self.assertEqual(ProductDAO(self.mock_connector).get_all(), [])
+
+    def test_order_dao_get_page_pushes_filters_into_sql(self):
+        self.mock_connector.fetch_rows.return_value = (['id', 'user_id', 'order_date', 'status', 'paid'], [])
+        OrderDAO(self.mock_connector).get_page(50, after_id=200, status='new', date_to=datetime(2026, 1, 1))
+
+        query, params = self.mock_connector.fetch_rows.call_args[0]
+        self.assertEqual(query, "SELECT TOP (?) id, user_id, order_date, status, paid FROM orders "
+                                "WHERE id > ? AND status = ? AND order_date < ? ORDER BY id")
+        self.assertEqual(params, (50, 200, 'new', datetime(2026, 1, 1)))
+
+    def test_product_dao_get_page_first_page(self):
+        self.mock_connector.fetch_rows.return_value = (['id', 'name', 'price', 'category_id', 'active'], [])
+        ProductDAO(self.mock_connector).get_page(10, active=False)
+
+        query, params = self.mock_connector.fetch_rows.call_args[0]
+        self.assertTrue(query.endswith("FROM products WHERE active = ? ORDER BY id"))
+        self.assertEqual(params, (10, False))
+
+
+class TestRowMapper(unittest.TestCase):
+    def test_maps_by_column_name_and_passes_nulls(self):
+        mapper = RowMapper(OrderItemDTO, quantity=int, price_at_order=float)
+        items = mapper.map(['PRICE_AT_ORDER', 'quantity', 'product_id', 'order_id'], [(None, '3', 7, 1)])
+        self.assertEqual(items, [OrderItemDTO(order_id=1, product_id=7, quantity=3, price_at_order=None)])
+
+    def test_plan_is_cached_per_column_list(self):
+        mapper = RowMapper(CategoryDTO)
+        columns = ['id', 'name']
+        mapper.map(columns, [(1, 'a')])
+        mapper.map(columns, [(2, 'b')])
+        self.assertEqual(len(mapper._plans), 1)
+
+    def test_missing_column_raises(self):
+        with self.assertRaises(DatabaseError):
+            RowMapper(CategoryDTO).map(['id'], [(1,)])
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,13 @@ class TestDBConnector(unittest.TestCase):
             'trusted_connection': 'yes',
             'encrypt': 'no'
         }
+        self.mock_config.get_pool_config.return_value = {
+            'min_size': 1,
+            'max_size': 5,
+            'timeout': 1.0,
+            'idle_timeout': 300.0,
+            'pre_ping': True
+        }
 
     @patch('database.db_connector.pyodbc.connect')
     def test_get_connection_success(self, mock_connect):
@@ -61,5 +68,69 @@ class TestDBConnector(unittest.TestCase):
         with self.assertRaises(DatabaseError):
             connector.execute_query("SELECT * FROM table")
 
+    @patch('database.db_connector.pyodbc.connect')
+    def test_stream_query_batches(self, mock_connect):
+        connector = DBConnector(self.mock_config)
+
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('id', int, None, 10, 10, 0, False), ('name', str, None, 50, 50, 0, True)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], [(3, 'c')], []]
+        mock_connect.return_value.cursor.return_value = mock_cursor
+
+        batches = list(connector.stream_query("SELECT * FROM table", batch_size=2))
+
+        self.assertEqual(mock_cursor.arraysize, 2)
+        self.assertEqual([len(b.rows) for b in batches], [2, 1])
+        self.assertEqual(batches[0].columns, ['id', 'name'])
+        self.assertEqual(batches[1].rows, [(3, 'c')])
+        self.assertEqual(batches[0].precisions, [(10, 0), (50, 0)])
+        self.assertEqual(connector.pool_stats()['in_use'], 0)
+
+    @patch('database.db_connector.pyodbc.connect')
+    def test_stream_query_dataframe_chunks(self, mock_connect):
+        connector = DBConnector(self.mock_config)
+
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('id', int, None, 10, 10, 0, False)]
+        mock_cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+        mock_connect.return_value.cursor.return_value = mock_cursor
+
+        chunks = list(connector.stream_query("SELECT id FROM table", as_dataframe=True))
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0]['id'].tolist(), [1, 2])
+
+    @patch('database.db_connector.subprocess.run')
+    def test_bulk_copy_keeps_password_off_command_line(self, mock_run):
+        self.mock_config.get_database_config.return_value['trusted_connection'] = 'no'
+        mock_run.return_value = MagicMock(returncode=0, stdout='Error in a column name', stderr='')
+        connector = DBConnector(self.mock_config)
+
+        connector.bulk_copy('t_staging', '/tmp/data.dat')
+
+        command = mock_run.call_args.args[0]
+        self.assertNotIn('-P', command)
+        self.assertNotIn('password', command)
+        self.assertEqual(mock_run.call_args.kwargs['env']['SQLCMDPASSWORD'], 'password')
+        self.assertIn('-e', command)
+
+    @patch('database.db_connector.subprocess.run')
+    def test_bulk_copy_fails_on_exit_code_or_rejected_rows(self, mock_run):
+        connector = DBConnector(self.mock_config)
+        mock_run.return_value = MagicMock(returncode=1, stdout='', stderr='login failed')
+        with self.assertRaises(DatabaseError) as cm:
+            connector.bulk_copy('t_staging', '/tmp/data.dat')
+        self.assertIn('login failed', str(cm.exception))
+
+        def reject_row(command, **kwargs):
+            with open(command[command.index('-e') + 1], 'w') as f:
+                f.write('#@ Row 2, Column 1: Invalid character value @#')
+            return MagicMock(returncode=0, stdout='', stderr='')
+        mock_run.side_effect = reject_row
+        with self.assertRaises(DatabaseError) as cm:
+            connector.bulk_copy('t_staging', '/tmp/data.dat')
+        self.assertIn('Row 2', str(cm.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
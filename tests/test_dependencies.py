@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from api import dependencies
+
+
+class TestConnectorReload(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'config.ini')
+        self._write('first')
+        patcher = patch('api.dependencies.DBConnector', side_effect=lambda config: MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config_path = patch('api.dependencies.CONFIG_PATH', self.path)
+        config_path.start()
+        self.addCleanup(config_path.stop)
+        dependencies.init_dependencies(self.path)
+        self.addCleanup(dependencies.close_dependencies)
+
+    def _write(self, server):
+        with open(self.path, 'w') as f:
+            f.write(f"[DATABASE]\nserver = {server}\ndatabase = db\ndriver = drv\n")
+
+    def _touch(self):
+        mtime = os.path.getmtime(self.path) + 10
+        os.utime(self.path, (mtime, mtime))
+
+    def test_reload_waits_for_holders_before_closing(self):
+        with dependencies.use_db_connector() as held:
+            self._write('second')
+            self._touch()
+            with dependencies.use_db_connector() as current:
+                self.assertIsNot(current, held)
+            held.close.assert_not_called()
+        held.close.assert_called_once()
+        current.close.assert_not_called()
+
+    def test_unused_connector_is_closed_on_reload(self):
+        with dependencies.use_db_connector() as first:
+            pass
+        self._write('second')
+        self._touch()
+        with dependencies.use_db_connector() as second:
+            self.assertIsNot(second, first)
+        first.close.assert_called_once()
+
+    def test_reload_swaps_in_a_new_config(self):
+        previous = dependencies.get_config()
+        self._write('second')
+        self._touch()
+
+        current = dependencies.get_config()
+
+        self.assertIsNot(current, previous)
+        self.assertEqual(current.get_database_config()['server'], 'second')
+        self.assertEqual(previous.get_database_config()['server'], 'first')
+
+    def test_invalid_reload_keeps_previous_config(self):
+        previous = dependencies.get_config()
+        self._write('')
+        self._touch()
+
+        self.assertIs(dependencies.get_config(), previous)
+        self.assertEqual(previous.get_database_config()['server'], 'first')
+
+
+if __name__ == '__main__':
+    unittest.main()
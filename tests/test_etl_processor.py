@@ -0,0 +1,183 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import deque
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from config.config_processor import ConfigProcessor
+from tests.sqlite_connector import SQLiteConnector
+from importModule.fileProcess import CSVETLProcessor as etl_module
+from importModule.fileProcess.CSVETLProcessor import CSVETLProcessor, FileImportResult
+from importModule.fileProcess.metrics import read_run_summaries
+
+
+def _crash_once(file_path, import_config, submitted_at):
+    """Watch task that kills its worker process the first time it runs"""
+    crashed = Path(import_config['input_folder']).parent / 'crashed'
+    if not crashed.exists():
+        crashed.touch()
+        os._exit(1)
+    return etl_module._watch_processor._process_file(file_path, import_config, submitted_at)
+
+
+class TestCSVETLProcessorExport(unittest.TestCase):
+    def setUp(self):
+        self.mock_config = MagicMock()
+        self.mock_config.get_export_config.return_value = {
+            'export_folder': 'export', 'batch_size': 100, 'compression': 'none', 'workers': 2, 'executor': 'thread'
+        }
+        self.mock_config.get_import_config.return_value = {'batch_size': 1000}
+        self.processor = CSVETLProcessor(config_processor=self.mock_config, db_connector=MagicMock())
+
+    @patch('importModule.fileProcess.CSVETLProcessor.FileProcessor.export_table')
+    def test_export_tables_reports_failures_without_blocking_others(self, mock_export):
+        def export(table_name, export_config):
+            if table_name == 'EXPORT_bad':
+                raise RuntimeError("boom")
+            return 10
+        mock_export.side_effect = export
+
+        results = self.processor.export_tables(['EXPORT_a', 'EXPORT_bad', 'EXPORT_c'])
+
+        self.assertEqual([r['table'] for r in results], ['EXPORT_a', 'EXPORT_bad', 'EXPORT_c'])
+        self.assertEqual([r['rows'] for r in results], [10, 0, 10])
+        self.assertEqual(results[1]['error'], 'boom')
+        self.assertIsNone(results[0]['error'])
+        self.assertEqual(mock_export.call_count, 3)
+
+
+class TestCSVETLProcessorImport(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        config_path = self.tmp / 'config.ini'
+        config_path.write_text(
+            "[DATABASE]\nserver = local\ndatabase = db\ndriver = drv\n"
+            f"[IMPORT]\ninput_folder = {self.tmp / 'input'}\nprocessed_folder = {self.tmp / 'processed'}\n"
+            f"rejects_folder = {self.tmp / 'rejects'}\nscan_rows = 100\nbatch_size = 2\nvarchar_length = 255\n"
+            "fast_executemany = true\nmax_workers = 2\ndb_concurrency = 4\n"
+            f"[EXPORT]\nexport_folder = {self.tmp / 'export'}\n", encoding='utf-8')
+        (self.tmp / 'input').mkdir()
+        self.connector = SQLiteConnector(str(self.tmp / 'test.db'))
+        self.processor = CSVETLProcessor(config_processor=ConfigProcessor(str(config_path)), db_connector=self.connector)
+
+    def test_worker_count_is_capped(self):
+        import_config = {'max_workers': 0, 'db_concurrency': 3}
+        with patch('importModule.fileProcess.CSVETLProcessor.os.cpu_count', return_value=8):
+            self.assertEqual(self.processor._import_worker_count(import_config, 300), 3)
+            self.assertEqual(self.processor._import_worker_count(import_config, 2), 2)
+            self.assertEqual(self.processor._import_worker_count({'max_workers': 16, 'db_concurrency': 0}, 300), 8)
+
+    def test_import_reports_per_file_timing(self):
+        (self.tmp / 'input' / 'small.csv').write_text("id\n1\n", encoding='utf-8')
+        (self.tmp / 'input' / 'large.csv').write_text("id\n" + "".join(f"{i}\n" for i in range(50)), encoding='utf-8')
+
+        results = self.processor.import_csv_files()
+
+        by_name = {r.filename: r for r in results}
+        self.assertEqual(by_name['large.csv'].success, 50)
+        self.assertEqual(by_name['small.csv'].success, 1)
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertGreaterEqual(result.queue_wait, 0)
+            self.assertGreaterEqual(result.run_time, 0)
+
+    def test_import_writes_run_metrics(self):
+        metrics_folder = self.tmp / 'metrics'
+        self.processor.config_processor.config['IMPORT'].update(metrics_folder=str(metrics_folder), scan_rows='2')
+        (self.tmp / 'input' / 'orders.csv').write_text("id\n1\n2\nx\n4\n5\n", encoding='utf-8')
+
+        [result] = self.processor.import_csv_files()
+
+        self.assertEqual(result.metrics['counters']['rows_read'], 5)
+        [run] = read_run_summaries(str(metrics_folder), limit=5)
+        self.assertEqual(run['kind'], 'import')
+        totals = run['totals']
+        self.assertEqual(totals['counters']['rows_committed'], 4)
+        self.assertEqual(totals['counters']['rows_rejected'], 1)
+        self.assertEqual(totals['counters']['chunks'], 3)
+        self.assertEqual(totals['insert_latency_ms']['count'], 3)
+        self.assertEqual(set(totals['stages']), {'read', 'infer', 'validate', 'insert', 'commit', 'reject', 'checkpoint'})
+        self.assertEqual([c['rows'] for c in run['per_file'][0]['chunks']], [2, 2, 1])
+
+    def test_watch_imports_stable_files_until_stopped(self):
+        metrics_folder = self.tmp / 'metrics'
+        self.processor.config_processor.config['IMPORT'].update(
+            watch_interval='0.05', watch_stable_polls='1', move_processed='true', metrics_folder=str(metrics_folder))
+        stop_event = threading.Event()
+        results = []
+        watcher = threading.Thread(target=lambda: results.extend(self.processor.watch(stop_event=stop_event)))
+        watcher.start()
+        # Wait for each file to be moved out, not on the database: a SQLite read in this process while
+        # the pool forks its workers leaves them with stale lock state ("database is locked")
+        try:
+            (self.tmp / 'input' / 'first.csv').write_text("id\n1\n2\n", encoding='utf-8')
+            self._wait_for(lambda: not (self.tmp / 'input' / 'first.csv').exists())
+            (self.tmp / 'input' / 'second.csv').write_text("id\n3\n", encoding='utf-8')
+            self._wait_for(lambda: not (self.tmp / 'input' / 'second.csv').exists())
+        finally:
+            stop_event.set()
+            watcher.join(timeout=30)
+
+        self.assertFalse(watcher.is_alive())
+        self.assertTrue(self.connector.table_exists('EXPORT_second'))
+        self.assertEqual(sorted((r.filename, r.success) for r in results), [('first.csv', 2), ('second.csv', 1)])
+        self.assertFalse(any('chunks' in r.metrics for r in results))
+        runs = read_run_summaries(str(metrics_folder), limit=5)
+        self.assertEqual(sorted(run['per_file'][0]['file'] for run in runs), ['first.csv', 'second.csv'])
+
+    def test_watch_keeps_recent_results_without_chunks(self):
+        results = deque(maxlen=2)
+        with patch.object(self.processor, '_save_run_metrics') as save:
+            for name in ['a.csv', 'b.csv', 'c.csv']:
+                metrics = {'file': name, 'counters': {}, 'chunks': [{'chunk': 1}]}
+                self.processor._watch_file_done(FileImportResult(name, 1, 0, None, 0.0, 0.1, metrics), {}, results)
+
+        self.assertEqual([r.filename for r in results], ['b.csv', 'c.csv'])
+        self.assertEqual(results[-1].metrics, {'file': 'c.csv', 'counters': {}})
+        self.assertEqual([call.args[3][0].filename for call in save.call_args_list], ['a.csv', 'b.csv', 'c.csv'])
+
+    def test_watch_retries_a_file_after_its_worker_dies(self):
+        self.processor.config_processor.config['IMPORT'].update(
+            watch_interval='0.05', watch_stable_polls='1', move_processed='true')
+        stop_event = threading.Event()
+        results = []
+        with patch.object(etl_module, '_watch_process_file', _crash_once):
+            watcher = threading.Thread(target=lambda: results.extend(self.processor.watch(stop_event=stop_event)))
+            watcher.start()
+            try:
+                (self.tmp / 'input' / 'first.csv').write_text("id\n1\n2\n", encoding='utf-8')
+                self._wait_for(lambda: not (self.tmp / 'input' / 'first.csv').exists())
+            finally:
+                stop_event.set()
+                watcher.join(timeout=30)
+
+        self.assertFalse(watcher.is_alive())
+        self.assertTrue((self.tmp / 'crashed').exists())
+        self.assertEqual([(r.filename, r.success) for r in results], [('first.csv', 2)])
+
+    def test_failed_watch_future_is_forgotten_for_retry(self):
+        future = MagicMock()
+        future.result.side_effect = RuntimeError("worker died")
+        file_path = self.tmp / 'input' / 'a.csv'
+        handled = {file_path: (1, 2)}
+
+        self.assertFalse(self.processor._collect_watch_future(future, file_path, {}, deque(), handled))
+        self.assertEqual(handled, {})
+
+    def _wait_for(self, condition, timeout=30):
+        deadline = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline, "timed out waiting for the watcher")
+            time.sleep(0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
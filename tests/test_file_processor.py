@@ -0,0 +1,451 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from common.exceptions import ConfigurationError
+from database.db_connector import QueryBatch
+from tests.sqlite_connector import SQLiteConnector
+from importModule.fileProcess.checkpoint import content_fingerprint
+from importModule.fileProcess.file_processor import FileProcessor, _row_starts
+
+
+class TestFileProcessorInference(unittest.TestCase):
+    def setUp(self):
+        self.processor = FileProcessor(MagicMock(), {'varchar_length': 255})
+
+    def test_infer_schema_types(self):
+        sample = pd.DataFrame({
+            'int': ['1', '-2', None],
+            'bigint': ['3000000000', '1', '2'],
+            'decimal': ['1.5', '2.25', '3'],
+            'float': ['1e5', '2', '3.5'],
+            'bit': ['true', 'False', '1'],
+            'date': ['2024-01-01', '2024-02-29', None],
+            'datetime': ['2024-01-01 10:00:00', '2024-01-01 11:30:00', '2024-01-02 00:00:00'],
+            'text': ['x', 'yy', 'zzz'],
+            'empty': [None, '', ' '],
+        }, dtype=str)
+
+        self.assertEqual(self.processor.infer_schema(sample), {
+            'int': 'INT',
+            'bigint': 'BIGINT',
+            'decimal': 'DECIMAL(18, 2)',
+            'float': 'FLOAT',
+            'bit': 'BIT',
+            'date': 'DATE',
+            'datetime': 'DATETIME',
+            'text': 'VARCHAR(13)',
+            'empty': 'VARCHAR(255)',
+        })
+
+    def test_new_types_validate(self):
+        chunk = pd.DataFrame({'flag': ['true', 'no', None], 'day': ['2024-01-01', '2024-01-01', 'soon']}, dtype=str)
+
+        valid, rejected = self.processor.split_valid_rows(chunk, {'flag': 'BIT', 'day': 'DATE'})
+
+        self.assertEqual(valid.index.tolist(), [0])
+        self.assertEqual(rejected.index.tolist(), [1, 2])
+
+
+class TestFileProcessorValidation(unittest.TestCase):
+    def setUp(self):
+        self.processor = FileProcessor(MagicMock(), {'batch_size': 1000})
+
+    def test_split_valid_rows_matches_validate_row(self):
+        schema = {'id': 'INT', 'amount': 'FLOAT', 'created': 'DATETIME', 'name': 'VARCHAR(20)'}
+        chunk = pd.DataFrame({
+            'id': ['1', ' 2 ', 'x', '4', None, '1_000', '7'],
+            'amount': ['1.5', 'nan', '2', 'abc', '3', '1e3', None],
+            'created': ['2024-01-01', '01/02/2024', '2024-01-01', '2024-01-01', '2024-01-01', 'NaT', 'never'],
+            'name': ['a', 'b', 'c', 'd', 'e', 'f', 'g'],
+        }, dtype=str)
+
+        valid, rejected = self.processor.split_valid_rows(chunk, schema)
+
+        expected = [self.processor.validate_row(row, 4, schema)[0] for row in chunk.to_numpy(dtype=object).tolist()]
+        self.assertEqual(valid.index.tolist(), [i for i, ok in enumerate(expected) if ok])
+        self.assertEqual(rejected.index.tolist(), [i for i, ok in enumerate(expected) if not ok])
+        self.assertEqual(valid['name'].tolist(), ['a', 'f'])
+
+    def test_numbers_must_fit_the_column_type(self):
+        schema = {'qty': 'SMALLINT', 'price': 'DECIMAL(5, 2)', 'ratio': 'FLOAT'}
+        chunk = pd.DataFrame({
+            'qty': ['1', '32767', '32768', '-40000', '99999999999999999999', '2', '3', '4', '5'],
+            'price': ['1.5', '999.99', '1.25', '1.50', '1.5', '1000', '1.005', '1e2', 'nan'],
+            'ratio': ['0.5', '1e3', '1', '2', '3', '4', '5', '1e400', 'inf'],
+        }, dtype=str)
+
+        valid, rejected = self.processor.split_valid_rows(chunk, schema)
+
+        expected = [self.processor.validate_row(row, 3, schema)[0] for row in chunk.to_numpy(dtype=object).tolist()]
+        self.assertEqual(valid.index.tolist(), [i for i, ok in enumerate(expected) if ok])
+        self.assertEqual(valid.index.tolist(), [0, 1])
+
+
+class TestFileProcessorImport(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.connector = SQLiteConnector(str(self.tmp / 'test.db'))
+        self.config = {
+            'rejects_folder': str(self.tmp / 'rejects'), 'processed_folder': str(self.tmp / 'processed'),
+            'scan_rows': 2, 'batch_size': 2, 'varchar_length': 255, 'fast_executemany': True, 'commit_every': 1
+        }
+        self.csv_path = self.tmp / 'orders.csv'
+        self.csv_path.write_text("id,amount,name\n1,2.5,a\n2,3.5,b\nx,4,c\n4,y,d\n5,6,e\n", encoding='utf-8')
+
+    def _import(self, **overrides):
+        processor = FileProcessor(self.connector, dict(self.config, **overrides))
+        return processor.process_csv_file(self.csv_path)
+
+    def _rows(self):
+        return self.connector.execute_query("SELECT id FROM [EXPORT_orders] ORDER BY id")['id'].tolist()
+
+    def test_import_executemany(self):
+        self.assertEqual(self._import(), (3, 2))
+        self.assertEqual(self._rows(), [1, 2, 5])
+        rejects = (self.tmp / 'rejects' / 'orders_rejects.csv').read_text(encoding='utf-8').splitlines()
+        self.assertEqual(rejects, ['id,amount,name', 'x,4,c', '4,y,d'])
+
+    def test_import_gzip_pipe_delimited(self):
+        gz_path = self.tmp / 'orders.psv.gz'
+        with gzip.open(gz_path, 'wt', encoding='utf-8') as f:
+            f.write("id|amount|name\n1|2.5|a\n2|3.5|b\nx|4|c\n")
+        processor = FileProcessor(self.connector, self.config)
+
+        self.assertEqual(processor.process_csv_file(gz_path), (2, 1))
+        self.assertEqual(self._rows(), [1, 2])
+        self.assertTrue((self.tmp / 'rejects' / 'orders_rejects.csv').exists())
+
+    def test_import_parquet_uses_file_types(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        parquet_path = self.tmp / 'orders.parquet'
+        pq.write_table(pa.table({'id': pa.array([1, 2, 3], pa.int32()), 'name': ['a', None, 'c']}), parquet_path)
+        processor = FileProcessor(self.connector, self.config)
+
+        self.assertEqual(processor.process_csv_file(parquet_path), (3, 0))
+        self.assertEqual(self._rows(), [1, 2, 3])
+        names = self.connector.execute_query("SELECT name FROM [EXPORT_orders] ORDER BY id")['name'].tolist()
+        self.assertEqual(names[0], 'a')
+        self.assertTrue(pd.isna(names[1]))
+
+    def test_reject_details_record_reason_and_source_line(self):
+        self.assertEqual(self._import(reject_details=True), (3, 2))
+
+        with open(self.tmp / 'rejects' / 'orders_rejects.csv', newline='', encoding='utf-8') as f:
+            rejects = list(csv.reader(f))
+        self.assertEqual(rejects, [
+            ['id', 'amount', 'name', '_reject_reason', '_source_line'],
+            ['x', '4', 'c', 'id: not INT', '4'],
+            ['4', 'y', 'd', 'amount: not DECIMAL(18, 1)', '5'],
+        ])
+
+    def test_late_values_overflowing_the_sampled_types_are_rejected(self):
+        self.csv_path.write_text(
+            "id,amount,name\n1,2.5,a\n2,3.5,b\n3,4.25,c\n4,123456789012345678.5,d\n"
+            "5,1e5,e\n6,0.05,f\n7,inf,g\n3000000000,8,h\n9,9.5,i\n", encoding='utf-8')
+
+        self.assertEqual(self._import(reject_details=True), (3, 6))
+        self.assertEqual(self._rows(), [1, 2, 9])
+        with open(self.tmp / 'rejects' / 'orders_rejects.csv', newline='', encoding='utf-8') as f:
+            reasons = [row[3] for row in csv.reader(f)][1:]
+        self.assertEqual(reasons, ['amount: not DECIMAL(18, 1)'] * 5 + ['id: not INT'])
+
+    def test_reject_details_line_up_with_rows_failed_by_the_loader(self):
+        self.csv_path.write_text("id,amount,name\n1,2.5,a\n2,3.5,b\nx,4,c\n4,4.5,d\x1ed\n5,6,e\n", encoding='utf-8')
+
+        self.assertEqual(self._import(load_mode='bulk', batch_size=5, reject_details=True), (3, 2))
+
+        self.assertEqual(self._rows(), [1, 2, 5])
+        with open(self.tmp / 'rejects' / 'orders_rejects.csv', newline='', encoding='utf-8') as f:
+            rejects = list(csv.reader(f))
+        self.assertEqual(rejects[1:], [
+            ['x', '4', 'c', 'id: not INT', '4'],
+            ['4', '4.5', 'd\x1ed', 'insert failed: value contains a bcp terminator character', '5'],
+        ])
+
+    def test_partitioned_reject_lines(self):
+        lines = ["id,name"] + [f"{i},n{i}" if i % 7 else f"bad{i},n{i}" for i in range(1, 201)]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        processor = FileProcessor(self.connector, dict(self.config, scan_rows=5, batch_size=10, reject_details=True,
+                                                       partition_size_mb=0.0005, partition_workers=3))
+
+        processor.process_csv_file(self.csv_path)
+
+        with open(self.tmp / 'rejects' / 'orders_rejects.csv', newline='', encoding='utf-8') as f:
+            rejects = list(csv.reader(f))
+        self.assertEqual(rejects[0][-2:], ['_reject_reason', '_source_line'])
+        self.assertEqual([int(row[-1]) for row in rejects[1:]], [i + 1 for i in range(7, 201, 7)])
+
+    def test_partitioned_import_is_deterministic(self):
+        lines = ["id,name"] + [f"{i},n{i}" if i % 7 else f"bad{i},n{i}" for i in range(1, 201)]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        processor = FileProcessor(self.connector, dict(self.config, scan_rows=5, batch_size=10,
+                                                       partition_size_mb=0.0005, partition_workers=3))
+
+        self.assertEqual(len(processor._plan_partitions(self.csv_path)), 3)
+        success, errors = processor.process_csv_file(self.csv_path)
+
+        self.assertEqual((success, errors), (172, 28))
+        self.assertEqual(self._rows(), [i for i in range(1, 201) if i % 7])
+        rejects = (self.tmp / 'rejects' / 'orders_rejects.csv').read_text(encoding='utf-8').splitlines()
+        self.assertEqual(rejects, ['id,name'] + [f"bad{i},n{i}" for i in range(7, 201, 7)])
+        self.assertEqual(list((self.tmp / 'rejects').glob('*.part*')), [])
+
+    def test_partition_boundaries_skip_quoted_line_breaks(self):
+        lines = ["id,note"] + [f'{i},"first ""{i}""\nsecond\nthird"' for i in range(1, 201)]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        processor = FileProcessor(self.connector, dict(self.config, scan_rows=5, batch_size=10,
+                                                       partition_size_mb=0.001, partition_workers=3))
+
+        partitions = processor._plan_partitions(self.csv_path)
+        data = self.csv_path.read_bytes()
+        self.assertEqual(len(partitions), 3)
+        for start, _ in partitions[1:]:
+            self.assertRegex(data[start:start + 16].decode(), r'^\d+,"first')
+
+        self.assertEqual(processor.process_csv_file(self.csv_path), (200, 0))
+        self.assertEqual(self._rows(), list(range(1, 201)))
+        note = self.connector.execute_query("SELECT note FROM [EXPORT_orders] WHERE id = 150").iloc[0]['note']
+        self.assertEqual(note, 'first "150"\nsecond\nthird')
+
+    def test_row_starts_track_quotes_across_blocks(self):
+        data = b'1,"a\nb"\n2,"c\n\nd"\n3,e\n'
+        path = self.tmp / 'rows.csv'
+        path.write_bytes(data)
+        with open(path, 'rb') as f:
+            self.assertEqual(_row_starts(f, 0, [0, 4, 10], block_size=3), [8, 17, 21])
+
+    def test_partitions_share_db_concurrency_with_file_workers(self):
+        lines = ["id,name"] + [f"{i},n{i}" for i in range(1, 201)]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        config = dict(self.config, partition_size_mb=0.0005, partition_workers=8, db_concurrency=4)
+
+        self.assertEqual(len(FileProcessor(self.connector, dict(config, file_workers=2))._plan_partitions(self.csv_path)), 2)
+        self.assertEqual(FileProcessor(self.connector, dict(config, file_workers=4))._plan_partitions(self.csv_path),
+                         [(0, self.csv_path.stat().st_size)])
+
+    def test_partitioned_import_checkpoints_and_skips_rerun(self):
+        lines = ["id,name"] + [f"{i},n{i}" for i in range(1, 201)]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        checkpoints = self.tmp / 'checkpoints'
+        config = dict(self.config, scan_rows=5, batch_size=10, partition_size_mb=0.0005, partition_workers=3,
+                      checkpoint_folder=str(checkpoints))
+
+        self.assertEqual(FileProcessor(self.connector, config).process_csv_file(self.csv_path), (200, 0))
+        self.assertEqual(FileProcessor(self.connector, config).process_csv_file(self.csv_path), (0, 0))
+        self.assertEqual(len(self._rows()), 200)
+        self.assertEqual([p.name for p in checkpoints.iterdir()], ['orders.csv.json'])
+
+    def test_import_bulk(self):
+        self.assertEqual(self._import(load_mode='bulk'), (3, 2))
+        self.assertEqual(self._rows(), [1, 2, 5])
+
+    def test_resume_after_failure_does_not_duplicate_rows(self):
+        checkpoints = str(self.tmp / 'checkpoints')
+        processor = FileProcessor(self.connector, dict(self.config, checkpoint_folder=checkpoints))
+        split_valid_rows = processor.split_valid_rows
+        calls = []
+
+        def fail_on_third_chunk(chunk, schema):
+            calls.append(chunk)
+            if len(calls) == 3:
+                raise RuntimeError("worker died")
+            return split_valid_rows(chunk, schema)
+
+        processor.split_valid_rows = fail_on_third_chunk
+        with self.assertRaises(RuntimeError):
+            processor.process_csv_file(self.csv_path)
+        self.assertEqual(self._rows(), [1, 2])
+
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (3, 2))
+        self.assertEqual(self._rows(), [1, 2, 5])
+        rejects = (self.tmp / 'rejects' / 'orders_rejects.csv').read_text(encoding='utf-8').splitlines()
+        self.assertEqual(rejects, ['id,amount,name', 'x,4,c', '4,y,d'])
+
+        # Completed files are skipped until their content changes
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (0, 0))
+        self.csv_path.write_text("id,amount,name\n7,1.5,g\n", encoding='utf-8')
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (1, 0))
+        self.assertEqual(self._rows(), [1, 2, 5, 7])
+
+    def test_resume_skips_blank_lines_and_quoted_line_breaks(self):
+        gz_path = self.tmp / 'orders.csv.gz'
+        with gzip.open(gz_path, 'wt', encoding='utf-8') as f:
+            f.write('id,amount,name\n1,2.5,a\n\n2,3.5,"b\nb"\n  \n3,4.5,c\nx,4,d\n5,6,e\n')
+        checkpoints = str(self.tmp / 'checkpoints')
+        processor = FileProcessor(self.connector, dict(self.config, checkpoint_folder=checkpoints))
+        split_valid_rows = processor.split_valid_rows
+
+        def fail_on_second_chunk(chunk, schema):
+            if chunk['id'].iloc[0] == '3':
+                raise RuntimeError("worker died")
+            return split_valid_rows(chunk, schema)
+
+        processor.split_valid_rows = fail_on_second_chunk
+        with self.assertRaises(RuntimeError):
+            processor.process_csv_file(gz_path)
+        self.assertEqual(self._rows(), [1, 2])
+
+        processor = FileProcessor(self.connector, dict(self.config, checkpoint_folder=checkpoints))
+        self.assertEqual(processor.process_csv_file(gz_path), (4, 1))
+        self.assertEqual(self._rows(), [1, 2, 3, 5])
+        names = self.connector.execute_query("SELECT name FROM [EXPORT_orders] ORDER BY id")['name'].tolist()
+        self.assertEqual(names, ['a', 'b\nb', 'c', 'e'])
+
+    def test_same_size_redelivery_is_reimported(self):
+        checkpoints = str(self.tmp / 'checkpoints')
+        self.csv_path.write_text("id,amount,name\n7,1.5,g\n", encoding='utf-8')
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (1, 0))
+        mtime = self.csv_path.stat().st_mtime_ns
+
+        # Touched but unchanged content is still skipped
+        os.utime(self.csv_path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (0, 0))
+
+        self.csv_path.write_text("id,amount,name\n8,2.5,h\n", encoding='utf-8')
+        os.utime(self.csv_path, ns=(mtime + 2 * 10 ** 9, mtime + 2 * 10 ** 9))
+        self.assertEqual(self._import(checkpoint_folder=checkpoints), (1, 0))
+        self.assertEqual(self._rows(), [7, 8])
+
+    def test_content_fingerprint_covers_whole_file(self):
+        data = bytearray(b'a' * (4 * 1024 * 1024))
+        first, second = self.tmp / 'first.csv', self.tmp / 'second.csv'
+        first.write_bytes(bytes(data))
+        data[int(1.3 * 1024 * 1024)] = ord('b')
+        second.write_bytes(bytes(data))
+        self.assertNotEqual(content_fingerprint(first), content_fingerprint(second))
+
+    def test_move_processed(self):
+        self._import(move_processed=True)
+        self.assertFalse(self.csv_path.exists())
+        self.assertEqual(len(list((self.tmp / 'processed').glob('orders_*.csv'))), 1)
+
+    def test_schema_cache_hit_skips_inference_and_table_lookup(self):
+        cache_path = str(self.tmp / 'schema_cache.json')
+        self.assertEqual(self._import(schema_cache=cache_path), (3, 2))
+
+        processor = FileProcessor(self.connector, dict(self.config, schema_cache=cache_path))
+        processor.infer_schema = MagicMock(side_effect=AssertionError("inference should be skipped"))
+        processor._ensure_table = MagicMock()
+        self.assertEqual(processor.process_csv_file(self.csv_path), (3, 2))
+        processor._ensure_table.assert_not_called()
+        self.assertEqual(self._rows(), [1, 1, 2, 2, 5, 5])
+
+    def test_schema_cache_invalidated_when_sample_contradicts_it(self):
+        cache_path = self.tmp / 'schema_cache.json'
+        self._import(schema_cache=str(cache_path))
+        self.csv_path.write_text("id,amount,name\nA1,x,a\nB2,y,b\n", encoding='utf-8')
+        self.connector.drop_table('EXPORT_orders')
+
+        self.assertEqual(self._import(schema_cache=str(cache_path)), (2, 0))
+        cached = next(iter(json.loads(cache_path.read_text(encoding='utf-8')).values()))
+        self.assertEqual(cached['schema']['id'], 'VARCHAR(12)')
+
+
+class TestFileProcessorExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.mock_connector = MagicMock()
+        self.processor = FileProcessor(self.mock_connector, {'batch_size': 1000})
+
+    def _batches(self, *batches):
+        return iter([QueryBatch(['id', 'name'], [int, str], rows) for rows in batches])
+
+    def test_export_streams_batches_to_csv(self):
+        self.mock_connector.stream_query.return_value = self._batches([(1, 'a'), (2, None)], [(3, 'c')])
+
+        rows = self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name, 'batch_size': 2})
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(self.mock_connector.stream_query.call_args.kwargs['batch_size'], 2)
+        [export_file] = Path(self.tmp.name).glob('EXPORT_test_*.csv')
+        with open(export_file, newline='', encoding='utf-8') as f:
+            content = list(csv.reader(f))
+        self.assertEqual(content, [['id', 'name'], ['1', 'a'], ['2', ''], ['3', 'c']])
+
+    def test_export_gzip(self):
+        self.mock_connector.stream_query.return_value = self._batches([(1, 'a')])
+
+        self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name, 'compression': 'gzip'})
+
+        [export_file] = Path(self.tmp.name).glob('EXPORT_test_*.csv.gz')
+        with gzip.open(export_file, 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), ['id,name', '1,a'])
+
+    def test_export_parquet_keeps_types_in_row_groups(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        columns, types = ['id', 'amount', 'created'], [int, Decimal, datetime]
+        precisions = [(10, 0), (12, 3), (23, 3)]
+        batches = [
+            QueryBatch(columns, types, [(1, Decimal('1.5'), datetime(2024, 1, 1, 10)), (2, None, None)], precisions),
+            QueryBatch(columns, types, [(3, Decimal('2.125'), datetime(2024, 1, 2))], precisions),
+        ]
+        self.mock_connector.stream_query.return_value = iter(batches)
+
+        rows = self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name, 'format': 'parquet',
+                                                           'columnar_compression': 'snappy'})
+
+        self.assertEqual(rows, 3)
+        [export_file] = Path(self.tmp.name).glob('EXPORT_test_*.parquet')
+        parquet_file = pq.ParquetFile(export_file)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+        # Scale comes from the column, not the first value, so later batches still fit
+        self.assertEqual(str(parquet_file.schema_arrow.field('amount').type), 'decimal128(12, 3)')
+        self.assertEqual(parquet_file.read().column('amount').to_pylist(), [Decimal('1.500'), None, Decimal('2.125')])
+        self.assertEqual(parquet_file.read().column('created').to_pylist(),
+                         [datetime(2024, 1, 1, 10), None, datetime(2024, 1, 2)])
+
+    def test_export_arrow(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        self.mock_connector.stream_query.return_value = self._batches([(1, 'a'), (2, None)], [(3, 'c')])
+
+        self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name, 'format': 'arrow'})
+
+        [export_file] = Path(self.tmp.name).glob('EXPORT_test_*.arrow')
+        with pa.ipc.open_file(export_file) as reader:
+            self.assertEqual(reader.num_record_batches, 2)
+            self.assertEqual(reader.read_all().to_pydict(), {'id': [1, 2, 3], 'name': ['a', None, 'c']})
+
+    def test_export_rejects_unknown_columnar_codec(self):
+        self.mock_connector.stream_query.return_value = self._batches([(1, 'a')])
+
+        with self.assertRaises(ConfigurationError):
+            self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name, 'format': 'arrow',
+                                                        'columnar_compression': 'snappy'})
+
+    def test_export_empty_table_writes_nothing(self):
+        self.mock_connector.stream_query.return_value = self._batches()
+
+        rows = self.processor.export_table('EXPORT_test', {'export_folder': self.tmp.name})
+
+        self.assertEqual(rows, 0)
+        self.assertEqual(list(Path(self.tmp.name).iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
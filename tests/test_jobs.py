@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from common.exceptions import ConflictError, ResourceNotFoundError
+from importModule.fileProcess.checkpoint import ImportCheckpoint
+from importModule.fileProcess.jobs import JobRegistry, estimate_rows
+
+
+class TestJobRegistry(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.input = self.tmp / 'input'
+        self.input.mkdir()
+        self.file = self.input / 'orders.csv'
+        self.file.write_text('id,name\n' + ''.join(f'{i},n{i}\n' for i in range(10)))
+        self.registry = JobRegistry()
+
+    def test_estimate_rows(self):
+        self.assertEqual(estimate_rows(self.file), 10)
+        self.assertIsNone(estimate_rows(self.input / 'missing.csv'))
+
+    def test_duplicate_folder_conflicts_until_finished(self):
+        job = self.registry.create(str(self.input), [self.file])
+        with self.assertRaises(ConflictError) as ctx:
+            self.registry.create(str(self.input) + '/.', [self.file])
+        self.assertIn(job.id, str(ctx.exception))
+        self.registry.start(job.id)
+        self.registry.finish(job.id)
+        self.assertNotEqual(self.registry.create(str(self.input), [self.file]).id, job.id)
+
+    def test_status_reports_checkpoint_progress(self):
+        checkpoints = self.tmp / 'checkpoints'
+        job = self.registry.create(str(self.input), [self.file])
+        self.registry.start(job.id)
+        ImportCheckpoint(str(checkpoints), self.file).save(status='in_progress', rows_read=4)
+
+        status = self.registry.status(job.id, str(checkpoints))
+        self.assertEqual(status['state'], 'running')
+        self.assertEqual(status['files'][0]['rows_done'], 4)
+        self.assertEqual(status['files'][0]['percent'], 40.0)
+
+        self.registry.file_done(job.id, 'orders.csv', success=9, errors=1)
+        self.registry.finish(job.id)
+        status = self.registry.status(job.id, str(checkpoints))
+        self.assertEqual(status['state'], 'completed')
+        self.assertEqual(status['files_done'], 1)
+        self.assertEqual(status['files'][0]['percent'], 100.0)
+
+    def test_status_sums_partition_progress(self):
+        checkpoints = str(self.tmp / 'checkpoints')
+        job = self.registry.create(str(self.input), [self.file])
+        self.registry.start(job.id)
+        ImportCheckpoint(checkpoints, self.file).save(status='in_progress', rows_read=0,
+                                                      partitions=[[0, 40], [40, 80], [80, 118]])
+        ImportCheckpoint(checkpoints, self.file, 0).save(status='completed', rows_read=4)
+        ImportCheckpoint(checkpoints, self.file, 2).save(status='in_progress', rows_read=2)
+
+        status = self.registry.status(job.id, checkpoints)
+        self.assertEqual(status['files'][0]['rows_done'], 6)
+        self.assertEqual(status['files'][0]['percent'], 60.0)
+
+    def test_unknown_job(self):
+        with self.assertRaises(ResourceNotFoundError):
+            self.registry.status('nope')
+
+
+if __name__ == '__main__':
+    unittest.main()
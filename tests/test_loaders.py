@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from tests.sqlite_connector import SQLiteConnector
+from importModule.fileProcess.loaders import ExecuteManyLoader, StagingTableLoader, create_loader
+from common.exceptions import ConfigurationError
+
+
+class TestExecuteManyLoader(unittest.TestCase):
+    def setUp(self):
+        self.mock_connector = MagicMock()
+        self.mock_conn = self.mock_connector.get_connection.return_value
+        self.mock_cursor = self.mock_conn.cursor.return_value
+
+    def test_single_connection_and_commit_per_batch(self):
+        with ExecuteManyLoader(self.mock_connector, 'T', ['a', 'b']) as loader:
+            loader.load([[1, 2]])
+            loader.load([[3, 4], [5, 6]])
+
+        self.mock_connector.get_connection.assert_called_once()
+        self.assertTrue(self.mock_cursor.fast_executemany)
+        self.assertEqual(self.mock_conn.commit.call_count, 2)
+        self.assertEqual(loader.committed_rows, 3)
+        self.mock_conn.close.assert_called_once()
+        self.assertEqual(self.mock_cursor.executemany.call_args[0][0], "INSERT INTO [T] ([a], [b]) VALUES (?, ?)")
+
+    def test_commit_every_n_batches(self):
+        with ExecuteManyLoader(self.mock_connector, 'T', ['a'], commit_every=2) as loader:
+            for i in range(5):
+                loader.load([[i]])
+
+        # Two full groups plus the remainder committed on close
+        self.assertEqual(self.mock_conn.commit.call_count, 3)
+        self.assertEqual(loader.committed_rows, 5)
+
+    def test_failed_batch_rolls_back_to_savepoint_only(self):
+        self.mock_cursor.executemany.side_effect = [None, fake_pyodbc.Error("bad"), None]
+
+        with ExecuteManyLoader(self.mock_connector, 'T', ['a'], commit_every=0) as loader:
+            self.assertEqual(loader.load([[1]]), [])
+            self.assertEqual(loader.load([[2]], positions=[7]), [(7, [2])])
+            self.assertEqual(loader.load([[3]]), [])
+
+        self.mock_connector.rollback_to_savepoint.assert_called_once_with(self.mock_cursor, 'etl_batch')
+        self.mock_conn.rollback.assert_not_called()
+        self.mock_conn.commit.assert_called_once()
+        self.assertEqual(loader.committed_rows, 2)
+        self.assertEqual(loader.failed_batches[0]['batch'], 2)
+
+    def test_lost_transaction_counts_pending_rows(self):
+        self.mock_cursor.executemany.side_effect = [None, fake_pyodbc.Error("bad")]
+        self.mock_connector.rollback_to_savepoint.side_effect = fake_pyodbc.Error("no transaction")
+
+        with ExecuteManyLoader(self.mock_connector, 'T', ['a'], commit_every=0) as loader:
+            loader.load([[1], [2]])
+            loader.load([[3]])
+
+        self.mock_conn.rollback.assert_called_once()
+        self.assertEqual(loader.lost_rows, 2)
+        self.assertEqual(loader.committed_rows, 0)
+
+
+class TestStagingTableLoader(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.connector = SQLiteConnector(os.path.join(tmp.name, 'test.db'))
+        self.connector.create_table_from_schema('EXPORT_t', {'id': 'INT', 'name': 'VARCHAR(10)'})
+
+    def _count(self, table):
+        return int(self.connector.execute_query(f"SELECT COUNT(*) AS n FROM [{table}]").iloc[0]['n'])
+
+    def test_rows_reach_target_only_on_close(self):
+        loader = create_loader('bulk', self.connector, 'EXPORT_t', ['id', 'name'])
+        self.assertIsInstance(loader, StagingTableLoader)
+        with loader:
+            loader.load([[1, 'a'], [2, 'b']])
+            loader.load([[3, None]])
+            self.assertEqual(self._count('EXPORT_t'), 0)
+
+        self.assertEqual(self._count('EXPORT_t'), 3)
+        self.assertEqual(loader.committed_rows, 3)
+        self.assertFalse(self.connector.table_exists(loader.staging_table))
+        self.assertFalse(os.path.exists(loader.data_path))
+        row = self.connector.execute_query("SELECT name FROM [EXPORT_t] WHERE id = 3")
+        self.assertIsNone(row.iloc[0]['name'])
+
+    def test_one_bulk_copy_per_file(self):
+        connector = MagicMock()
+        with StagingTableLoader(connector, 'EXPORT_t', ['id', 'name']) as loader:
+            for i in range(5):
+                loader.load([[i, 'a'], [i, 'b']])
+
+        connector.bulk_copy.assert_called_once()
+        self.assertEqual(loader.committed_rows, 10)
+
+    def test_rows_with_terminators_are_returned(self):
+        with StagingTableLoader(self.connector, 'EXPORT_t', ['id', 'name']) as loader:
+            failed = loader.load([[1, 'a'], [2, 'b\x1ec']])
+
+        self.assertEqual(failed, [(1, [2, 'b\x1ec'])])
+        self.assertEqual(self._count('EXPORT_t'), 1)
+        self.assertEqual(loader.failed_batches[0]['rows'], 1)
+
+    def test_staging_table_names_are_unique(self):
+        first = StagingTableLoader(self.connector, 'EXPORT_t', ['id'])
+        second = StagingTableLoader(self.connector, 'EXPORT_t', ['id'])
+        self.assertNotEqual(first.staging_table, second.staging_table)
+
+    def test_abort_discards_staged_rows(self):
+        with self.assertRaises(RuntimeError):
+            with StagingTableLoader(self.connector, 'EXPORT_t', ['id', 'name']) as loader:
+                loader.load([[1, 'a']])
+                raise RuntimeError("stop")
+
+        self.assertEqual(self._count('EXPORT_t'), 0)
+        self.assertEqual(loader.lost_rows, 1)
+        self.assertFalse(self.connector.table_exists(loader.staging_table))
+
+    def test_unknown_load_mode(self):
+        with self.assertRaises(ConfigurationError):
+            create_loader('bogus', self.connector, 'EXPORT_t', ['id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import unittest
+from pathlib import Path
+
+from importModule.fileProcess import log_reader
+from importModule.fileProcess.log_reader import file_id, read_from, tail_lines
+from importModule.fileProcess.log_setup import start_logging, stop_logging, worker_pool_kwargs
+
+
+class TestLogReader(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log = Path(tmp.name) / 'etl.log'
+        self.log.write_text(''.join(f'line {i}\n' for i in range(1000)))
+
+    def test_tail_reads_only_last_lines(self):
+        original = log_reader.TAIL_BLOCK_BYTES
+        log_reader.TAIL_BLOCK_BYTES = 16
+        self.addCleanup(setattr, log_reader, 'TAIL_BLOCK_BYTES', original)
+        result = tail_lines(str(self.log), 3)
+        self.assertEqual(result['logs'], 'line 997\nline 998\nline 999\n')
+        self.assertEqual(result['cursor'], self.log.stat().st_size)
+
+    def test_tail_holds_back_partial_line(self):
+        with open(self.log, 'a') as f:
+            f.write('half')
+        result = tail_lines(str(self.log), 1)
+        self.assertEqual(result['logs'], 'line 999\n')
+        self.assertEqual(result['cursor'], self.log.stat().st_size - 4)
+
+    def test_read_from_cursor_returns_whole_lines(self):
+        start = tail_lines(str(self.log), 0)
+        with open(self.log, 'a') as f:
+            f.write('new 1\nnew 2\nnew 3\n')
+        result = read_from(str(self.log), start['cursor'], 10, start['file_id'])
+        self.assertEqual(result['logs'], 'new 1\n')
+        result = read_from(str(self.log), result['cursor'], 1000, result['file_id'])
+        self.assertEqual(result['logs'], 'new 2\nnew 3\n')
+        self.assertFalse(result['rotated'])
+
+    def test_read_from_follows_rotation(self):
+        start = tail_lines(str(self.log), 0)
+        with open(self.log, 'a') as f:
+            f.write('before rotate\n')
+        os.replace(self.log, f"{self.log}.1")
+        self.log.write_text('after rotate\n')
+        result = read_from(str(self.log), start['cursor'], 1000, start['file_id'])
+        self.assertEqual(result['logs'], 'before rotate\nafter rotate\n')
+        self.assertTrue(result['rotated'])
+        self.assertEqual(result['file_id'], file_id(str(self.log)))
+        self.assertEqual(result['cursor'], self.log.stat().st_size)
+
+    def test_read_from_after_truncation_restarts(self):
+        self.log.write_text('fresh\n')
+        result = read_from(str(self.log), 10 ** 6, 1000)
+        self.assertEqual(result['logs'], 'fresh\n')
+        self.assertTrue(result['rotated'])
+
+
+def _log_from_worker(message):
+    logging.getLogger('worker').info(message)
+    return os.getpid()
+
+
+class TestLogSetup(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        root = logging.getLogger()
+        saved = root.handlers[:], root.level
+        self.addCleanup(lambda: (setattr(root, 'handlers', saved[0]), root.setLevel(saved[1])))
+
+    def test_worker_records_are_written_by_the_parent(self):
+        start_logging()
+        try:
+            with ProcessPoolExecutor(max_workers=1, **worker_pool_kwargs()) as pool:
+                worker_pid = pool.submit(_log_from_worker, 'hello from worker').result()
+            logging.getLogger('parent').info('hello from parent')
+        finally:
+            stop_logging()
+        self.assertNotEqual(worker_pid, os.getpid())
+        text = Path(log_reader.LOG_FILE).read_text()
+        self.assertIn('hello from worker', text)
+        self.assertIn('hello from parent', text)
+
+    def test_no_pool_arguments_without_listener(self):
+        self.assertEqual(worker_pool_kwargs(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
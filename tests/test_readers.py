@@ -0,0 +1,73 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from importModule.fileProcess.readers import split_input_name, is_input_file, resolve_delimiter, arrow_type_to_sql
+
+
+class TestReaders(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_split_input_name(self):
+        self.assertEqual(split_input_name(Path('orders.csv')), ('orders', '.csv', None))
+        self.assertEqual(split_input_name(Path('orders_2026.csv.gz')), ('orders_2026', '.csv', 'gzip'))
+        self.assertEqual(split_input_name(Path('feed.v2.PSV.zst')), ('feed.v2', '.psv', 'zstd'))
+        self.assertEqual(split_input_name(Path('items.parquet')), ('items', '.parquet', None))
+        self.assertEqual(split_input_name(Path('notes.md')), ('notes.md', '', None))
+
+    def test_is_input_file(self):
+        for name in ['a.csv', 'b.tsv.bz2', 'c.parquet', 'd.json', 'e.csv.part', 'f.txt']:
+            (self.tmp / name).write_bytes(b'x')
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir() if is_input_file(p)),
+                         ['a.csv', 'b.tsv.bz2', 'c.parquet'])
+        self.assertTrue(is_input_file(self.tmp / 'f.txt', txt_files=True))
+
+    def test_sniffed_delimiter_wins_over_extension(self):
+        path = self.tmp / 'feed.csv.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write("id|name|amount\n1|a|2.5\n2|b|3.5\n")
+        self.assertEqual(resolve_delimiter(path), '|')
+        self.assertEqual(resolve_delimiter(path, delimiter=';'), ';')
+
+        piped_tsv = self.tmp / 'feed.tsv'
+        piped_tsv.write_text("id|name|amount\n1|a|2.5\n2|b|3.5\n", encoding='utf-8')
+        self.assertEqual(resolve_delimiter(piped_tsv), '|')
+
+        commas = self.tmp / 'notes.csv'
+        commas.write_text("id,note\n1,a|b\n2,c|d\n", encoding='utf-8')
+        self.assertEqual(resolve_delimiter(commas), ',')
+
+        single_column = self.tmp / 'ids.tsv'
+        single_column.write_text("id\n1\n2\n", encoding='utf-8')
+        self.assertEqual(resolve_delimiter(single_column), '\t')
+
+    def test_txt_delimiter_is_sniffed(self):
+        piped = self.tmp / 'feed.txt'
+        piped.write_text("id|name|amount\n1|a|2.5\n2|b|3.5\n", encoding='utf-8')
+        self.assertEqual(resolve_delimiter(piped), '|')
+
+        single_column = self.tmp / 'ids.txt'
+        single_column.write_text("id\n1\n2\n", encoding='utf-8')
+        self.assertEqual(resolve_delimiter(single_column), ',')
+
+    def test_arrow_type_to_sql(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        self.assertEqual(arrow_type_to_sql(pa.int32()), 'INT')
+        self.assertEqual(arrow_type_to_sql(pa.int64()), 'BIGINT')
+        self.assertEqual(arrow_type_to_sql(pa.decimal128(10, 2)), 'DECIMAL(10, 2)')
+        self.assertEqual(arrow_type_to_sql(pa.timestamp('ms')), 'DATETIME')
+        self.assertEqual(arrow_type_to_sql(pa.string(), 100), 'VARCHAR(100)')
+
+
+if __name__ == '__main__':
+    unittest.main()
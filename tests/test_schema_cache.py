@@ -0,0 +1,44 @@
+import multiprocessing
+import tempfile
+import unittest
+from pathlib import Path
+
+from importModule.fileProcess.schema_cache import SchemaCache
+
+
+def _put_keys(cache_path, prefix, count):
+    cache = SchemaCache(cache_path)
+    for i in range(count):
+        cache.put(f"{prefix}{i}", f"EXPORT_{prefix}{i}", {'id': 'INT'})
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = str(Path(tmp.name) / 'schema_cache.json')
+
+    def test_put_get_invalidate(self):
+        cache = SchemaCache(self.path)
+        cache.put('key', 'EXPORT_t', {'id': 'INT'})
+        self.assertEqual(cache.get('key'), {'id': 'INT'})
+
+        cache.invalidate('key')
+        self.assertIsNone(SchemaCache(self.path).get('key'))
+
+    def test_concurrent_processes_keep_every_entry(self):
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_put_keys, args=(self.path, prefix, 20)) for prefix in 'abcd']
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            self.assertEqual(worker.exitcode, 0)
+
+        cache = SchemaCache(self.path)
+        missing = [f"{prefix}{i}" for prefix in 'abcd' for i in range(20) if cache.get(f"{prefix}{i}") is None]
+        self.assertEqual(missing, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
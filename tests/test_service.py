@@ -1,9 +1,14 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from tests import fake_pyodbc
+fake_pyodbc.install()
+
+from database.db_connector import DBConnector
 from service.order_service import OrderService
 from models.user import UserDTO
 from models.product import ProductDTO
-from common.exceptions import ValidationError
+from common.exceptions import DatabaseError, ValidationError
+from tests.sqlite_connector import SQLiteConnector
 
 class TestOrderService(unittest.TestCase):
     def setUp(self):
@@ -29,7 +34,9 @@ class TestOrderService(unittest.TestCase):
         
         self.assertEqual(order_id, 500)
         self.service.user_dao.create.assert_called_once()
-        self.service.item_dao.create.assert_called_once()
+        self.service.item_dao.create_many.assert_called_once_with(500, products, quantities)
+        self.service.item_dao.create.assert_not_called()
+        self.mock_connector.transaction.assert_called_once()
 
     def test_create_order_invalid_email(self):
         user = UserDTO(0, "Test", "invalid", None)
@@ -52,5 +59,107 @@ class TestOrderService(unittest.TestCase):
             self.service.create_order_process(user, "PENDING", products, quantities)
         self.assertIn("greater than zero", str(cm.exception))
 
+class TestOrderServiceSQLServerDialect(unittest.TestCase):
+    """create_order_process through the real DBConnector, checking the SQL Server statements it sends"""
+
+    USER_INSERT = "INSERT INTO users (name, email, registered_at) VALUES (?, ?, ?); SELECT SCOPE_IDENTITY() AS id;"
+    ORDER_INSERT = "INSERT INTO orders (user_id, order_date, status, paid) VALUES (?, ?, ?, ?); SELECT SCOPE_IDENTITY() AS id;"
+
+    def setUp(self):
+        fake_pyodbc.reset()
+        self.addCleanup(fake_pyodbc.reset)
+        config = MagicMock()
+        config.get_database_config.return_value = {
+            'driver': 'SQL Driver', 'server': 'localhost', 'database': 'test_db',
+            'username': 'user', 'password': 'password', 'trusted_connection': 'yes', 'encrypt': 'no'
+        }
+        config.get_pool_config.return_value = {
+            'min_size': 1, 'max_size': 5, 'timeout': 1.0, 'idle_timeout': 300.0, 'pre_ping': False
+        }
+        patcher = patch('database.db_connector.pyodbc.connect', fake_pyodbc.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connector = DBConnector(config)
+        self.addCleanup(self.connector.close)
+        fake_pyodbc.results["SELECT id, name, email, registered_at FROM users WHERE email = ?"] = (
+            ['id', 'name', 'email', 'registered_at'], [])
+        fake_pyodbc.results[self.USER_INSERT] = (['id'], [(101,)])
+        fake_pyodbc.results[self.ORDER_INSERT] = (['id'], [(500,)])
+
+    def test_order_statements_share_one_transaction(self):
+        products = [ProductDTO(1, "Pen", 2.0, 1, True), ProductDTO(2, "Ink", 5.0, 1, True)]
+        user = UserDTO(0, "Test", "test@example.com", None)
+
+        order_id = OrderService(self.connector).create_order_process(user, "new", products, [3, 1])
+
+        self.assertEqual(order_id, 500)
+        used = [conn for conn in fake_pyodbc.connections if conn.executed]
+        self.assertEqual(len(used), 1)
+        self.assertEqual(used[0].commits, 1)
+        queries = [query for query, _ in used[0].executed]
+        self.assertEqual(queries[1:3], [self.USER_INSERT, self.ORDER_INSERT])
+        self.assertEqual(queries[3], "INSERT INTO order_items (order_id, product_id, quantity, price_at_order) "
+                                     "VALUES (?, ?, ?, ?), (?, ?, ?, ?)")
+        self.assertEqual(used[0].executed[3][1], ((500, 1, 3, 2.0, 500, 2, 1, 5.0),))
+
+
+class TestOrderServiceTransaction(unittest.TestCase):
+    """create_order_process against the SQLite stand-in"""
+
+    def setUp(self):
+        self.connector = SQLiteConnector()
+        self.addCleanup(self.connector.close)
+        for ddl in [
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE, registered_at TEXT)",
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INT, order_date TEXT, status TEXT, paid INT)",
+            "CREATE TABLE order_items (order_id INT, product_id INT, quantity INT, price_at_order REAL, "
+            "PRIMARY KEY (order_id, product_id))",
+            "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, category_id INT, active INT)",
+        ]:
+            self.connector.execute_query(ddl)
+        self.service = OrderService(self.connector)
+        self.user = UserDTO(0, "Test", "test@example.com", None)
+
+    def count(self, table):
+        return self.connector.fetch_rows(f"SELECT COUNT(*) FROM {table}")[1][0][0]
+
+    @patch('dao.order_item_dao.ITEM_INSERT_BATCH', 3)
+    def test_items_inserted_in_batches(self):
+        products = [ProductDTO(i, f"P{i}", 1.0 + i, 1, True) for i in range(1, 8)]
+        order_id = self.service.create_order_process(self.user, "new", products, [1] * 7)
+
+        items = self.service.item_dao.get_by_order_id(order_id)
+        self.assertEqual(sorted(item.product_id for item in items), list(range(1, 8)))
+
+    def test_failure_rolls_back_whole_order(self):
+        # The same product twice violates the order_items primary key on the item insert
+        products = [ProductDTO(1, "P", 1.0, 1, True)] * 2
+        with self.assertRaises(DatabaseError):
+            self.service.create_order_process(self.user, "new", products, [1, 1])
+
+        self.assertEqual((self.count('users'), self.count('orders'), self.count('order_items')), (0, 0, 0))
+
+    def test_orders_details_from_one_query(self):
+        products = [ProductDTO(1, "Pen", 2.0, 1, True), ProductDTO(2, "Ink", 5.0, 1, True)]
+        self.connector.execute_query("INSERT INTO products VALUES (1, 'Pen', 2.0, 1, 1)")
+        first = self.service.create_order_process(self.user, "new", products, [3, 1])
+        second = self.service.create_order_process(self.user, "new", products[:1], [1])
+        # An order whose lines were removed still has details
+        self.connector.execute_query("DELETE FROM order_items WHERE order_id = ?", (second,))
+
+        with patch.object(self.connector, 'fetch_rows', wraps=self.connector.fetch_rows) as fetch:
+            details = self.service.get_orders_details([first, second, 999])
+        fetch.assert_called_once()
+
+        self.assertEqual(set(details), {first, second})
+        self.assertEqual(details[first]["user"]["email"], "test@example.com")
+        self.assertEqual(details[first]["items"], [
+            {"product_id": 1, "product_name": "Pen", "quantity": 3, "price": 2.0, "subtotal": 6.0},
+            {"product_id": 2, "product_name": "Unknown", "quantity": 1, "price": 5.0, "subtotal": 5.0},
+        ])
+        self.assertEqual(details[second]["items"], [])
+        self.assertIsNone(self.service.get_order_details(999))
+
+
 if __name__ == '__main__':
     unittest.main()